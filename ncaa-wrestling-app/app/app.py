@@ -29,6 +29,7 @@ from app.modules.teams import teams_server, teams_ui
 from app.modules.live_scores import live_scores_server, live_scores_ui
 from app.modules.brackets import brackets_server, brackets_ui
 from app.modules.how_it_works import how_it_works_server, how_it_works_ui
+from app.modules.game_detail import game_detail_server
 
 app_ui = ui.page_navbar(
     # Dashboard
@@ -76,6 +77,8 @@ app_ui = ui.page_navbar(
     header=ui.head_content(
         ui.tags.meta(name="viewport", content="width=device-width, initial-scale=1"),
         ui.include_css(Path(__file__).parent / "styles.css"),
+        ui.include_js(Path(__file__).parent / "score_cards.js"),
+        ui.include_js(Path(__file__).parent / "game_detail.js"),
     ),
     footer=ui.div(
         "NCAA D1 Wrestling Tracker | Data from NCAA.com via ncaa-api",
@@ -93,6 +96,7 @@ def server(input, output, session):
     live_scores_server("live_scores")
     brackets_server("brackets")
     how_it_works_server("how_it_works")
+    game_detail_server("game_detail")  # modal opened from score cards / schedule rows
 
 
 app = App(app_ui, server)
@@ -0,0 +1,175 @@
+"""Vectorized HTML/text formatting for table columns and score cards.
+
+The per-row helpers (``rank_badge_html``, ``movement_indicator``) are
+convenient for one value, but mapping them over a frame with
+``apply(axis=1)`` / ``iterrows()`` costs a Python call per row. These
+functions build the same display columns with whole-column string operations
+so a full-division schedule (thousands of rows) renders in milliseconds.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+_STATUS_BY_STATE = {"final": "Final", "live": "Live", "pre": "Upcoming", "": "Upcoming"}
+_CARD_CLASS_BY_STATUS = {"Live": "live", "Final": "final"}
+
+
+def escape_html(values: pd.Series) -> pd.Series:
+    """HTML-escape a column of strings (``None``/NaN become empty strings)."""
+    return (
+        values.astype("string").fillna("")
+        .str.replace("&", "&amp;", regex=False)
+        .str.replace("<", "&lt;", regex=False)
+        .str.replace(">", "&gt;", regex=False)
+        .str.replace('"', "&quot;", regex=False)
+    )
+
+
+def int_text(values: pd.Series) -> pd.Series:
+    """Render numeric values as integer strings; missing values become ``""``."""
+    nums = pd.to_numeric(values, errors="coerce")
+    text = nums.round().astype("Int64").astype(str)
+    return text.where(nums.notna(), "")
+
+
+def rank_prefix(ranks: pd.Series) -> pd.Series:
+    """``"#3 "`` for ranked teams, ``""`` for unranked (missing or 0) ones."""
+    nums = pd.to_numeric(ranks, errors="coerce")
+    return ("#" + int_text(nums) + " ").where(nums.fillna(0) != 0, "")
+
+
+def rank_badges(ranks: pd.Series) -> pd.Series:
+    """Vectorized ``rank_badge_html``."""
+    nums = pd.to_numeric(ranks, errors="coerce")
+    cls = np.select(
+        [nums <= 5, nums <= 10],
+        ["rank-badge top-5", "rank-badge top-10"],
+        default="rank-badge top-25",
+    )
+    html = '<span class="' + pd.Series(cls, index=ranks.index) + '">' + int_text(nums) + "</span>"
+    return html.where(nums.notna(), "")
+
+
+def movement_indicators(movement: pd.Series) -> pd.Series:
+    """Vectorized ``movement_indicator``."""
+    nums = pd.to_numeric(movement, errors="coerce").fillna(0)
+    magnitude = int_text(nums.abs())
+    up = '<span class="movement-up">&#9650; ' + magnitude + "</span>"
+    down = '<span class="movement-down">&#9660; ' + magnitude + "</span>"
+    same = '<span class="movement-same">&#8212;</span>'
+    return pd.Series(
+        np.select([nums > 0, nums < 0], [up, down], default=same), index=movement.index,
+    )
+
+
+def matchup_column(df: pd.DataFrame, separator: str = " @ ") -> pd.Series:
+    """``"#1 Iowa @ #2 Penn St."`` for each row of a schedule/scores frame."""
+    return (
+        rank_prefix(df["away_rank"]) + df["away_team"].astype("string").fillna("")
+        + separator
+        + rank_prefix(df["home_rank"]) + df["home_team"].astype("string").fillna("")
+    )
+
+
+def score_column(df: pd.DataFrame, separator: str = "-", mask: pd.Series | None = None) -> pd.Series:
+    """``"12-24"`` where both scores are present (and ``mask`` is true), else ``""``."""
+    away = pd.to_numeric(df["away_score"], errors="coerce")
+    home = pd.to_numeric(df["home_score"], errors="coerce")
+    show = away.notna() & home.notna()
+    if mask is not None:
+        show &= mask
+    return (int_text(away) + separator + int_text(home)).where(show, "")
+
+
+def win_probability_column(
+    df: pd.DataFrame,
+    ratings: pd.DataFrame,
+    params: dict[str, float],
+    mask: pd.Series | None = None,
+) -> pd.Series:
+    """``"Iowa 72%"`` — the Elo favourite and its win probability — for each row of a schedule frame.
+
+    ``params`` are the ``initial_rating`` (for teams without a rating) and
+    ``home_advantage`` the ratings were computed with. Rows outside ``mask``
+    (and all rows when ``ratings`` or either parameter is missing) get ``""``.
+    """
+    if ratings.empty or df.empty or not {"initial_rating", "home_advantage"} <= params.keys():
+        return pd.Series("", index=df.index, dtype=object)
+    by_team = pd.Series(ratings["rating"].to_numpy(), index=ratings["team"].astype(str))
+    by_team = by_team[~by_team.index.duplicated()]
+    away = df["away_team"].astype(str).map(by_team).fillna(params["initial_rating"]).astype(float)
+    home = df["home_team"].astype(str).map(by_team).fillna(params["initial_rating"]).astype(float)
+    p_home = 1.0 / (1.0 + 10 ** ((away - home - params["home_advantage"]) / 400.0))
+    home_fav = p_home >= 0.5
+    team = df["home_team"].where(home_fav, df["away_team"]).astype("string").fillna("")
+    pct = (p_home.where(home_fav, 1 - p_home) * 100).round().astype(int).astype(str)
+    text = escape_html(team) + " " + pct + "%"
+    if mask is not None:
+        text = text.where(mask, "")
+    return text
+
+
+def game_detail_links(labels: pd.Series, game_ids: pd.Series) -> pd.Series:
+    """Wrap each (HTML) label in a link that opens its game's detail; rows without a ``game_id`` stay plain."""
+    ids = escape_html(game_ids)
+    links = '<a href="#" class="game-detail-link" data-game-id="' + ids + '">' + labels + "</a>"
+    return links.where(ids != "", labels)
+
+
+def display_status(game_states: pd.Series) -> pd.Series:
+    """Vectorized ``classify_game_state``."""
+    states = game_states.astype("string").fillna("").str.lower().str.strip()
+    mapped = states.map(_STATUS_BY_STATE)
+    return mapped.fillna(states.str.title())
+
+
+def score_cards_html(df: pd.DataFrame) -> pd.Series:
+    """Render one score card per row as HTML, indexed like ``df``.
+
+    Cards are patched in place by key (see ``score_card.diff_score_cards``);
+    the card's ``data-key`` and ``data-game-id`` (opens the game detail) are
+    the row's ``game_id``.
+    """
+    if df.empty:
+        return pd.Series(dtype=str)
+
+    def col(name: str) -> pd.Series:
+        return df[name] if name in df.columns else pd.Series("", index=df.index)
+
+    status = display_status(col("game_state"))
+    card_class = status.map(_CARD_CLASS_BY_STATUS).fillna("upcoming")
+    badge = pd.Series(
+        np.select(
+            [status == "Live", status == "Final"],
+            [
+                '<span class="live-badge"><span class="live-dot"></span> LIVE</span>',
+                '<span style="font-weight:700; font-size:0.8rem; color:#1a2744;">FINAL</span>',
+            ],
+            default="",
+        ),
+        index=df.index,
+    )
+    time_badge = (
+        '<span style="font-size:0.85rem; color:#7f8c8d;">' + escape_html(col("start_time")) + "</span>"
+    )
+    badge = badge.where(badge != "", time_badge)
+
+    def team_row(side: str) -> pd.Series:
+        winner = col(f"{side}_winner").fillna(False).astype(bool)
+        suffix = pd.Series(np.where(winner, " winner", ""), index=df.index)
+        rank = rank_prefix(col(f"{side}_rank"))
+        rank_el = ('<span class="team-rank">' + rank + "</span>").where(rank != "", "")
+        return (
+            '<div class="team-row"><div>' + rank_el
+            + '<span class="team-name' + suffix + '">' + escape_html(col(f"{side}_team")) + "</span></div>"
+            + '<span class="team-score' + suffix + '">' + int_text(col(f"{side}_score")) + "</span></div>"
+        )
+
+    return (
+        '<div class="score-card ' + card_class + '" data-key="' + escape_html(col("game_id"))
+        + '" data-game-id="' + escape_html(col("game_id")) + '">'
+        + team_row("away") + team_row("home")
+        + '<div class="game-info">' + badge + "<span>" + escape_html(col("network")) + "</span></div>"
+        + "</div>"
+    )
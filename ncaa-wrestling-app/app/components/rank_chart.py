@@ -0,0 +1,96 @@
+"""Inline SVG rank-trajectory chart.
+
+Drawn as plain SVG so the Rankings page needs no plotting dependency: one
+polyline per team over the poll weeks, rank 1 at the top. Weeks in which a
+team was unranked (or outside the plotted depth) break its line.
+"""
+
+from html import escape
+
+import numpy as np
+from shiny import ui
+
+from app.utils.rank_history import RankSeries
+
+_COLORS = ["#1a2744", "#c5a030", "#e74c3c", "#27ae60", "#2980b9", "#8e44ad", "#d35400", "#16a085"]
+_WIDTH, _HEIGHT = 720, 320
+_LEFT, _RIGHT, _TOP, _BOTTOM = 40, 16, 16, 36
+
+
+def rank_trajectory_chart(series: list[RankSeries], weeks: np.ndarray, max_rank: int = 25) -> ui.Tag:
+    """Chart each team's rank over ``weeks`` (the history's sorted poll weeks)."""
+    if not len(weeks):
+        weeks = np.array([], dtype="datetime64[ms]")
+    plot_w = _WIDTH - _LEFT - _RIGHT
+    plot_h = _HEIGHT - _TOP - _BOTTOM
+    step = plot_w / max(len(weeks) - 1, 1)
+
+    def x(i: int) -> float:
+        return _LEFT + i * step
+
+    def y(rank: int) -> float:
+        return _TOP + (rank - 1) * plot_h / max(max_rank - 1, 1)
+
+    parts = [f'<rect x="{_LEFT}" y="{_TOP}" width="{plot_w}" height="{plot_h}" fill="#f5f6fa"/>']
+    for rank in sorted({1, 5, 10, 15, 20, 25, max_rank}):
+        if rank <= max_rank:
+            parts.append(
+                f'<line x1="{_LEFT}" x2="{_LEFT + plot_w}" y1="{y(rank):.1f}" y2="{y(rank):.1f}" '
+                f'stroke="#e1e4e8"/><text x="{_LEFT - 6}" y="{y(rank) + 4:.1f}" text-anchor="end" '
+                f'font-size="11" fill="#7f8c8d">#{rank}</text>'
+            )
+    label_every = max(len(weeks) // 8, 1)
+    for i in range(0, len(weeks), label_every):
+        label = str(weeks[i].astype("datetime64[D]"))[5:]
+        parts.append(
+            f'<text x="{x(i):.1f}" y="{_HEIGHT - 14}" text-anchor="middle" font-size="11" '
+            f'fill="#7f8c8d">{label}</text>'
+        )
+
+    legend = []
+    for n, team in enumerate(series):
+        color = _COLORS[n % len(_COLORS)]
+        positions = np.searchsorted(weeks, team.weeks)
+        ranked = (team.ranks > 0) & (team.ranks <= max_rank)
+        for segment in _runs(positions, ranked):
+            points = " ".join(f"{x(positions[k]):.1f},{y(team.ranks[k]):.1f}" for k in segment)
+            if len(segment) > 1:
+                parts.append(f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="2.5"/>')
+            for k in segment:
+                parts.append(
+                    f'<circle cx="{x(positions[k]):.1f}" cy="{y(team.ranks[k]):.1f}" r="3.5" fill="{color}">'
+                    f'<title>{escape(team.school)}: #{team.ranks[k]} '
+                    f'(week of {team.weeks[k].astype("datetime64[D]")})</title></circle>'
+                )
+        legend.append(
+            f'<span style="margin-right:1rem;"><span style="display:inline-block; width:12px; '
+            f'height:12px; background:{color}; margin-right:4px;"></span>{escape(team.school)}</span>'
+        )
+
+    svg = (
+        f'<svg viewBox="0 0 {_WIDTH} {_HEIGHT}" width="100%" role="img" '
+        f'aria-label="Rank trajectory">{"".join(parts)}</svg>'
+    )
+    return ui.div(
+        ui.HTML(svg),
+        ui.div(ui.HTML("".join(legend)), style="font-size:0.85rem; margin-top:0.5rem;"),
+        class_="card p-3 mb-3",
+    )
+
+
+def _runs(positions: np.ndarray, ranked: np.ndarray) -> list[list[int]]:
+    """Split a series into runs of consecutive ranked weeks (indices into the series)."""
+    runs, current = [], []
+    for k in range(len(positions)):
+        if not ranked[k]:
+            if current:
+                runs.append(current)
+            current = []
+            continue
+        if current and positions[k] != positions[current[-1]] + 1:
+            runs.append(current)
+            current = []
+        current.append(k)
+    if current:
+        runs.append(current)
+    return runs
@@ -0,0 +1,10 @@
+// Open the game detail modal when a score card or schedule matchup is clicked.
+// Any element with data-game-id works (see score_cards_html and
+// game_detail_links in app/components/formatters.py); the id is sent to the
+// "open" input of the game_detail module (app/modules/game_detail.py).
+document.addEventListener("click", function (event) {
+  var target = event.target.closest("[data-game-id]");
+  if (!target || !target.dataset.gameId || !window.Shiny) return;
+  event.preventDefault();
+  Shiny.setInputValue("game_detail-open", target.dataset.gameId, { priority: "event" });
+});
@@ -1,9 +1,23 @@
-"""Brackets page module — NCAA tournament bracket visualization."""
+"""Brackets page module — NCAA tournament bracket visualization and simulated odds."""
 
+import pandas as pd
 from shiny import module, reactive, render, ui
 
-from app.components.data_table import empty_state
+from app.components.data_table import empty_state, render_dataframe_html
+from app.components.formatters import escape_html
 from app.utils.constants import WEIGHT_CLASSES, WEIGHT_CLASS_LABELS
+from app.utils.data_loader import load_bracket_index, load_bracket_sim_teams, load_bracket_sim_wrestlers
+from app.utils.pin_watcher import watch_pin
+
+
+ROUND_LABELS = {
+    "r32": "Round of 32",
+    "r16": "Round of 16",
+    "qf": "Quarterfinals",
+    "sf": "Semifinals",
+    "finals": "Finals",
+    "cons": "Consolations",
+}
 
 
 @module.ui
@@ -33,15 +47,7 @@ def brackets_ui():
                     ui.input_select(
                         "bracket_round",
                         "Round",
-                        choices={
-                            "all": "All Rounds",
-                            "r32": "Round of 32",
-                            "r16": "Round of 16",
-                            "qf": "Quarterfinals",
-                            "sf": "Semifinals",
-                            "finals": "Finals",
-                            "cons": "Consolations",
-                        },
+                        choices={"all": "All Rounds", **ROUND_LABELS},
                         selected="all",
                     ),
                     ui.input_action_button(
@@ -55,6 +61,7 @@ def brackets_ui():
             ui.column(
                 {"class": "col-12 col-lg-9"},
                 ui.output_ui("bracket_view"),
+                ui.output_ui("tournament_odds"),
             ),
         ),
     )
@@ -62,32 +69,153 @@ def brackets_ui():
 
 @module.server
 def brackets_server(input, output, session):
+    brackets_version = watch_pin("brackets")
 
     @reactive.calc
-    def bracket_data():
+    def bracket_index():
+        brackets_version()
         input.refresh_brackets()
-
-        # In production, this would fetch from OpenTW API or pin cache.
-        # For now, return sample bracket structure.
-        from app.utils.data_loader import load_brackets
-        df = load_brackets()
-        return df
+        return load_bracket_index()
 
     @render.ui
     def bracket_view():
-        df = bracket_data()
-        if df.empty:
+        index = bracket_index()
+        wt = int(input.weight_class())
+        if not index or wt not in index.weights():
             return _bracket_placeholder(input.weight_class())
 
+        label = WEIGHT_CLASS_LABELS.get(wt, f"{wt} lbs")
+        selected = input.bracket_round()
+        rounds = index.rounds(wt) if selected == "all" else [selected]
+        championship = [
+            _round_column(ROUND_LABELS[r], index.round_matches(wt, r))
+            for r in rounds if r != "cons"
+        ]
+        body = []
+        if championship:
+            body.append(ui.div(*championship, class_="bracket-container", style="display:flex;"))
+        if "cons" in rounds:
+            body.append(_consolation_section(index.round_matches(wt, "cons")))
+        return ui.div(
+            ui.div(f"{label} Bracket", class_="card-header"),
+            ui.div(*body, class_="card-body"),
+            class_="card",
+        )
+
+    sim_wrestlers_version = watch_pin("bracket_sim_wrestlers")
+    sim_teams_version = watch_pin("bracket_sim_teams")
+
+    @render.ui
+    def tournament_odds():
+        sim_wrestlers_version()
+        sim_teams_version()
+        wrestlers, teams = load_bracket_sim_wrestlers(), load_bracket_sim_teams()
+        if wrestlers.empty and teams.empty:
+            return ui.TagList()
+
         wt = int(input.weight_class())
         label = WEIGHT_CLASS_LABELS.get(wt, f"{wt} lbs")
+        field = wrestlers[wrestlers["weight_class"] == wt]
+        field = field.sort_values(["p_place_1", "p_all_american"], ascending=False).head(16)
         return ui.div(
-            ui.h4(f"{label} Bracket"),
-            ui.p("Bracket visualization will render during tournament season.",
-                 style="color:#7f8c8d;"),
+            ui.div("Tournament Projections", class_="card-header"),
+            ui.div(
+                ui.h6("Team Title Odds", style="color:#2a3f6a;"),
+                render_dataframe_html(_team_odds_display(teams.head(10))),
+                ui.h6(f"{label} Placement Odds", style="color:#2a3f6a; margin-top:1rem;"),
+                render_dataframe_html(_wrestler_odds_display(field)),
+                ui.p(
+                    "Monte Carlo simulation of the remaining bouts; completed matches are fixed.",
+                    style="color:#7f8c8d; font-size:0.8rem;",
+                ),
+                class_="card-body",
+            ),
+            class_="card mt-3",
         )
 
 
+def _pct(values: pd.Series) -> pd.Series:
+    return (pd.to_numeric(values, errors="coerce").fillna(0) * 100).map("{:.1f}%".format)
+
+
+def _team_odds_display(teams: pd.DataFrame) -> pd.DataFrame:
+    if teams.empty:
+        return teams
+    return pd.DataFrame({
+        "Team": escape_html(teams["team"]),
+        "Title": _pct(teams["p_title"]),
+        "Exp. Pts": teams["expected_points"].round(1),
+        "10th–90th": teams["points_p10"].round(1).astype(str) + "–" + teams["points_p90"].round(1).astype(str),
+    })
+
+
+def _wrestler_odds_display(field: pd.DataFrame) -> pd.DataFrame:
+    if field.empty:
+        return field
+    return pd.DataFrame({
+        "Seed": field["seed"].astype("string").fillna(""),
+        "Wrestler": escape_html(field["name"]),
+        "Team": escape_html(field["team"]),
+        "Champ": _pct(field["p_place_1"]),
+        "Finalist": _pct(field["p_place_1"] + field["p_place_2"]),
+        "AA": _pct(field["p_all_american"]),
+        "Exp. Pts": field["expected_points"].round(1),
+    })
+
+
+def _round_column(title: str, matches: pd.DataFrame) -> ui.Tag:
+    return ui.div(
+        ui.h6(title, style="color:#2a3f6a; text-align:center;"),
+        *[_match_card(m) for m in matches.itertuples(index=False)],
+        class_="bracket-round",
+    )
+
+
+def _consolation_section(matches: pd.DataFrame) -> ui.Tag:
+    """Consolation matches grouped under their round labels, in bout order."""
+    groups: dict[str, list] = {}
+    for m in matches.itertuples(index=False):
+        groups.setdefault(str(m.round), []).append(_match_card(m))
+    return ui.div(
+        ui.h5("Consolation Bracket", style="margin-top:1rem;"),
+        ui.div(
+            *[ui.div(ui.h6(label, style="color:#2a3f6a; text-align:center;"), *cards, class_="bracket-round")
+              for label, cards in groups.items()],
+            class_="bracket-container",
+            style="display:flex;",
+        ),
+    )
+
+
+def _match_card(m) -> ui.Tag:
+    """One match: both slots (winner highlighted) and the bout/result line."""
+    sides = []
+    for slot, (name, team, seed, feeder) in enumerate((
+        (m.top_name, m.top_team, m.top_seed, m.top_from),
+        (m.bottom_name, m.bottom_team, m.bottom_seed, m.bottom_from),
+    )):
+        if name:
+            who = ui.span(
+                ui.span(f"({seed})", class_="seed") if pd.notna(seed) else "",
+                name,
+                ui.span(f" {team}", style="color:#7f8c8d; font-size:0.72rem;"),
+            )
+        else:
+            who = ui.span("TBD" if feeder >= 0 else "Bye", style="color:#7f8c8d;")
+        sides.append(ui.div(who, class_="wrestler winner" if m.winner_slot == slot else "wrestler"))
+
+    detail = f"Bout {m.bout}" if pd.notna(m.bout) and m.bout >= 0 else ""
+    if m.status == "final" and m.result:
+        detail = f"{detail} · {m.result}" if detail else m.result
+    elif m.status == "in progress":
+        detail = f"{detail} · Live" if detail else "Live"
+    return ui.div(
+        *sides,
+        ui.div(detail, style="font-size:0.7rem; color:#7f8c8d; padding:0.2rem 0.6rem;") if detail else "",
+        class_="bracket-match",
+    )
+
+
 def _bracket_placeholder(weight_class: str) -> ui.Tag:
     """Show a placeholder bracket when no data is available."""
     wt = int(weight_class) if weight_class.isdigit() else 125
@@ -1,16 +1,21 @@
-"""Dashboard page module — overview with stats, recent results, and rankings snapshot."""
+"""Dashboard page module — overview with stats, quick search, the championships team race, recent results, and rankings snapshot."""
 
+import pandas as pd
 from shiny import module, reactive, render, ui
 
 from app.components.data_table import empty_state, render_dataframe_html
-from app.components.value_boxes import rank_badge_html, movement_indicator
+from app.components.formatters import escape_html, matchup_column, movement_indicators, rank_badges, score_column
 from app.utils.data_loader import (
+    describe_pins,
     load_live_scores,
     load_rankings,
     load_schedule,
+    load_search_index,
     load_standings,
-    pin_updated_at,
+    load_team_scores,
 )
+from app.utils.pin_watcher import watch_pin
+from app.utils.search_index import normalize_name
 
 
 @module.ui
@@ -21,6 +26,7 @@ def dashboard_ui():
             ui.h2("NCAA D1 Wrestling Tracker", style="margin:0; font-weight:700;"),
             ui.p("Your hub for rankings, scores, schedules, and brackets",
                  style="margin:0; color:#7f8c8d; font-size:0.95rem;"),
+            ui.output_ui("data_freshness"),
             style="margin-bottom:1.5rem;",
         ),
         # Summary value boxes
@@ -30,6 +36,23 @@ def dashboard_ui():
             ui.column(6, ui.output_ui("vb_live_matches"), {"class": "col-lg-3 mb-2"}),
             ui.column(6, ui.output_ui("vb_upcoming"), {"class": "col-lg-3 mb-2"}),
         ),
+        # Quick search across teams and wrestlers
+        ui.row(
+            ui.column(
+                12,
+                ui.div(
+                    ui.div("Quick Search", class_="card-header"),
+                    ui.div(
+                        ui.input_text("quick_search", None, placeholder="Team or wrestler, e.g. Penn State"),
+                        ui.output_ui("search_results"),
+                        class_="card-body",
+                    ),
+                    class_="card mt-2",
+                ),
+            ),
+        ),
+        # NCAA Championships team race (only while the team_scores pin has data)
+        ui.output_ui("team_race"),
         ui.br(),
         # Two-column layout: Rankings + Recent Results
         ui.row(
@@ -77,12 +100,107 @@ def dashboard_ui():
     )
 
 
+_FRESHNESS_PINS = {
+    "rankings": "Rankings",
+    "schedule": "Schedule",
+    "standings": "Standings",
+    "live_scores": "Live scores",
+}
+
+
 @module.server
 def dashboard_server(input, output, session):
+    versions = {name: watch_pin(name) for name in _FRESHNESS_PINS}
+
+    @reactive.calc
+    def rankings():
+        versions["rankings"]()
+        return load_rankings()
+
+    @reactive.calc
+    def schedule():
+        versions["schedule"]()
+        return load_schedule()
+
+    @reactive.calc
+    def standings():
+        versions["standings"]()
+        return load_standings()
+
+    @reactive.calc
+    def live_scores():
+        versions["live_scores"]()
+        return load_live_scores()
+
+    team_scores_version = watch_pin("team_scores")
+
+    @render.ui
+    def team_race():
+        team_scores_version()
+        df = load_team_scores()
+        if df.empty:
+            return ui.TagList()
+        top = df.head(10)
+        display = pd.DataFrame({
+            "#": top["rank"].astype("string").fillna(""),
+            "Team": escape_html(top["team"]),
+            "Points": top["points"].map("{:g}".format),
+            "Bonus": top["bonus_points"].map("{:g}".format),
+            "Max Possible": top["max_possible"].map("{:g}".format),
+            "Alive": top["wrestlers_alive"].astype("string").fillna("0"),
+        })
+        return ui.div(
+            ui.div("NCAA Championships Team Race", class_="card-header"),
+            ui.div(render_dataframe_html(display), class_="card-body", style="padding:0;"),
+            class_="card mt-3",
+        )
+
+    @render.ui
+    def data_freshness():
+        for watch in versions.values():
+            watch()
+        described = describe_pins()
+        parts = [
+            f"{label}: {described[name]['created'] if name in described else 'Never'}"
+            for name, label in _FRESHNESS_PINS.items()
+        ]
+        return ui.p(" · ".join(parts), style="margin:0.25rem 0 0; color:#95a5a6; font-size:0.8rem;")
+
+    @render.ui
+    def search_results():
+        query = input.quick_search().strip()
+        if not query:
+            return ui.TagList()
+        hits = load_search_index().lookup(query, limit=10)
+        if hits.empty:
+            return ui.p("No matching teams or wrestlers.", style="color:#7f8c8d; margin:0.5rem 0 0;")
+
+        # Every value below comes from the hit's row pointers — no frame is scanned
+        ranks, standings_df, sched = rankings(), standings(), schedule()
+        rows = []
+        for hit in hits.itertuples(index=False):
+            rank = _pointed(ranks, hit, "rankings_row", "school", "rank")
+            conf = _pointed(standings_df, hit, "standings_row", "team", "conference")
+            wins = _pointed(standings_df, hit, "standings_row", "team", "overall_wins")
+            losses = _pointed(standings_df, hit, "standings_row", "team", "overall_losses")
+            rows.append({
+                "Type": "Wrestler" if hit.kind == "wrestler" else "Team",
+                "Name": hit.name,
+                "Team": hit.team if hit.kind == "wrestler" else "",
+                "Wt": "" if pd.isna(hit.weight_class) else int(hit.weight_class),
+                "Rank": f"#{rank}" if rank else "",
+                "Conference": conf or "",
+                "Record": f"{wins}-{losses}" if wins != "" and losses != "" else "",
+                "Games": len(hit.schedule_rows) if hit.kind == "team" and len(sched) else "",
+            })
+        table = pd.DataFrame(rows)
+        for column in ("Name", "Team", "Conference"):
+            table[column] = escape_html(table[column])
+        return render_dataframe_html(table)
 
     @render.ui
     def vb_top_team():
-        df = load_rankings()
+        df = rankings()
         if not df.empty and "school" in df.columns:
             top = df.iloc[0]["school"]
             return ui.value_box(title="#1 Team", value=top, theme="bg-warning")
@@ -90,13 +208,13 @@ def dashboard_server(input, output, session):
 
     @render.ui
     def vb_teams_ranked():
-        df = load_rankings()
+        df = rankings()
         count = len(df) if not df.empty else 0
         return ui.value_box(title="Teams Ranked", value=str(count), theme="bg-primary")
 
     @render.ui
     def vb_live_matches():
-        df = load_live_scores()
+        df = live_scores()
         count = 0
         if not df.empty and "game_state" in df.columns:
             count = len(df[df["game_state"] == "live"])
@@ -105,7 +223,7 @@ def dashboard_server(input, output, session):
 
     @render.ui
     def vb_upcoming():
-        df = load_schedule()
+        df = schedule()
         count = 0
         if not df.empty and "status" in df.columns:
             count = len(df[df["status"] == "Upcoming"])
@@ -113,15 +231,15 @@ def dashboard_server(input, output, session):
 
     @render.ui
     def top_rankings():
-        df = load_rankings()
+        df = rankings()
         if df.empty:
             return empty_state("No rankings data")
 
         display = df.head(10).copy()
         if "rank" in display.columns:
-            display[""] = display["rank"].apply(rank_badge_html)
+            display[""] = rank_badges(display["rank"])
         if "movement" in display.columns:
-            display["Trend"] = display["movement"].apply(movement_indicator)
+            display["Trend"] = movement_indicators(display["movement"])
 
         rename = {"school": "School", "record": "Record", "points": "Pts"}
         display = display.rename(columns={k: v for k, v in rename.items() if k in display.columns})
@@ -132,7 +250,7 @@ def dashboard_server(input, output, session):
 
     @render.ui
     def recent_results():
-        df = load_schedule()
+        df = schedule()
         if df.empty:
             return empty_state("No recent results")
 
@@ -140,18 +258,8 @@ def dashboard_server(input, output, session):
         if results.empty:
             return empty_state("No recent results")
 
-        def matchup(row):
-            ar = f"#{int(row['away_rank'])} " if row.get("away_rank") else ""
-            hr = f"#{int(row['home_rank'])} " if row.get("home_rank") else ""
-            return f"{ar}{row['away_team']} @ {hr}{row['home_team']}"
-
-        def score(row):
-            if row.get("away_score") is not None and row.get("home_score") is not None:
-                return f"{int(row['away_score'])}-{int(row['home_score'])}"
-            return ""
-
-        results["Matchup"] = results.apply(matchup, axis=1)
-        results["Score"] = results.apply(score, axis=1)
+        results["Matchup"] = matchup_column(results)
+        results["Score"] = score_column(results)
         if "date" in results.columns:
             results["Date"] = results["date"].dt.strftime("%b %d").fillna("")
 
@@ -159,7 +267,7 @@ def dashboard_server(input, output, session):
 
     @render.ui
     def standings_preview():
-        df = load_standings()
+        df = standings()
         if df.empty:
             return empty_state("No standings data")
 
@@ -180,3 +288,19 @@ def dashboard_server(input, output, session):
         }
         preview = preview.rename(columns={k: v for k, v in rename.items() if k in preview.columns})
         return render_dataframe_html(preview)
+
+
+def _pointed(df: pd.DataFrame, hit, pointer: str, name_column: str, column: str):
+    """``df[column]`` at a search hit's ``pointer`` row, or ``""`` when missing.
+
+    The row's ``name_column`` must normalize to one of the hit's aliases, so a
+    pin from a different run than the index never shows another team's values.
+    """
+    row = getattr(hit, pointer, None)
+    if pd.isna(row) or {column, name_column} - set(df.columns) or not 0 <= int(row) < len(df):
+        return ""
+    name = df[name_column].iloc[int(row)]
+    if pd.isna(name) or normalize_name(name) not in str(hit.aliases).split("|"):
+        return ""
+    value = df[column].iloc[int(row)]
+    return "" if pd.isna(value) else value
@@ -0,0 +1,93 @@
+"""Game detail drill-down — a modal with one dual's score and bout results.
+
+Opened from any element with ``data-game-id`` (score cards, schedule
+matchups; see ``app/game_detail.js``). The detail is read lazily from the
+pins through the process-wide LRU in ``load_game_detail``, and re-rendered
+while open when a new ``bouts``/``live_scores`` version is published.
+"""
+
+import pandas as pd
+from shiny import module, reactive, render, ui
+
+from app.components.data_table import empty_state, render_dataframe_html
+from app.components.formatters import display_status, escape_html, int_text, rank_prefix
+from app.utils.data_loader import load_game_detail
+from app.utils.pin_watcher import watch_pin
+
+
+@module.server
+def game_detail_server(input, output, session):
+    bouts_version = watch_pin("bouts")
+    live_version = watch_pin("live_scores")
+    schedule_version = watch_pin("schedule")
+    selected = reactive.value(None)
+
+    @reactive.effect
+    @reactive.event(input.open)
+    def _open():
+        selected.set(str(input.open()))
+        ui.modal_show(ui.modal(
+            ui.output_ui(session.ns("detail")),
+            easy_close=True,
+            footer=None,
+            size="l",
+        ))
+
+    @render.ui
+    def detail():
+        game_id = selected()
+        if not game_id:
+            return ui.TagList()
+        bouts_version()
+        live_version()
+        schedule_version()
+        game = load_game_detail(game_id)
+        if game is None:
+            return empty_state("No details for this game yet")
+        return ui.TagList(
+            _header(game.game),
+            _bouts_table(game.bouts) if not game.bouts.empty else ui.p(
+                "No bout results yet.", style="color:#7f8c8d; text-align:center; padding:1rem;",
+            ),
+        )
+
+
+def _header(game: dict) -> ui.Tag:
+    def side(prefix: str) -> str:
+        rank = rank_prefix(pd.Series([game.get(f"{prefix}_rank")])).iloc[0]
+        return f"{rank}{game.get(f'{prefix}_team') or ''}"
+
+    away_score, home_score = int_text(pd.Series([game.get("away_score"), game.get("home_score")]))
+    status = display_status(pd.Series([game.get("state") or ""])).iloc[0]
+    date = pd.to_datetime(game.get("date"), errors="coerce")
+    meta = [status, date.strftime("%b %d, %Y") if pd.notna(date) else "", game.get("time"), game.get("network")]
+    meta = [str(m) for m in meta if isinstance(m, str) and m]
+    url = game.get("url")
+    return ui.div(
+        ui.div(
+            ui.h4(f"{side('away')} @ {side('home')}", style="margin:0;"),
+            ui.div(" · ".join(meta), class_="game-detail-meta"),
+        ),
+        ui.div(
+            f"{away_score} - {home_score}" if away_score or home_score else "",
+            ui.a("NCAA.com ↗", href=url if url.startswith("http") else f"https://www.ncaa.com{url}",
+                 target="_blank", class_="game-detail-meta", style="display:block; text-align:right;")
+            if isinstance(url, str) and url else "",
+            class_="game-detail-score",
+        ),
+        class_="game-detail-header",
+    )
+
+
+def _bouts_table(bouts: pd.DataFrame) -> ui.Tag:
+    winner = bouts["winner_side"].astype("string").str.lower()
+    away, home = escape_html(bouts["away_wrestler"]), escape_html(bouts["home_wrestler"])
+    away_score, home_score = int_text(bouts["away_team_score"]), int_text(bouts["home_team_score"])
+    display = pd.DataFrame({
+        "Wt": int_text(bouts["weight_class"]),
+        "Away": away.mask((winner == "away").fillna(False), '<span class="bout-winner">' + away + "</span>"),
+        "Result": escape_html(bouts["result"]),
+        "Home": home.mask((winner == "home").fillna(False), '<span class="bout-winner">' + home + "</span>"),
+        "Team Score": (away_score + "-" + home_score).where((away_score != "") & (home_score != ""), ""),
+    })
+    return render_dataframe_html(display, max_rows=len(display))
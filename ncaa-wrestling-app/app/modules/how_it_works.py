@@ -269,6 +269,7 @@ def how_it_works_ui():
                     _pin_chip("ncaa_wrestling/rankings"),
                     _pin_chip("ncaa_wrestling/team_stats"),
                     _pin_chip("ncaa_wrestling/individual_stats"),
+                    _pin_chip("ncaa_wrestling/individual_rankings_{weight}"),
                     _pin_chip("ncaa_wrestling/standings"),
                     _pin_chip("ncaa_wrestling/schools"),
                     _pin_chip("ncaa_wrestling/schedule"),
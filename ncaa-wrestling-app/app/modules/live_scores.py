@@ -3,8 +3,10 @@
 from shiny import module, reactive, render, ui
 
 from app.components.data_table import empty_state
-from app.components.score_card import score_card, score_cards_grid
+from app.components.formatters import score_cards_html
+from app.components.score_card import diff_score_cards, score_cards_grid
 from app.utils.data_loader import load_live_scores, pin_updated_at
+from app.utils.pin_watcher import watch_pin
 
 
 @module.ui
@@ -46,17 +48,20 @@ def live_scores_ui():
             ui.column(4, ui.output_ui("upcoming_count_box"), {"class": "col-4 mb-2"}),
             style="margin-bottom:1rem;",
         ),
-        # Score cards
+        # Score cards — the grid is patched in place by score_cards_patch messages
         ui.output_ui("score_cards"),
+        score_cards_grid([], id=module.resolve_id("score_grid")),
     )
 
 
 @module.server
 def live_scores_server(input, output, session):
+    live_version = watch_pin("live_scores")
 
     @reactive.calc
     def live_data():
-        # Re-read on refresh button click
+        # Re-read when the ETL publishes a new version, or on refresh button click
+        live_version()
         input.refresh_btn()
         return load_live_scores()
 
@@ -74,6 +79,7 @@ def live_scores_server(input, output, session):
 
     @render.text
     def live_updated():
+        live_version()
         ts = pin_updated_at("live_scores")
         return f"Last refreshed: {ts}"
 
@@ -99,32 +105,31 @@ def live_scores_server(input, output, session):
         count = len(df[df["game_state"] == "pre"]) if not df.empty and "game_state" in df.columns else 0
         return ui.value_box(title="Upcoming", value=str(count), theme="bg-info")
 
+    # Cards this session's browser currently shows: game_id -> HTML, in order
+    sent_cards: dict[str, str] = {}
+
     @render.ui
     def score_cards():
-        from app.components.score_card import score_card as sc
-        from etl.transformers.scores import classify_game_state
-
-        df = filtered_data()
-        if df.empty:
+        if filtered_data().empty:
             return empty_state("No games today")
+        return None
+
+    @reactive.effect
+    async def _patch_score_cards():
+        cards = _render_cards(filtered_data())
+        patch = diff_score_cards(sent_cards, cards)
+        if patch is None:
+            return
+        await session.send_custom_message(
+            "score_cards_patch", {"container": session.ns("score_grid"), **patch},
+        )
+        sent_cards.clear()
+        sent_cards.update(cards)
+
 
-        cards = []
-        for _, row in df.iterrows():
-            status = classify_game_state(row.get("game_state", "pre"))
-            cards.append(
-                sc(
-                    away_team=row.get("away_team", ""),
-                    home_team=row.get("home_team", ""),
-                    away_score=row.get("away_score"),
-                    home_score=row.get("home_score"),
-                    away_rank=row.get("away_rank"),
-                    home_rank=row.get("home_rank"),
-                    status=status,
-                    game_time=row.get("start_time", ""),
-                    network=row.get("network", ""),
-                    away_winner=bool(row.get("away_winner", False)),
-                    home_winner=bool(row.get("home_winner", False)),
-                )
-            )
-
-        return score_cards_grid(cards)
+def _render_cards(df) -> dict[str, str]:
+    """Render each game's score card to HTML, keyed by ``game_id``."""
+    if df.empty:
+        return {}
+    html = score_cards_html(df)
+    return dict(zip(df["game_id"].astype(str), html))
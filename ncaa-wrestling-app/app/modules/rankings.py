@@ -1,10 +1,22 @@
-"""Rankings page module — team rankings with filtering and movement indicators."""
+"""Rankings page module — team rankings with filtering, movement indicators, a
+season rank-trajectory chart for selected teams, and the top wrestlers at
+each weight class."""
 
+import pandas as pd
 from shiny import module, reactive, render, ui
 
 from app.components.data_table import empty_state, render_dataframe_html
-from app.components.value_boxes import movement_indicator, rank_badge_html
-from app.utils.data_loader import load_rankings, pin_updated_at
+from app.components.formatters import escape_html, movement_indicators, rank_badges
+from app.components.rank_chart import rank_trajectory_chart
+from app.utils.constants import WEIGHT_CLASS_LABELS
+from app.utils.data_loader import (
+    load_individual_rankings,
+    load_rank_history,
+    load_rankings,
+    load_search_index,
+    pin_updated_at,
+)
+from app.utils.pin_watcher import watch_pin
 
 
 @module.ui
@@ -26,22 +38,67 @@ def rankings_ui():
                 ui.div(
                     ui.input_numeric("top_n", "Show Top N", value=25, min=5, max=100, step=5),
                     ui.input_text("search_team", "Search Team", placeholder="e.g. Penn St."),
+                    ui.input_selectize(
+                        "trajectory_teams", "Season Trajectory", choices=[], multiple=True,
+                        options={"maxItems": 8, "placeholder": "Pick teams to chart"},
+                    ),
                     class_="filter-section",
                 ),
             ),
             ui.column(
                 {"class": "col-12 col-lg-9"},
+                ui.output_ui("rank_trajectory"),
                 ui.output_ui("rankings_table"),
             ),
         ),
+        ui.row(
+            ui.column(
+                12,
+                ui.h3("Wrestler Rankings by Weight Class"),
+            ),
+        ),
+        ui.row(
+            ui.column(
+                {"class": "col-12 col-lg-3 mb-3"},
+                ui.div(
+                    ui.input_select(
+                        "weight_class", "Weight Class",
+                        choices={str(wt): label for wt, label in WEIGHT_CLASS_LABELS.items()},
+                    ),
+                    ui.input_numeric("wrestlers_top_n", "Show Top N", value=20, min=5, max=100, step=5),
+                    class_="filter-section",
+                ),
+            ),
+            ui.column(
+                {"class": "col-12 col-lg-9"},
+                ui.output_ui("wrestler_rankings_table"),
+            ),
+        ),
     )
 
 
 @module.server
 def rankings_server(input, output, session):
+    rankings_version = watch_pin("rankings")
+    history_version = watch_pin("rankings_history")
+    # The per-class pins are published before individual_stats in the same run
+    individual_version = watch_pin("individual_stats")
+
+    @reactive.effect
+    def _update_trajectory_choices():
+        history_version()
+        history = load_rank_history()
+        with reactive.isolate():
+            selected = [s for s in input.trajectory_teams() if s in history]
+            if not selected:
+                current = load_rankings()
+                if "school" in current.columns:
+                    selected = [s for s in current["school"].head(5) if s in history]
+        ui.update_selectize("trajectory_teams", choices=history.schools(), selected=selected)
 
     @reactive.calc
     def rankings_data():
+        rankings_version()
         df = load_rankings()
         if df.empty:
             return df
@@ -49,8 +106,8 @@ def rankings_server(input, output, session):
         # Apply search filter
         search = input.search_team().strip()
         if search:
-            mask = df["school"].str.contains(search, case=False, na=False)
-            df = df[mask]
+            matched = load_search_index().select(df, search, "rankings_row", ["school"])
+            df = matched if matched is not None else df[df["school"].str.contains(search, case=False, na=False)]
 
         # Apply top N
         top_n = input.top_n() or 25
@@ -60,9 +117,21 @@ def rankings_server(input, output, session):
 
     @render.text
     def rankings_updated():
+        rankings_version()
         ts = pin_updated_at("rankings")
         return f"Last updated: {ts}"
 
+    @render.ui
+    def rank_trajectory():
+        history_version()
+        history = load_rank_history()
+        # Only the selected teams' rows are touched: each lookup is a slice of the index
+        series = [history.series(s) for s in input.trajectory_teams()]
+        series = [s for s in series if s is not None and len(s)]
+        if not series:
+            return ui.TagList()
+        return rank_trajectory_chart(series, history.weeks)
+
     @render.ui
     def rankings_table():
         df = rankings_data()
@@ -73,9 +142,9 @@ def rankings_server(input, output, session):
         display = df.copy()
 
         if "rank" in display.columns:
-            display[""] = display["rank"].apply(rank_badge_html)
+            display[""] = rank_badges(display["rank"])
         if "movement" in display.columns:
-            display["Trend"] = display["movement"].apply(movement_indicator)
+            display["Trend"] = movement_indicators(display["movement"])
         if "school" in display.columns:
             display = display.rename(columns={"school": "School"})
         if "record" in display.columns:
@@ -91,3 +160,23 @@ def rankings_server(input, output, session):
         display = display[show_cols]
 
         return render_dataframe_html(display)
+
+    @render.ui
+    def wrestler_rankings_table():
+        individual_version()
+        weight = int(input.weight_class())
+        # Only the selected class's pin is read
+        df = load_individual_rankings(weight).head(input.wrestlers_top_n() or 20)
+        if df.empty:
+            return empty_state(f"No wrestler rankings for {WEIGHT_CLASS_LABELS[weight]}")
+
+        display = pd.DataFrame({
+            "": rank_badges(df["weight_rank"]),
+            "Wrestler": escape_html(df["name"]),
+            "Team": escape_html(df["team"]),
+            "Class": escape_html(df["class_year"]),
+            "Record": df["wins"].astype("string").fillna("0") + "-" + df["losses"].astype("string").fillna("0"),
+            "Win %": df["win_pct"].map(lambda p: f"{p:.3f}" if pd.notna(p) else ""),
+            "Falls": df["falls"],
+        })
+        return render_dataframe_html(display)
@@ -1,10 +1,19 @@
-"""Schedule page module — upcoming matches and recent results."""
+"""Schedule page module — upcoming matches with Elo win probabilities, recent
+results, and the Elo power ratings."""
 
+import pandas as pd
 from shiny import module, reactive, render, ui
 
 from app.components.data_table import empty_state, render_dataframe_html
-from app.components.value_boxes import rank_badge_html
-from app.utils.data_loader import load_schedule, pin_updated_at
+from app.components.formatters import (
+    escape_html,
+    game_detail_links,
+    matchup_column,
+    score_column,
+    win_probability_column,
+)
+from app.utils.data_loader import load_elo_params, load_elo_ratings, load_schedule, load_search_index, pin_updated_at
+from app.utils.pin_watcher import watch_pin
 
 
 @module.ui
@@ -27,7 +36,8 @@ def schedule_ui():
                     ui.input_select(
                         "view_mode",
                         "View",
-                        choices={"all": "All", "upcoming": "Upcoming", "results": "Results"},
+                        choices={"all": "All", "upcoming": "Upcoming", "results": "Results",
+                                 "ratings": "Power Ratings (Elo)"},
                         selected="all",
                     ),
                     ui.input_text("search_schedule", "Search Team", placeholder="e.g. Iowa"),
@@ -51,13 +61,37 @@ def schedule_ui():
 
 @module.server
 def schedule_server(input, output, session):
+    schedule_version = watch_pin("schedule")
+    elo_version = watch_pin("elo_ratings")
+
+    @reactive.calc
+    def elo_ratings():
+        elo_version()
+        return load_elo_ratings()
+
+    @reactive.calc
+    def elo_params():
+        elo_version()
+        return load_elo_params()
 
     @reactive.calc
     def schedule_data():
+        schedule_version()
         df = load_schedule()
         if df.empty:
             return df
 
+        # Search filter (first, while row positions still match the pin)
+        search = input.search_schedule().strip()
+        if search:
+            matched = load_search_index().select(df, search, "schedule_rows", ["away_team", "home_team"])
+            if matched is None:
+                matched = df[
+                    df["away_team"].str.contains(search, case=False, na=False)
+                    | df["home_team"].str.contains(search, case=False, na=False)
+                ]
+            df = matched
+
         # View mode filter
         mode = input.view_mode()
         if mode == "upcoming":
@@ -65,15 +99,6 @@ def schedule_server(input, output, session):
         elif mode == "results":
             df = df[df["status"] == "Final"]
 
-        # Search filter
-        search = input.search_schedule().strip()
-        if search:
-            mask = (
-                df["away_team"].str.contains(search, case=False, na=False)
-                | df["home_team"].str.contains(search, case=False, na=False)
-            )
-            df = df[mask]
-
         # Network filter
         net = input.network_filter()
         if net != "all":
@@ -85,32 +110,28 @@ def schedule_server(input, output, session):
 
     @render.text
     def schedule_updated():
+        schedule_version()
         ts = pin_updated_at("schedule")
         return f"Last updated: {ts}"
 
     @render.ui
     def schedule_table():
+        if input.view_mode() == "ratings":
+            return ratings_table()
+
         df = schedule_data()
         if df.empty:
             return empty_state("No scheduled events found")
 
         display = df.copy()
 
-        # Format matchup column
-        def matchup_str(row):
-            away_rank = f"#{int(row['away_rank'])} " if row.get("away_rank") else ""
-            home_rank = f"#{int(row['home_rank'])} " if row.get("home_rank") else ""
-            return f"{away_rank}{row['away_team']}  @  {home_rank}{row['home_team']}"
-
-        display["Matchup"] = display.apply(matchup_str, axis=1)
-
-        # Format score
-        def score_str(row):
-            if row.get("status") == "Final" and row.get("away_score") is not None:
-                return f"{int(row['away_score'])} - {int(row['home_score'])}"
-            return ""
-
-        display["Score"] = display.apply(score_str, axis=1)
+        display["Matchup"] = game_detail_links(
+            escape_html(matchup_column(display, separator="  @  ")), display["game_id"],
+        )
+        display["Score"] = score_column(display, separator=" - ", mask=display["status"] == "Final")
+        display["Win Prob"] = win_probability_column(
+            display, elo_ratings(), elo_params(), mask=display["status"] == "Upcoming",
+        )
 
         # Format date
         if "date" in display.columns:
@@ -122,8 +143,28 @@ def schedule_server(input, output, session):
             "status": "Status",
         })
 
-        show_cols = ["Date", "Matchup", "Score", "Time", "Network", "Status"]
+        show_cols = ["Date", "Matchup", "Score", "Win Prob", "Time", "Network", "Status"]
         show_cols = [c for c in show_cols if c in display.columns]
         display = display[show_cols]
 
         return render_dataframe_html(display, max_rows=50)
+
+    def ratings_table():
+        df = elo_ratings()
+        if df.empty:
+            return empty_state("No Elo ratings yet")
+
+        position = pd.Series(range(1, len(df) + 1), index=df.index)  # the pin is sorted by rating
+        search = input.search_schedule().strip()
+        if search:
+            df = df[df["team"].str.contains(search, case=False, na=False)]
+
+        display = pd.DataFrame({
+            "#": position[df.index].to_numpy(),
+            "Team": escape_html(df["team"]).to_numpy(),
+            "Elo": df["rating"].round().astype(int).to_numpy(),
+            "W": df["wins"].to_numpy(),
+            "L": df["losses"].to_numpy(),
+            "T": df["ties"].to_numpy(),
+        })
+        return render_dataframe_html(display, max_rows=100)
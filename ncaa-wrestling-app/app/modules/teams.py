@@ -1,9 +1,18 @@
-"""Teams page module — conference standings and team stats."""
+"""Teams page module — conference standings, team stats, and head-to-head comparisons."""
 
+import pandas as pd
 from shiny import module, reactive, render, ui
 
 from app.components.data_table import empty_state, render_dataframe_html
-from app.utils.data_loader import load_standings, load_team_stats, pin_updated_at
+from app.components.formatters import escape_html
+from app.utils.data_loader import (
+    load_head_to_head,
+    load_search_index,
+    load_standings,
+    load_team_stats,
+    pin_updated_at,
+)
+from app.utils.pin_watcher import watch_pin
 
 
 @module.ui
@@ -44,14 +53,48 @@ def teams_ui():
                 ui.output_ui("teams_table"),
             ),
         ),
+        # Head-to-head comparison (teams or wrestlers)
+        ui.row(
+            ui.column(
+                12,
+                ui.div(
+                    ui.div("Head-to-Head", class_="card-header"),
+                    ui.div(
+                        ui.row(
+                            ui.column(
+                                {"class": "col-12 col-md-2"},
+                                ui.input_radio_buttons(
+                                    "h2h_kind", None, choices={"team": "Teams", "wrestler": "Wrestlers"},
+                                    selected="team",
+                                ),
+                            ),
+                            ui.column(
+                                {"class": "col-12 col-md-5"},
+                                ui.input_text("h2h_a", None, placeholder="e.g. Iowa"),
+                            ),
+                            ui.column(
+                                {"class": "col-12 col-md-5"},
+                                ui.input_text("h2h_b", None, placeholder="e.g. Penn St."),
+                            ),
+                        ),
+                        ui.output_ui("h2h_panel"),
+                        class_="card-body",
+                    ),
+                    class_="card mt-3",
+                ),
+            ),
+        ),
     )
 
 
 @module.server
 def teams_server(input, output, session):
+    standings_version = watch_pin("standings")
+    team_stats_version = watch_pin("team_stats")
 
     @reactive.effect
     def _update_conference_choices():
+        standings_version()
         df = load_standings()
         if not df.empty and "conference" in df.columns:
             confs = sorted(df["conference"].dropna().unique().tolist())
@@ -61,24 +104,27 @@ def teams_server(input, output, session):
 
     @reactive.calc
     def standings_data():
+        standings_version()
         df = load_standings()
         if df.empty:
             return df
 
-        conf = input.conference_filter()
-        if conf != "all":
-            df = df[df["conference"] == conf]
-
         search = input.search_team().strip()
         if search:
             team_col = "team" if "team" in df.columns else df.columns[1] if len(df.columns) > 1 else None
             if team_col:
-                df = df[df[team_col].str.contains(search, case=False, na=False)]
+                matched = load_search_index().select(df, search, "standings_row", [team_col])
+                df = matched if matched is not None else df[df[team_col].str.contains(search, case=False, na=False)]
+
+        conf = input.conference_filter()
+        if conf != "all":
+            df = df[df["conference"] == conf]
 
         return df
 
     @reactive.calc
     def stats_data():
+        team_stats_version()
         df = load_team_stats()
         if df.empty:
             return df
@@ -87,12 +133,58 @@ def teams_server(input, output, session):
         if search:
             team_col = "team" if "team" in df.columns else None
             if team_col:
-                df = df[df[team_col].str.contains(search, case=False, na=False)]
+                matched = load_search_index().select(df, search, "team_stats_row", [team_col])
+                df = matched if matched is not None else df[df[team_col].str.contains(search, case=False, na=False)]
 
         return df
 
+    h2h_entities_version = watch_pin("h2h_entities")
+    h2h_results_version = watch_pin("h2h_results")
+
+    @render.ui
+    def h2h_panel():
+        h2h_entities_version()
+        h2h_results_version()
+        a_query, b_query = input.h2h_a().strip(), input.h2h_b().strip()
+        if not a_query or not b_query:
+            return ui.p("Enter two teams or wrestlers to compare.", style="color:#7f8c8d; font-size:0.85rem;")
+        index = load_head_to_head()
+        kind = input.h2h_kind()
+        a, b = index.find(a_query, kind), index.find(b_query, kind)
+        missing = [q for q, found in ((a_query, a), (b_query, b)) if found is None]
+        if missing:
+            return empty_state(f"No {kind} results found for: {', '.join(missing)}")
+        if a == b:
+            return empty_state("Pick two different entries to compare")
+
+        comparison = index.compare(a, b)
+        wins, losses, ties = comparison.record
+        if wins + losses + ties:
+            record = f"{wins}-{losses}-{ties}" if ties else f"{wins}-{losses}"
+        else:
+            record = "no meetings this season"
+        headline = f"{comparison.a} vs {comparison.b}: {record}"
+        meetings = pd.DataFrame({
+            "Date": pd.to_datetime(comparison.meetings["date"]).dt.strftime("%b %d"),
+            "Result": escape_html(comparison.meetings["outcome"].astype(str) + " " + comparison.meetings["result"]),
+        })
+        common = comparison.common.rename(columns={
+            "opponent": "Common Opponent", "a_record": comparison.a, "b_record": comparison.b,
+        })
+        common["Common Opponent"] = escape_html(common["Common Opponent"])
+        common.columns = escape_html(pd.Series(common.columns)).tolist()
+        return ui.div(
+            ui.h5(headline, style="margin-top:0.5rem;"),
+            render_dataframe_html(meetings) if not meetings.empty else ui.TagList(),
+            ui.h6(f"Common opponents ({len(common)})", style="color:#2a3f6a; margin-top:1rem;"),
+            render_dataframe_html(common) if not common.empty else ui.p(
+                "No common opponents yet.", style="color:#7f8c8d; font-size:0.85rem;",
+            ),
+        )
+
     @render.text
     def teams_updated():
+        standings_version()
         ts = pin_updated_at("standings")
         return f"Last updated: {ts}"
 
@@ -0,0 +1,38 @@
+// Patch keyed score cards in place from "score_cards_patch" custom messages.
+// Each message carries {container, upsert: [{key, html}], remove: [key], order}
+// (see diff_score_cards in app/components/score_card.py); only changed cards
+// are replaced, so the rest of the grid is left untouched.
+Shiny.addCustomMessageHandler("score_cards_patch", function (msg) {
+  var grid = document.getElementById(msg.container);
+  if (!grid) return;
+
+  var cards = {};
+  grid.querySelectorAll(":scope > [data-key]").forEach(function (el) {
+    cards[el.dataset.key] = el;
+  });
+
+  msg.remove.forEach(function (key) {
+    if (cards[key]) {
+      cards[key].remove();
+      delete cards[key];
+    }
+  });
+
+  msg.upsert.forEach(function (item) {
+    var tpl = document.createElement("template");
+    tpl.innerHTML = item.html.trim();
+    var el = tpl.content.firstElementChild;
+    if (cards[item.key]) {
+      cards[item.key].replaceWith(el);
+    } else {
+      grid.appendChild(el);
+    }
+    cards[item.key] = el;
+  });
+
+  if (msg.order) {
+    msg.order.forEach(function (key) {
+      if (cards[key]) grid.appendChild(cards[key]);
+    });
+  }
+});
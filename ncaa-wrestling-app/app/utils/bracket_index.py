@@ -0,0 +1,49 @@
+"""In-memory index over the ``brackets`` pin.
+
+The ETL (``etl/brackets.py``) publishes one row per match with its round code
+(``r32``/``r16``/``qf``/``sf``/``finals``/``cons``), slot occupants, result
+and the ``*_from`` / ``winner_to`` / ``loser_to`` links between matches.
+``BracketIndex`` groups the row positions by weight class and round once
+per pin version, so showing one weight and round is a dict lookup and an
+``iloc`` of that round's matches — no scan of the whole tournament and no
+bracket JSON.
+"""
+
+import numpy as np
+import pandas as pd
+
+ROUND_ORDER = ("r32", "r16", "qf", "sf", "finals", "cons")  # must match etl.brackets.ROUND_CODES
+
+
+class BracketIndex:
+    """(weight class, round) -> matches lookups over one version of ``brackets``."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.matches = df
+        self._rows: dict[tuple[int, str], np.ndarray] = {}
+        if df.empty:
+            return
+        weights = pd.to_numeric(df["weight_class"], errors="coerce").fillna(0).to_numpy(dtype=np.int64)
+        rounds = df["round_code"].astype(str).to_numpy()
+        bouts = pd.to_numeric(df["bout"], errors="coerce").fillna(-1).to_numpy(dtype=np.int64)
+        order = np.lexsort((bouts, rounds, weights))
+        keys = list(zip(weights[order].tolist(), rounds[order].tolist()))
+        starts = [0] + [i for i in range(1, len(keys)) if keys[i] != keys[i - 1]]
+        for start, end in zip(starts, starts[1:] + [len(keys)]):
+            self._rows[keys[start]] = order[start:end]
+
+    def __bool__(self) -> bool:
+        return bool(self._rows)
+
+    def weights(self) -> list[int]:
+        """Weight classes with a bracket."""
+        return sorted({wt for wt, _ in self._rows})
+
+    def rounds(self, weight_class: int) -> list[str]:
+        """Round codes present for ``weight_class``, championship rounds first."""
+        return [r for r in ROUND_ORDER if (weight_class, r) in self._rows]
+
+    def round_matches(self, weight_class: int, round_code: str) -> pd.DataFrame:
+        """Matches of one weight class and round, by bout number (empty if none)."""
+        rows = self._rows.get((weight_class, round_code))
+        return self.matches.iloc[rows if rows is not None else []]
@@ -43,6 +43,8 @@ OPENTW_API_BASE_URL = "https://opentw-api.henrygd.me"
 LIVE_SCORE_REFRESH_INTERVAL = 60
 BRACKET_REFRESH_INTERVAL = 120
 DASHBOARD_REFRESH_INTERVAL = 120
+PIN_META_TTL_SECONDS = 30
+GAME_DETAIL_CACHE_SIZE = 128  # games kept in the per-process drill-down LRU
 
 # Pin board / data cache
 PIN_BOARD_DIR = "ncaa_wrestling_pins"
@@ -55,6 +57,7 @@ PIN_SCHOOLS = "schools"
 PIN_LIVE_SCORES = "live_scores"
 PIN_BRACKETS = "brackets"
 PIN_EVENTS = "events"
+PIN_ELO_RATINGS = "elo_ratings"
 
 # Conferences for filtering
 CONFERENCES = [
@@ -4,17 +4,26 @@ On Posit Connect:
     Reads from ``pins.board_connect()`` — the same board the ETL jobs write to.
 
 For local development:
-    Reads from ``pins.board_folder()`` at ``pin_cache/``.
+    Reads from ``pins.board_folder()`` at ``pin_cache/`` (or ``NCAA_PINS_DIR``).
 
 Falls back to empty DataFrames when data hasn't been written yet.
 """
 
 import logging
 import os
+import time
 from pathlib import Path
 
 import pandas as pd
 import pins
+from pins.boards import BaseBoard
+
+from app.utils.bracket_index import BracketIndex
+from app.utils.constants import GAME_DETAIL_CACHE_SIZE, PIN_META_TTL_SECONDS
+from app.utils.game_detail import GameDetail, GameDetailCache
+from app.utils.head_to_head import HeadToHead
+from app.utils.rank_history import RankHistory
+from app.utils.search_index import SearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +31,10 @@ PIN_PREFIX = "ncaa_wrestling"
 _LOCAL_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "pin_cache"
 
 # Cache the board instance so we don't re-create it on every read
-_board: pins.BaseBoard | None = None
+_board: BaseBoard | None = None
 
 
-def _get_board() -> pins.BaseBoard:
+def _get_board() -> BaseBoard:
     """Get or create the pins board (cached)."""
     global _board
     if _board is not None:
@@ -39,37 +48,159 @@ def _get_board() -> pins.BaseBoard:
             allow_pickle_read=False,
         )
     else:
-        _LOCAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        logger.info("Data loader: using local pins board at %s", _LOCAL_CACHE_DIR)
-        _board = pins.board_folder(_LOCAL_CACHE_DIR, allow_pickle_read=False)
+        cache_dir = Path(os.environ.get("NCAA_PINS_DIR") or _LOCAL_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.info("Data loader: using local pins board at %s", cache_dir)
+        _board = pins.board_folder(cache_dir, allow_pickle_read=False)
 
     return _board
 
 
 def _pin_name(name: str) -> str:
-    return f"{PIN_PREFIX}/{name}"
+    # Same naming as etl.pin_writer: ``owner/name`` on Connect, no "/" in folder boards
+    separator = "/" if os.environ.get("CONNECT_SERVER") else "__"
+    return f"{PIN_PREFIX}{separator}{name}"
+
+
+# Process-wide frame cache: full pin name -> (version, DataFrame). Every session
+# gets the same frame object for a given pin version, so callers must treat
+# the result of ``read_pin`` as read-only (filter or ``.copy()`` before editing).
+_frames: dict[str, tuple[str, pd.DataFrame]] = {}
 
 
 def read_pin(name: str) -> pd.DataFrame:
-    """Read a pinned DataFrame. Returns an empty DataFrame if the pin doesn't exist."""
+    """Read a pinned DataFrame. Returns an empty DataFrame if the pin doesn't exist.
+
+    The pin is downloaded and deserialized once per version; the version is
+    revalidated through the TTL-cached ``pin_meta``. The returned frame is
+    shared between sessions and must not be modified in place.
+    """
     full_name = _pin_name(name)
+    meta = pin_meta(name)
+    cached = _frames.get(full_name)
+    if meta is None:
+        return cached[1] if cached is not None else pd.DataFrame()
+
+    version = meta.version.version
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     try:
-        board = _get_board()
-        return board.pin_read(full_name)
+        df = _get_board().pin_read(full_name, version=version)
     except Exception as exc:
+        if cached is not None:
+            logger.warning("Could not read pin '%s' version %s: %s — serving cached version %s",
+                           full_name, version, exc, cached[0])
+            return cached[1]
         logger.warning("Could not read pin '%s': %s — returning empty DataFrame", full_name, exc)
         return pd.DataFrame()
 
+    df = _PREPARERS.get(name, _identity)(df)
+    _frames[full_name] = (version, df)
+    logger.info("Loaded pin '%s' version %s: %d rows", full_name, version, len(df))
+    return df
+
+
+# ------------------------------------------------------------------
+# Pin metadata cache
+# ------------------------------------------------------------------
+#
+# The board listing and each pin's latest ``pin_meta`` are cached for
+# ``PIN_META_TTL_SECONDS`` and shared by every session in the process, so the
+# several "Last updated" texts and existence checks cost at most one board
+# round trip per pin per TTL window.
+
+_listing: tuple[float, frozenset[str]] | None = None
+_metas: dict[str, tuple[float, pins.meta.Meta | None]] = {}
+
+
+def _pin_listing() -> frozenset[str]:
+    """Full names of every pin on the board (cached per TTL)."""
+    global _listing
+    now = time.monotonic()
+    if _listing is None or now - _listing[0] >= PIN_META_TTL_SECONDS:
+        try:
+            names = frozenset(_get_board().pin_list())
+        except Exception as exc:
+            logger.warning("Could not list pins: %s", exc)
+            names = frozenset()
+        _listing = (now, names)
+    return _listing[1]
+
+
+def pin_meta(name: str, max_age: float = PIN_META_TTL_SECONDS) -> pins.meta.Meta | None:
+    """Return the latest-version metadata for a pin, or ``None``.
+
+    Metadata fetched less than ``max_age`` seconds ago is served from cache.
+    """
+    full_name = _pin_name(name)
+    now = time.monotonic()
+    cached = _metas.get(full_name)
+    if cached is not None and now - cached[0] < max_age:
+        return cached[1]
+
+    meta = None
+    if full_name in _pin_listing():
+        try:
+            meta = _get_board().pin_meta(full_name)
+        except Exception as exc:
+            logger.warning("Could not read metadata for pin '%s': %s", full_name, exc)
+    _metas[full_name] = (now, meta)
+    return meta
+
+
+def pin_exists(name: str) -> bool:
+    """Return whether a pin exists on the board."""
+    return _pin_name(name) in _pin_listing()
+
+
+def pin_version(name: str, max_age: float = PIN_META_TTL_SECONDS) -> str | None:
+    """Return the latest version id of a pin, or ``None`` if it doesn't exist."""
+    meta = pin_meta(name, max_age=max_age)
+    return meta.version.version if meta is not None else None
+
 
 def pin_updated_at(name: str) -> str:
     """Return the last-updated timestamp for a pin, or 'Never' if unavailable."""
-    full_name = _pin_name(name)
-    try:
-        board = _get_board()
-        meta = board.pin_meta(full_name)
-        return str(meta.created)
-    except Exception:
-        return "Never"
+    meta = pin_meta(name)
+    return str(meta.created) if meta is not None else "Never"
+
+
+def describe_pins() -> dict[str, dict]:
+    """Describe every ``ncaa_wrestling`` pin in one call.
+
+    Returns ``{short_name: {"version": ..., "created": ...}}`` built from one
+    board listing and the cached metadata of each pin.
+    """
+    prefix = _pin_name("")
+    described = {}
+    for full_name in sorted(_pin_listing()):
+        if not full_name.startswith(prefix):
+            continue
+        short = full_name[len(prefix):]
+        meta = pin_meta(short)
+        if meta is not None:
+            described[short] = {"version": meta.version.version, "created": str(meta.created)}
+    return described
+
+
+# ------------------------------------------------------------------
+# One-time preparation applied when a pin version enters the cache
+# ------------------------------------------------------------------
+
+def _identity(df: pd.DataFrame) -> pd.DataFrame:
+    return df
+
+
+def _prepare_schedule(df: pd.DataFrame) -> pd.DataFrame:
+    if not df.empty and "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+
+_PREPARERS = {
+    "schedule": _prepare_schedule,
+}
 
 
 # ------------------------------------------------------------------
@@ -88,15 +219,17 @@ def load_individual_stats() -> pd.DataFrame:
     return read_pin("individual_stats")
 
 
+def load_individual_rankings(weight_class: int) -> pd.DataFrame:
+    """One weight class's wrestlers by ``weight_rank`` (its own small pin)."""
+    return read_pin(f"individual_rankings_{weight_class}")
+
+
 def load_standings() -> pd.DataFrame:
     return read_pin("standings")
 
 
 def load_schedule() -> pd.DataFrame:
-    df = read_pin("schedule")
-    if not df.empty and "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    return df
+    return read_pin("schedule")
 
 
 def load_schools() -> pd.DataFrame:
@@ -109,3 +242,87 @@ def load_live_scores() -> pd.DataFrame:
 
 def load_brackets() -> pd.DataFrame:
     return read_pin("brackets")
+
+
+def load_elo_ratings() -> pd.DataFrame:
+    return read_pin("elo_ratings")
+
+
+def load_elo_params() -> dict[str, float]:
+    """``initial_rating`` / ``home_advantage`` the ETL rated with, from the ``elo_ratings`` pin metadata."""
+    meta = pin_meta("elo_ratings")
+    user = meta.user if meta is not None else {}
+    return {key: float(user[key]) for key in ("initial_rating", "home_advantage") if key in user}
+
+
+def load_bracket_sim_wrestlers() -> pd.DataFrame:
+    return read_pin("bracket_sim_wrestlers")
+
+
+def load_bracket_sim_teams() -> pd.DataFrame:
+    return read_pin("bracket_sim_teams")
+
+
+def load_team_scores() -> pd.DataFrame:
+    return read_pin("team_scores")
+
+
+# Index over the shared ``rankings_history`` frame, rebuilt when the frame changes
+_rank_history: tuple[pd.DataFrame, RankHistory] | None = None
+
+
+def load_rank_history() -> RankHistory:
+    """Team rank-series index over the current ``rankings_history`` pin version."""
+    global _rank_history
+    df = read_pin("rankings_history")
+    if _rank_history is None or _rank_history[0] is not df:
+        _rank_history = (df, RankHistory(df))
+    return _rank_history[1]
+
+
+# Weight/round index over the shared ``brackets`` frame
+_bracket_index: tuple[pd.DataFrame, BracketIndex] | None = None
+
+
+def load_bracket_index() -> BracketIndex:
+    """Weight class/round index over the current ``brackets`` pin version."""
+    global _bracket_index
+    df = read_pin("brackets")
+    if _bracket_index is None or _bracket_index[0] is not df:
+        _bracket_index = (df, BracketIndex(df))
+    return _bracket_index[1]
+
+
+# Head-to-head index over the shared ``h2h_entities``/``h2h_results`` frames
+_head_to_head: tuple[pd.DataFrame, pd.DataFrame, HeadToHead] | None = None
+
+
+def load_head_to_head() -> HeadToHead:
+    """Head-to-head comparisons over the current head-to-head pins (empty if not built yet)."""
+    global _head_to_head
+    entities, results = read_pin("h2h_entities"), read_pin("h2h_results")
+    if _head_to_head is None or _head_to_head[0] is not entities or _head_to_head[1] is not results:
+        _head_to_head = (entities, results, HeadToHead(entities, results))
+    return _head_to_head[2]
+
+
+# Per-game drill-down, built on first open and kept in a bounded LRU
+_game_details = GameDetailCache(GAME_DETAIL_CACHE_SIZE)
+
+
+def load_game_detail(game_id: str) -> GameDetail | None:
+    """Scoreboard row and bouts of one game from the pins (never the live API)."""
+    return _game_details.get(str(game_id), read_pin("bouts"), read_pin("live_scores"), read_pin("schedule"))
+
+
+# Search index over the shared ``search_index``/``search_terms`` frames
+_search_index: tuple[pd.DataFrame, pd.DataFrame, SearchIndex] | None = None
+
+
+def load_search_index() -> SearchIndex:
+    """Team/wrestler search over the current search pins (empty if not built yet)."""
+    global _search_index
+    index, terms = read_pin("search_index"), read_pin("search_terms")
+    if _search_index is None or _search_index[0] is not index or _search_index[1] is not terms:
+        _search_index = (index, terms, SearchIndex(index, terms))
+    return _search_index[2]
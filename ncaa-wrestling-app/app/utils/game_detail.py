@@ -0,0 +1,116 @@
+"""Per-game drill-down over the ``bouts``, ``live_scores`` and ``schedule`` pins.
+
+The live poller (``etl/game_details.py``) publishes every bout of the duals
+it has seen in the ``bouts`` pin, so opening a game never calls the API from
+a user session. ``GameDetailCache`` builds a game's detail only when it is
+first opened: the bouts pin is indexed by ``game_id`` once per version, and
+each built ``GameDetail`` is kept in a bounded LRU, keyed by game and
+tagged with the pin versions (frame identities) it was built from. Details
+built before any of the three pins changed are rebuilt when next opened, so
+a live game shows its new bouts; between publishes every reopen is a hit.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+_BOUT_COLUMNS = [
+    "weight_class", "bout_number", "winner_side", "decision", "result",
+    "away_wrestler", "away_team", "home_wrestler", "home_team", "away_team_score", "home_team_score",
+]
+
+
+@dataclass(frozen=True)
+class GameDetail:
+    """One dual: its scoreboard/schedule row and its bouts in bout order."""
+
+    game_id: str
+    game: dict            # away/home team, scores, state, date, time, network, url
+    bouts: pd.DataFrame   # _BOUT_COLUMNS, one row per bout
+
+
+class GameDetailCache:
+    """Bounded LRU of ``GameDetail`` by ``game_id``."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[int, GameDetail | None]] = OrderedDict()
+        self._bouts_index: tuple[pd.DataFrame, dict[str, np.ndarray]] | None = None
+        # The pin frames the newest entries were built from; entries of an
+        # older generation are rebuilt when next opened
+        self._sources: tuple[pd.DataFrame, ...] = ()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        game_id: str,
+        bouts: pd.DataFrame,
+        live_scores: pd.DataFrame,
+        schedule: pd.DataFrame,
+    ) -> GameDetail | None:
+        """Detail of ``game_id`` from these pin frames (``None`` if no pin knows the game)."""
+        sources = (bouts, live_scores, schedule)
+        if len(sources) != len(self._sources) or any(a is not b for a, b in zip(sources, self._sources)):
+            self._sources, self._generation = sources, self._generation + 1
+        entry = self._entries.get(game_id)
+        if entry is not None and entry[0] == self._generation:
+            self._entries.move_to_end(game_id)
+            return entry[1]
+
+        detail = self._build(game_id, bouts, live_scores, schedule)
+        self._entries[game_id] = (self._generation, detail)
+        self._entries.move_to_end(game_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return detail
+
+    def _build(self, game_id, bouts, live_scores, schedule) -> GameDetail | None:
+        game = _game_row(live_scores, game_id) or _game_row(schedule, game_id)
+        rows = self._rows(bouts).get(game_id)
+        if rows is not None:
+            game_bouts = bouts.iloc[rows].reindex(columns=_BOUT_COLUMNS)
+            game_bouts = game_bouts.sort_values("bout_number", kind="stable", na_position="last")
+            game_bouts = game_bouts.reset_index(drop=True)
+        else:
+            game_bouts = pd.DataFrame(columns=_BOUT_COLUMNS)
+        if game is None and game_bouts.empty:
+            return None
+        if game is None:  # only the bouts know this game
+            last = game_bouts.iloc[-1]
+            game = {"away_team": last["away_team"], "home_team": last["home_team"],
+                    "away_score": last["away_team_score"], "home_score": last["home_team_score"]}
+        return GameDetail(game_id=game_id, game=game, bouts=game_bouts)
+
+    def _rows(self, bouts: pd.DataFrame) -> dict[str, np.ndarray]:
+        """``game_id`` -> row positions in ``bouts``, built once per pin version."""
+        if self._bouts_index is None or self._bouts_index[0] is not bouts:
+            index = bouts.groupby(bouts["game_id"].astype(str)).indices if not bouts.empty else {}
+            self._bouts_index = (bouts, index)
+        return self._bouts_index[1]
+
+
+def _game_row(df: pd.DataFrame, game_id: str) -> dict | None:
+    if df.empty or "game_id" not in df.columns:
+        return None
+    hits = np.flatnonzero(df["game_id"].astype(str).to_numpy() == game_id)
+    if not len(hits):
+        return None
+    row = df.iloc[hits[-1]]
+    return {
+        "away_team": row.get("away_team"),
+        "home_team": row.get("home_team"),
+        "away_rank": row.get("away_rank"),
+        "home_rank": row.get("home_rank"),
+        "away_score": row.get("away_score"),
+        "home_score": row.get("home_score"),
+        "state": row.get("game_state", row.get("status")),
+        "date": row.get("start_date", row.get("date")),
+        "time": row.get("start_time"),
+        "network": row.get("network"),
+        "url": row.get("url"),
+    }
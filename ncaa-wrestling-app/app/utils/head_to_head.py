@@ -0,0 +1,120 @@
+"""Head-to-head comparisons over the ``h2h_entities`` / ``h2h_results`` pins.
+
+The ETL (``etl/head_to_head.py``) stores every result from both sides,
+sorted by ``(entity_id, opponent_id, date)``, and each entity's row range.
+``HeadToHead`` keeps those columns as NumPy arrays, so comparing two teams
+or wrestlers only touches their own runs of rows:
+
+- direct meetings: a binary search for ``b`` among ``a``'s opponents,
+- common opponents (depth 2): the intersection of the two sorted opponent
+  arrays, with each side's record against every shared opponent.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from app.utils.search_index import normalize_name
+
+_OUTCOMES = {"W": 1, "L": -1, "T": 0}
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """``a`` vs ``b``: their meetings and their results against common opponents."""
+
+    a: str
+    b: str
+    record: tuple[int, int, int]   # a's wins, losses, ties against b
+    meetings: pd.DataFrame         # date, result, outcome (from a's side)
+    common: pd.DataFrame           # opponent, a's and b's record against them
+
+
+class HeadToHead:
+    """Team/wrestler comparisons over one version of the head-to-head pins."""
+
+    def __init__(self, entities: pd.DataFrame, results: pd.DataFrame):
+        self.entities = entities
+        self.results = results
+        self._names = entities["name"].astype(str).to_numpy() if not entities.empty else np.array([])
+        self._teams = entities["team"].astype(str).to_numpy() if not entities.empty else np.array([])
+        self._kinds = entities["kind"].astype(str).to_numpy() if not entities.empty else np.array([])
+        self._first = entities["first_row"].to_numpy(dtype=np.int64) if not entities.empty else np.array([], int)
+        self._count = entities["row_count"].to_numpy(dtype=np.int64) if not entities.empty else np.array([], int)
+        self._opponents = results["opponent_id"].to_numpy(dtype=np.int64) if not results.empty else np.array([], int)
+        self._outcomes = (
+            results["outcome"].astype(str).map(_OUTCOMES).fillna(0).to_numpy(dtype=np.int8)
+            if not results.empty else np.array([], np.int8)
+        )
+
+        # Normalized name (and "name team" for wrestlers) -> entity ids
+        self._by_name: dict[tuple[str, str], list[int]] = {}
+        for i, (kind, name, team) in enumerate(zip(self._kinds, self._names, self._teams)):
+            keys = {normalize_name(name)}
+            if kind == "wrestler":
+                keys.add(normalize_name(f"{name} {team}"))
+            for key in keys:
+                self._by_name.setdefault((kind, key), []).append(i)
+
+    def __bool__(self) -> bool:
+        return bool(len(self._names))
+
+    def find(self, query: str, kind: str = "team") -> int | None:
+        """Entity id for ``query`` — an exact (normalized) name, else the first name starting with it."""
+        key = normalize_name(query)
+        if not key:
+            return None
+        exact = self._by_name.get((kind, key))
+        if exact:
+            return exact[0]
+        for (k, name), ids in self._by_name.items():
+            if k == kind and name.startswith(key):
+                return ids[0]
+        return None
+
+    def label(self, entity_id: int) -> str:
+        name = self._names[entity_id]
+        return f"{name} ({self._teams[entity_id]})" if self._kinds[entity_id] == "wrestler" else name
+
+    def compare(self, a: int, b: int) -> Comparison:
+        """Direct meetings and common opponents of entities ``a`` and ``b``."""
+        a_start, a_stop = self._bounds(a)
+        b_start, b_stop = self._bounds(b)
+        a_opp, b_opp = self._opponents[a_start:a_stop], self._opponents[b_start:b_stop]
+
+        lo, hi = np.searchsorted(a_opp, [b, b + 1])
+        rows = np.arange(a_start + lo, a_start + hi)
+        direct = self._outcomes[rows]
+        meetings = self.results.iloc[rows][["date", "result", "outcome"]].reset_index(drop=True)
+
+        shared = np.setdiff1d(np.intersect1d(a_opp, b_opp), [a, b])
+        a_rec, b_rec = self._records(a_start, a_opp, shared), self._records(b_start, b_opp, shared)
+        common = pd.DataFrame({
+            "opponent": [self.label(c) for c in shared],
+            "a_record": a_rec,
+            "b_record": b_rec,
+        })
+        return Comparison(
+            a=self.label(a),
+            b=self.label(b),
+            record=(int((direct == 1).sum()), int((direct == -1).sum()), int((direct == 0).sum())),
+            meetings=meetings,
+            common=common,
+        )
+
+    def _bounds(self, entity_id: int) -> tuple[int, int]:
+        start = int(self._first[entity_id])
+        return start, start + int(self._count[entity_id])
+
+    def _records(self, start: int, opponents: np.ndarray, shared: np.ndarray) -> list[str]:
+        """``"W-L"`` (``"W-L-T"`` with ties) against each of ``shared``, from one entity's run."""
+        lo = np.searchsorted(opponents, shared)
+        hi = np.searchsorted(opponents, shared, side="right")
+        records = []
+        for i, j in zip(lo, hi):
+            outcomes = self._outcomes[start + i:start + j]
+            wins, losses = int((outcomes == 1).sum()), int((outcomes == -1).sum())
+            ties = len(outcomes) - wins - losses
+            records.append(f"{wins}-{losses}-{ties}" if ties else f"{wins}-{losses}")
+        return records
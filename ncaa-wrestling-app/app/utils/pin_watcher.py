@@ -0,0 +1,62 @@
+"""Process-wide pin version watcher.
+
+Each watched pin gets a single ``reactive.poll`` created outside any session,
+so one process polls ``pin_meta`` for that pin on its refresh interval no
+matter how many users are connected. When the version changes, every session
+whose reactive graph called the watcher is invalidated and re-reads the pin
+(which ``read_pin`` serves from its shared, version-keyed cache).
+
+Usage inside a module server function::
+
+    live_version = watch_pin("live_scores")
+
+    @reactive.calc
+    def live_data():
+        live_version()          # take a dependency on the pin's version
+        return load_live_scores()
+"""
+
+from typing import Callable
+
+from shiny import reactive
+
+from app.utils.constants import (
+    BRACKET_REFRESH_INTERVAL,
+    DASHBOARD_REFRESH_INTERVAL,
+    LIVE_SCORE_REFRESH_INTERVAL,
+    PIN_BRACKETS,
+    PIN_LIVE_SCORES,
+)
+from app.utils.data_loader import pin_version
+
+_REFRESH_INTERVALS = {
+    PIN_LIVE_SCORES: LIVE_SCORE_REFRESH_INTERVAL,
+    PIN_BRACKETS: BRACKET_REFRESH_INTERVAL,
+}
+
+_watchers: dict[str, Callable[[], str | None]] = {}
+
+
+def watch_pin(name: str) -> Callable[[], str | None]:
+    """Return the shared reactive watcher for a pin.
+
+    Calling the watcher inside a reactive context returns the pin's current
+    version and invalidates that context when a new version is published.
+    Must be called from a server function body (not inside a reactive
+    calc/effect) the first time, so the poller isn't tied to one session.
+    """
+    if name not in _watchers:
+        _watchers[name] = _make_watcher(name, _REFRESH_INTERVALS.get(name, DASHBOARD_REFRESH_INTERVAL))
+    return _watchers[name]
+
+
+def _make_watcher(name: str, interval: float) -> Callable[[], str | None]:
+    # Bypass most of the metadata TTL so a change is seen within one interval.
+    def _poll_version() -> str | None:
+        return pin_version(name, max_age=interval / 2)
+
+    @reactive.poll(_poll_version, interval, session=None)
+    def _version() -> str | None:
+        return pin_version(name)
+
+    return _version
@@ -0,0 +1,62 @@
+"""In-memory index over the ``rankings_history`` pin.
+
+The pin is sorted by ``team_id`` then ``week``, so each team's series is one
+contiguous run of rows. ``RankHistory`` keeps the pin's columns as NumPy
+arrays plus each team's ``[start, end)`` row bounds; a series query is a
+dict lookup and two array slices (views, no copy) regardless of how many
+teams or weeks the history holds.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class RankSeries:
+    """One team's poll history, oldest week first."""
+
+    school: str
+    weeks: np.ndarray   # datetime64[ms]
+    ranks: np.ndarray   # int16; 0 where the team was listed unranked
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+
+class RankHistory:
+    """Team -> rank series lookups over one version of ``rankings_history``."""
+
+    def __init__(self, df: pd.DataFrame):
+        if df.empty:
+            df = pd.DataFrame({"team_id": [], "school": [], "week": [], "rank": []})
+        team_ids = df["team_id"].to_numpy(dtype=np.int64)
+        self._weeks = pd.to_datetime(df["week"]).to_numpy(dtype="datetime64[ms]")
+        self._ranks = pd.to_numeric(df["rank"], errors="coerce").fillna(0).to_numpy(dtype=np.int16)
+
+        # Row bounds of each team's run (the pin guarantees team_id order)
+        starts = np.flatnonzero(np.r_[True, team_ids[1:] != team_ids[:-1]]) if len(team_ids) else np.array([], int)
+        ends = np.r_[starts[1:], len(team_ids)].astype(int)
+        schools = df["school"].astype(str).to_numpy()
+        self._bounds: dict[str, tuple[int, int]] = {
+            schools[s].lower(): (int(s), int(e)) for s, e in zip(starts, ends)
+        }
+        self._names: dict[str, str] = {schools[s].lower(): schools[s] for s in starts}
+        self.weeks = np.unique(self._weeks)
+
+    def __contains__(self, school: str) -> bool:
+        return school.strip().lower() in self._bounds
+
+    def schools(self) -> list[str]:
+        """Every school with at least one poll week, alphabetically."""
+        return sorted(self._names.values())
+
+    def series(self, school: str) -> RankSeries | None:
+        """``school``'s full rank series (case-insensitive), or ``None`` if never ranked."""
+        key = school.strip().lower()
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            return None
+        start, end = bounds
+        return RankSeries(self._names[key], self._weeks[start:end], self._ranks[start:end])
@@ -0,0 +1,101 @@
+"""Lookups over the ``search_index`` / ``search_terms`` pins built by the ETL.
+
+``SearchIndex`` turns the prefix postings into a dict once per pin version.
+A query is normalized the same way the ETL normalized names, split into
+words, and answered with one dict lookup per word plus an intersection of
+the (sorted) postings — no scan over the rankings, standings, stats or
+schedule frames. Hits carry row pointers into those pins, so a page can
+``iloc`` straight to its matching rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+from etl.search_index import MAX_PREFIX, normalize_name
+
+POINTERS = ["rankings_row", "standings_row", "team_stats_row", "individual_stats_row"]
+
+
+class SearchIndex:
+    """Team/wrestler lookups over one version of the search pins."""
+
+    def __init__(self, index: pd.DataFrame, terms: pd.DataFrame):
+        self.entities = index
+        self._postings: dict[str, np.ndarray] = {
+            term: np.asarray(ids, dtype=np.int32)
+            for term, ids in zip(terms.get("term", []), terms.get("entity_ids", []))
+        }
+        # Per-entity arrays, so queries never go through pandas indexing
+        self._aliases = [set(a.split("|")) for a in index.get("aliases", pd.Series(dtype=str)).astype(str)]
+        self._kinds = index["kind"].astype(str).to_numpy() if "kind" in index.columns else np.array([])
+        self._pointers: dict[str, np.ndarray] = {
+            column: pd.to_numeric(index[column], errors="coerce").fillna(-1).to_numpy(dtype=np.int64)
+            for column in POINTERS if column in index.columns
+        }
+        if "schedule_rows" in index.columns:
+            schedule_rows = np.empty(len(index), dtype=object)
+            schedule_rows[:] = [np.asarray(rows, dtype=np.int64) for rows in index["schedule_rows"]]
+            self._pointers["schedule_rows"] = schedule_rows
+
+    def __bool__(self) -> bool:
+        return bool(self._postings)
+
+    def entity_ids(self, query: str, kind: str | None = None) -> np.ndarray:
+        """Ids (= row positions in ``entities``) of every entity matching all words of ``query``."""
+        words = normalize_name(query).split()
+        if not words:
+            return np.array([], dtype=np.int32)
+        ids = None
+        for word in words:
+            posting = self._postings.get(word[:MAX_PREFIX])
+            if posting is None:
+                return np.array([], dtype=np.int32)
+            ids = posting if ids is None else np.intersect1d(ids, posting, assume_unique=True)
+        long_words = [w for w in words if len(w) > MAX_PREFIX]
+        if long_words:
+            ids = np.array([i for i in ids if all(
+                any(t.startswith(w) for alias in self._aliases[i] for t in alias.split()) for w in long_words
+            )], dtype=np.int32)
+        if kind is not None:
+            ids = ids[self._kinds[ids] == kind]
+        return ids
+
+    def lookup(self, query: str, kind: str | None = None, limit: int | None = None) -> pd.DataFrame:
+        """Matching entity rows, most relevant first (ranked teams, other teams, wrestlers)."""
+        ids = self.entity_ids(query, kind)
+        return self.entities.iloc[ids[:limit] if limit else ids]
+
+    def rows(self, query: str, pointer: str, kind: str | None = "team") -> np.ndarray:
+        """Sorted row positions in a pin that ``pointer`` (e.g. ``"rankings_row"``) gives for ``query``."""
+        return self._rows(self.entity_ids(query, kind), pointer)
+
+    def select(self, df: pd.DataFrame, query: str, pointer: str, columns: list[str]) -> pd.DataFrame | None:
+        """The rows of ``df`` matching ``query`` through the index.
+
+        ``columns`` hold the team name of each row; the pointed rows are
+        checked against the hits' aliases. ``None`` is returned when nothing
+        matches (the query may be a mid-word fragment the prefix index can't
+        see) or the rows don't line up (``df`` is from a different run than
+        the index), so the caller can fall back to a text filter.
+        """
+        if not self:
+            return None
+        ids = self.entity_ids(query, "team")
+        rows = self._rows(ids, pointer)
+        if not len(rows) or rows[-1] >= len(df):
+            return None
+        aliases = set().union(*(self._aliases[i] for i in ids))
+        names = [df[column].to_numpy()[rows] for column in columns]
+        for row_names in zip(*names):
+            if not any(pd.notna(n) and normalize_name(n) in aliases for n in row_names):
+                return None
+        return df.iloc[rows]
+
+    def _rows(self, ids: np.ndarray, pointer: str) -> np.ndarray:
+        values = self._pointers.get(pointer)
+        if values is None or not len(ids):
+            return np.array([], dtype=np.int64)
+        if pointer == "schedule_rows":
+            return np.unique(np.concatenate(values[ids]))
+        picked = values[ids]
+        return np.unique(picked[picked >= 0])
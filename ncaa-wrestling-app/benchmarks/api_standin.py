@@ -0,0 +1,383 @@
+"""Local stand-in for the NCAA API and OpenTW API.
+
+Serves every path ``NCAAApiClient`` and ``OpenTWClient`` request —
+scoreboard, rankings, standings, stats, schools-index, ``game/*`` and
+``tournaments/*`` — from recorded JSON fixtures and/or a generated
+``SyntheticSeason``, so the ETL can be run, tested and benchmarked offline.
+
+- **Fixtures**: ``<fixtures>/<url path>.json`` (query strings become
+  ``@page=2`` suffixes). With ``--record`` a missing fixture is fetched from
+  the real API once, saved, and replayed from then on.
+- **Synthetic**: ``--synthetic`` answers anything without a fixture from a
+  deterministic full season (``--teams`` / ``--duals-per-team`` scale it).
+- **Latency**: ``--latency-ms`` plus up to ``--jitter-ms`` per request.
+- **Rate limiting**: more than ``--rate-limit`` requests in any one-second
+  window from a client get ``429 Too Many Requests``, like the public API.
+- **Errors**: ``--error-rate`` answers that fraction of requests with a 5xx;
+  ``--error-path`` (a regex, repeatable) always fails matching paths.
+
+Point the clients at it with ``NCAA_API_BASE_URL`` / ``OPENTW_API_BASE_URL``::
+
+    python benchmarks/api_standin.py --synthetic --port 8787 --now 2026-02-07T20:00-05:00
+    NCAA_API_BASE_URL=http://127.0.0.1:8787 OPENTW_API_BASE_URL=http://127.0.0.1:8787 \\
+        python etl/run_daily.py
+
+Request counts are available from ``GET /__standin/stats`` (and reset with
+``/__standin/reset``); ``/__standin/clock?now=<iso>`` moves the synthetic
+clock. In-process, use ``ApiStandin`` as a context manager.
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from benchmarks.synthetic_season import SyntheticSeason
+from etl.config import NCAA_API, OPENTW_API
+
+logger = logging.getLogger(__name__)
+
+_ROUTES = [
+    ("scoreboard", re.compile(r"^/scoreboard/wrestling/d1/(\d{4})/(\d{2})/(\d{2})/[\w-]+$")),
+    ("rankings", re.compile(r"^/rankings/wrestling/d1/[\w-]+$")),
+    ("standings", re.compile(r"^/standings/wrestling/d1(?:/\d{4})?$")),
+    ("stats", re.compile(r"^/stats/wrestling/d1/current/(team|individual)/(\d+)$")),
+    ("schools-index", re.compile(r"^/schools-index$")),
+    ("game", re.compile(r"^/game/(\d+)/(boxscore|play-by-play|scoring-summary|team-stats)$")),
+    ("tournaments", re.compile(r"^/tournaments/([\w-]+)/([\w-]+)(?:/(matches|brackets))?$")),
+]
+
+
+class ApiStandin:
+    """Replay/synthetic HTTP server for the NCAA and OpenTW APIs.
+
+    Args:
+        fixtures_dir: Directory of recorded responses (optional).
+        synthetic: Season to answer from when no fixture matches (optional).
+        record: Fetch and save missing fixtures from the real APIs.
+        latency_ms / jitter_ms: Added delay per request.
+        rate_limit: Max requests per second per client; ``0`` disables the limit.
+        error_rate: Fraction of requests answered with a random 5xx.
+        error_paths: Regexes of paths that always return 500.
+        now: Fixed clock for synthetic responses (defaults to the real time).
+            Can be reassigned while running to move through a game day.
+        seed: Seed for latency jitter and error injection.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: str | Path | None = None,
+        synthetic: SyntheticSeason | None = None,
+        record: bool = False,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit: float = 5.0,
+        error_rate: float = 0.0,
+        error_paths: list[str] | None = None,
+        now: datetime | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+    ):
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else None
+        self.synthetic = synthetic
+        self.record = record
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.error_paths = [re.compile(p) for p in error_paths or []]
+        self.now = now
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent: dict[str, deque] = {}
+        self._requests: Counter = Counter()
+        self._statuses: Counter = Counter()
+        self._bytes = 0
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ApiStandin":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("API stand-in listening on %s", self.url)
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        logger.info("API stand-in listening on %s", self.url)
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ApiStandin":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> dict:
+        """Requests per route, responses per status code and bytes served."""
+        with self._lock:
+            return {
+                "requests": dict(self._requests),
+                "statuses": {str(k): v for k, v in self._statuses.items()},
+                "total": sum(self._requests.values()),
+                "bytes": self._bytes,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._statuses.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def handle(self, client: str, path: str, query: dict[str, str]) -> tuple[int, object]:
+        """Return ``(status, json_body)`` for one request."""
+        route = _route_name(path)
+        if self._rate_limited(client):
+            self._count(route, 429)
+            return 429, {"message": "Too many requests"}
+
+        delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else self.latency_ms
+        if delay:
+            time.sleep(delay / 1000)
+
+        if any(p.search(path) for p in self.error_paths):
+            self._count(route, 500)
+            return 500, {"message": "Injected error"}
+        if self.error_rate and self._rng.random() < self.error_rate:
+            status = self._rng.choice([500, 502, 503])
+            self._count(route, status)
+            return status, {"message": "Injected error"}
+
+        body = self._fixture(path, query)
+        if body is None and self.synthetic is not None:
+            body = self._synthetic(path, query)
+        if body is None and self.record:
+            body = self._record(path, query)
+        status = 200 if body is not None else 404
+        self._count(route, status)
+        return status, body if body is not None else {"message": "Not found"}
+
+    def _rate_limited(self, client: str) -> bool:
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            window = self._recent.setdefault(client, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= self.rate_limit:
+                return True
+            window.append(now)
+            return False
+
+    def _count(self, route: str, status: int) -> None:
+        with self._lock:
+            self._requests[route] += 1
+            self._statuses[status] += 1
+
+    def _count_bytes(self, size: int) -> None:
+        with self._lock:
+            self._bytes += size
+
+    def _fixture_path(self, path: str, query: dict[str, str]) -> Path | None:
+        if self.fixtures_dir is None:
+            return None
+        name = path.strip("/") or "index"
+        if query:
+            name += "@" + urlencode(sorted(query.items()))
+        return self.fixtures_dir / f"{name}.json"
+
+    def _fixture(self, path: str, query: dict[str, str]):
+        fixture = self._fixture_path(path, query)
+        if fixture is None or not fixture.is_file():
+            return None
+        return json.loads(fixture.read_text())
+
+    def _record(self, path: str, query: dict[str, str]):
+        fixture = self._fixture_path(path, query)
+        base = OPENTW_API["base_url"] if path.startswith("/tournaments/") else NCAA_API["base_url"]
+        try:
+            resp = httpx.get(f"{base}{path}", params=query, timeout=NCAA_API["timeout_seconds"])
+            resp.raise_for_status()
+            body = resp.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.warning("Could not record %s: %s", path, exc)
+            return None
+        if fixture is not None:
+            fixture.parent.mkdir(parents=True, exist_ok=True)
+            fixture.write_text(json.dumps(body))
+            logger.info("Recorded %s", fixture)
+        return body
+
+    def _synthetic(self, path: str, query: dict[str, str]):
+        season = self.synthetic
+        now = self.now or datetime.now(timezone.utc)
+        for name, pattern in _ROUTES:
+            m = pattern.match(path)
+            if not m:
+                continue
+            if name == "scoreboard":
+                return season.scoreboard(date(*map(int, m.groups())), now)
+            if name == "rankings":
+                return season.rankings(now)
+            if name == "standings":
+                return season.standings(now)
+            if name == "stats":
+                kind, stat_id = m.group(1), int(m.group(2))
+                page = int(query.get("page", 1))
+                if kind == "team":
+                    return season.team_stats(stat_id, page, now)
+                return season.individual_stats(stat_id, page, now)
+            if name == "schools-index":
+                return season.schools_index()
+            if name == "game":
+                game_id, kind = m.groups()
+                return {
+                    "boxscore": season.boxscore,
+                    "play-by-play": season.play_by_play,
+                    "scoring-summary": season.scoring_summary,
+                    "team-stats": season.game_team_stats,
+                }[kind](game_id, now)
+            if name == "tournaments":
+                _, tournament_id, kind = m.groups()
+                if tournament_id != season.tournament_id:
+                    return None
+                if kind == "matches":
+                    return season.tournament_matches(now)
+                if kind == "brackets":
+                    return season.tournament_brackets(now)
+                return season.tournament()
+        return None
+
+
+def _route_name(path: str) -> str:
+    for name, pattern in _ROUTES:
+        m = pattern.match(path)
+        if m:
+            if name == "game":
+                return f"game/{m.group(2)}"
+            if name == "tournaments" and m.group(3):
+                return f"tournaments/{m.group(3)}"
+            return name
+    return "other"
+
+
+def _handler_for(standin: ApiStandin) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = dict(parse_qsl(parts.query))
+            if parts.path == "/__standin/stats":
+                return self._send(200, standin.stats())
+            if parts.path == "/__standin/reset":
+                standin.reset_stats()
+                return self._send(200, {"reset": True})
+            if parts.path == "/__standin/clock":
+                if "now" in query:
+                    standin.now = datetime.fromisoformat(query["now"])
+                return self._send(200, {"now": standin.now.isoformat() if standin.now else None})
+            status, body = standin.handle(self.client_address[0], parts.path, query)
+            standin._count_bytes(self._send(status, body, retry_after=status == 429))
+
+        def _send(self, status: int, body, retry_after: bool = False) -> int:
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            if retry_after:
+                self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(payload)
+            return len(payload)
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    return Handler
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Local stand-in for the NCAA and OpenTW APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--fixtures", type=Path, help="Directory of recorded JSON responses.")
+    parser.add_argument("--record", action="store_true",
+                        help="Fetch and save responses missing from --fixtures from the real APIs.")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Answer requests without a fixture from a generated season.")
+    parser.add_argument("--season", type=int, default=2026)
+    parser.add_argument("--teams", type=int, default=75)
+    parser.add_argument("--duals-per-team", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--now", type=datetime.fromisoformat,
+                        help="Freeze the synthetic clock at this ISO time (e.g. 2026-02-07T20:00-05:00).")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=5.0,
+                        help="Requests per second per client before 429s (0 disables).")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-path", action="append", default=[],
+                        help="Regex of paths that always return 500 (repeatable).")
+    args = parser.parse_args()
+
+    standin = ApiStandin(
+        fixtures_dir=args.fixtures,
+        synthetic=SyntheticSeason(args.season, args.teams, args.duals_per_team, args.seed)
+        if args.synthetic else None,
+        record=args.record,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        error_paths=args.error_path,
+        now=args.now,
+        host=args.host,
+        port=args.port,
+        seed=args.seed,
+    )
+    print(f"NCAA_API_BASE_URL={standin.url} OPENTW_API_BASE_URL={standin.url}", flush=True)
+    standin.serve_forever()
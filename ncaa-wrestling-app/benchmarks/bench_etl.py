@@ -0,0 +1,220 @@
+"""End-to-end benchmark of the daily and live-score ETL.
+
+Runs ``run_daily_etl`` and ``fetch_live_scores`` against the local API
+stand-in (``benchmarks/api_standin.py``, started as a subprocess serving a
+synthetic season) and a temporary ``board_folder``, for several season sizes.
+For each stage it reports:
+
+- wall time,
+- API requests, per route, and how many were rate limited (429),
+- bytes written to the board and pin versions created,
+- peak Python memory (``tracemalloc``).
+
+Stages, all on the season's busiest game day:
+
+- ``daily_cold``: first daily run against an empty board,
+- ``daily_warm``: the same run again (incremental schedule, unchanged pins skipped),
+- ``live``: ``--live-polls`` cron-style live-score runs, 15 minutes apart.
+
+Results are compared against ``benchmarks/baselines/etl.json``. A stage
+regresses if it makes more requests or creates more versions than the
+baseline, or is more than ``--tolerance`` slower / larger in peak memory.
+The exit code is 1 when anything regressed.
+
+Usage::
+
+    python benchmarks/bench_etl.py                        # compare to the baseline
+    python benchmarks/bench_etl.py --teams 75 150 --save-baseline
+    python benchmarks/bench_etl.py --latency-ms 80 --json results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, time as dtime, timedelta
+from pathlib import Path
+
+import httpx
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from benchmarks.synthetic_season import ET, SyntheticSeason
+from etl.run_daily import run_daily_etl
+from etl.run_live import fetch_live_scores
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "etl.json"
+_STANDIN = Path(__file__).resolve().parent / "api_standin.py"
+
+# Metrics that are deterministic for a given season: any increase is a regression.
+_EXACT_METRICS = ("requests", "versions_created")
+# Metrics that vary run to run: allowed to grow by ``tolerance``.
+_NOISY_METRICS = ("wall_s", "peak_mb")
+
+
+class StandinProcess:
+    """The API stand-in running in a subprocess, so it doesn't share our GIL or heap."""
+
+    def __init__(self, season: SyntheticSeason, now: datetime, latency_ms: float):
+        cmd = [
+            sys.executable, str(_STANDIN), "--synthetic", "--port", "0",
+            "--season", str(season.season), "--teams", str(season.n_teams),
+            "--duals-per-team", str(season.duals_per_team), "--seed", str(season.seed),
+            "--now", now.isoformat(), "--latency-ms", str(latency_ms),
+        ]
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        line = self._proc.stdout.readline()
+        self.url = line.split()[0].split("=", 1)[1]
+
+    def set_clock(self, now: datetime) -> None:
+        httpx.get(f"{self.url}/__standin/clock", params={"now": now.isoformat()})
+
+    def reset_stats(self) -> None:
+        httpx.get(f"{self.url}/__standin/reset")
+
+    def stats(self) -> dict:
+        return httpx.get(f"{self.url}/__standin/stats").json()
+
+    def close(self) -> None:
+        self._proc.terminate()
+        self._proc.wait()
+
+
+def board_usage(board_dir: Path) -> tuple[int, set[str]]:
+    """Total bytes under a folder board and the set of ``pin/version`` directories.
+
+    The season archive (``archive/``) counts towards bytes but not versions.
+    """
+    size = sum(f.stat().st_size for f in board_dir.rglob("*") if f.is_file())
+    versions = {f"{p.name}/{v.name}" for p in board_dir.iterdir() if p.is_dir() and p.name != "archive"
+                for v in p.iterdir() if v.is_dir()}
+    return size, versions
+
+
+def measure(stage, standin: StandinProcess, board_dir: Path) -> dict:
+    """Run ``stage()`` and collect its metrics."""
+    size_before, versions_before = board_usage(board_dir)
+    standin.reset_stats()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        stage()  # pins prints a banner for every write
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size_after, versions_after = board_usage(board_dir)
+    stats = standin.stats()
+    return {
+        "wall_s": round(wall, 3),
+        "requests": stats["total"],
+        "rate_limited": stats["statuses"].get("429", 0),
+        "by_route": stats["requests"],
+        "bytes_written": max(size_after - size_before, 0),
+        "versions_created": len(versions_after - versions_before),
+        "peak_mb": round(peak / 1e6, 2),
+    }
+
+
+def run_size(teams: int, live_polls: int, latency_ms: float) -> dict[str, dict]:
+    """Benchmark every stage for one season size."""
+    season = SyntheticSeason(teams=teams)
+    by_date: dict = {}
+    for g in season.games:
+        by_date.setdefault(g["date"], []).append(g)
+    game_day = max(by_date, key=lambda d: (len(by_date[d]), d))
+    first_start = min(g["start"] for g in by_date[game_day])
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as board:
+        board_dir = Path(board)
+        standin = StandinProcess(season, datetime.combine(game_day, dtime(6), tzinfo=ET), latency_ms)
+        os.environ["NCAA_API_BASE_URL"] = standin.url
+        os.environ["OPENTW_API_BASE_URL"] = standin.url
+        os.environ["NCAA_PINS_DIR"] = board
+        try:
+            results["daily_cold"] = measure(lambda: run_daily_etl(today=game_day), standin, board_dir)
+            results["daily_warm"] = measure(lambda: run_daily_etl(today=game_day), standin, board_dir)
+
+            def live():
+                for i in range(live_polls):
+                    standin.set_clock(first_start + timedelta(minutes=15 * i - 15))
+                    fetch_live_scores(today=game_day)
+
+            results["live"] = measure(live, standin, board_dir)
+        finally:
+            standin.close()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Describe every metric that regressed against the baseline."""
+    regressions = []
+    for size, stages in results.items():
+        for stage, metrics in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if base is None:
+                continue
+            for key in _EXACT_METRICS:
+                if metrics[key] > base[key]:
+                    regressions.append(f"{size} teams / {stage}: {key} {base[key]} -> {metrics[key]}")
+            for key in _NOISY_METRICS:
+                if metrics[key] > base[key] * (1 + tolerance):
+                    regressions.append(
+                        f"{size} teams / {stage}: {key} {base[key]} -> {metrics[key]} "
+                        f"(+{(metrics[key] / base[key] - 1) * 100:.0f}%)"
+                    )
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    print(f"{'teams':>6} {'stage':<11} {'wall_s':>8} {'requests':>9} {'429s':>5} "
+          f"{'written_kb':>11} {'versions':>9} {'peak_mb':>8}")
+    for size, stages in results.items():
+        for stage, m in stages.items():
+            print(f"{size:>6} {stage:<11} {m['wall_s']:>8.2f} {m['requests']:>9} {m['rate_limited']:>5} "
+                  f"{m['bytes_written'] / 1024:>11.1f} {m['versions_created']:>9} {m['peak_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the daily and live-score ETL end to end.")
+    parser.add_argument("--teams", type=int, nargs="+", default=[75, 150, 300],
+                        help="Season sizes (number of teams) to run.")
+    parser.add_argument("--live-polls", type=int, default=12)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Latency the stand-in adds to every request.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed growth in wall time and peak memory before flagging a regression.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write these results as the new baseline instead of comparing.")
+    parser.add_argument("--json", type=Path, help="Also write the full results to this file.")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)  # the ETL logs every pin write at INFO
+    results = {str(n): run_size(n, args.live_polls, args.latency_ms) for n in args.teams}
+    print_table(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+    elif args.baseline.exists():
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
@@ -0,0 +1,138 @@
+"""Benchmark table/card formatting: row-wise helpers vs. vectorized formatters.
+
+Builds a synthetic schedule and times the display columns the Schedule,
+Dashboard, Rankings and Live Scores pages build, once with the per-row
+helpers mapped over the frame and once with ``app.components.formatters``.
+
+Usage::
+
+    python benchmarks/bench_formatters.py            # 5,000 rows
+    python benchmarks/bench_formatters.py --rows 20000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from htmltools import tags
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from app.components.formatters import (
+    matchup_column,
+    movement_indicators,
+    rank_badges,
+    score_cards_html,
+    score_column,
+)
+from app.components.value_boxes import movement_indicator, rank_badge_html
+from etl.transformers.scores import classify_game_state
+
+
+def synthetic_schedule(rows: int, seed: int = 0) -> pd.DataFrame:
+    """A schedule/live-scores shaped frame with ``rows`` games."""
+    rng = np.random.default_rng(seed)
+    teams = np.array([f"Team {i}" for i in range(300)])
+    ranks = rng.integers(0, 34, size=(2, rows)).astype(float)
+    ranks[ranks > 25] = np.nan
+    scores = rng.integers(0, 40, size=(2, rows)).astype(float)
+    states = rng.choice(["pre", "live", "final"], size=rows)
+    scores[:, states == "pre"] = np.nan
+    return pd.DataFrame({
+        "game_id": [str(6_000_000 + i) for i in range(rows)],
+        "game_state": states,
+        "status": [classify_game_state(s) for s in states],
+        "start_time": "7:00PM ET",
+        "network": rng.choice(["ESPN", "BTN", "FloWrestling", ""], size=rows),
+        "away_team": rng.choice(teams, size=rows),
+        "home_team": rng.choice(teams, size=rows),
+        "away_rank": ranks[0],
+        "home_rank": ranks[1],
+        "away_score": scores[0],
+        "home_score": scores[1],
+        "away_winner": scores[0] > scores[1],
+        "home_winner": scores[1] > scores[0],
+        "rank": np.arange(1, rows + 1),
+        "movement": rng.integers(-5, 6, size=rows),
+    })
+
+
+def rowwise(df: pd.DataFrame) -> None:
+    def matchup(row):
+        ar = f"#{int(row['away_rank'])} " if pd.notna(row["away_rank"]) else ""
+        hr = f"#{int(row['home_rank'])} " if pd.notna(row["home_rank"]) else ""
+        return f"{ar}{row['away_team']}  @  {hr}{row['home_team']}"
+
+    def score(row):
+        if row["status"] == "Final" and pd.notna(row["away_score"]):
+            return f"{int(row['away_score'])} - {int(row['home_score'])}"
+        return ""
+
+    df.apply(matchup, axis=1)
+    df.apply(score, axis=1)
+    df["rank"].apply(rank_badge_html)
+    df["movement"].apply(movement_indicator)
+    for _, row in df.iterrows():
+        str(score_card(row))
+
+
+def score_card(row: pd.Series):
+    """One card built with ``htmltools`` tags — how the page rendered cards before ``score_cards_html``."""
+    def team_row(side: str):
+        rank, score, winner = row[f"{side}_rank"], row[f"{side}_score"], bool(row[f"{side}_winner"])
+        suffix = " winner" if winner else ""
+        return tags.div(
+            tags.div(tags.span(f"#{int(rank)} ", class_="team-rank") if pd.notna(rank) else "",
+                     tags.span(row[f"{side}_team"], class_="team-name" + suffix)),
+            tags.span("" if pd.isna(score) else str(int(score)), class_="team-score" + suffix),
+            class_="team-row",
+        )
+
+    if row["status"] == "Live":
+        badge = tags.span(tags.span(class_="live-dot"), " LIVE", class_="live-badge")
+    elif row["status"] == "Final":
+        badge = tags.span("FINAL", style="font-weight:700; font-size:0.8rem; color:#1a2744;")
+    else:
+        badge = tags.span(row["start_time"], style="font-size:0.85rem; color:#7f8c8d;")
+    return tags.div(
+        team_row("away"), team_row("home"),
+        tags.div(badge, tags.span(row["network"]), class_="game-info"),
+        class_=f"score-card {row['status'].lower()}",
+        data_key=row["game_id"], data_game_id=row["game_id"],
+    )
+
+
+def vectorized(df: pd.DataFrame) -> None:
+    matchup_column(df, separator="  @  ")
+    score_column(df, separator=" - ", mask=df["status"] == "Final")
+    rank_badges(df["rank"])
+    movement_indicators(df["movement"])
+    score_cards_html(df)
+
+
+def best_of(fn, df: pd.DataFrame, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_schedule(args.rows)
+    slow = best_of(rowwise, df, args.repeat)
+    fast = best_of(vectorized, df, args.repeat)
+    print(f"rows={args.rows}")
+    print(f"  row-wise:   {slow * 1000:9.1f} ms")
+    print(f"  vectorized: {fast * 1000:9.1f} ms  ({slow / fast:.0f}x faster)")
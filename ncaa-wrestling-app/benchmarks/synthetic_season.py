@@ -0,0 +1,663 @@
+"""Deterministic synthetic NCAA wrestling season for the local API stand-in.
+
+``SyntheticSeason`` builds a full season — teams, rosters, a dual-meet
+schedule, bout-by-bout results and an NCAA Championships bracket — from a
+seed, and renders the JSON the NCAA API and OpenTW API would return for it at
+any point in time. Everything is derived from ``(seed, key)``, so two runs
+with the same arguments serve byte-identical responses.
+
+Game states follow the clock passed to each method: duals before ``now`` are
+final, a dual is live for ``DUAL_MINUTES`` after its start (revealing one
+bout every ``BOUT_MINUTES``) and later ones are pre. Championship matches
+complete round by round over the tournament weekend in the same way.
+"""
+
+import json
+import random
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+WEIGHT_CLASSES = [125, 133, 141, 149, 157, 165, 174, 184, 197, 285]
+
+BOUT_MINUTES = 9
+DUAL_MINUTES = BOUT_MINUTES * len(WEIGHT_CLASSES)
+STATS_PAGE_SIZE = 50
+RANKED_TEAMS = 25
+
+ET = timezone(timedelta(hours=-5))
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+_NETWORKS = ["ESPN+", "Big Ten Network", "B1G+", "FloWrestling", "ACC Network", "ESPNU", ""]
+_FIRST_NAMES = [
+    "Aaron", "Brady", "Carter", "Dean", "Ethan", "Finn", "Gable", "Hunter", "Isaac", "Jax",
+    "Kyle", "Levi", "Mason", "Nate", "Owen", "Parker", "Quinn", "Ryan", "Spencer", "Trent",
+    "Vito", "Wyatt", "Yianni", "Zach",
+]
+_LAST_NAMES = [
+    "Anderson", "Brands", "Cassar", "Dake", "Eierman", "Foley", "Gomez", "Hall", "Iszler",
+    "Jordan", "Keckeisen", "Lee", "Mendez", "Nickal", "O'Toole", "Parris", "Ramos", "Steveson",
+    "Taylor", "Van Ness", "Woods", "Yarbrough", "Zeerip",
+]
+
+# (code, result label, team points in a dual, weight)
+_DECISIONS = [
+    ("DEC", "Dec", 3, 0.55),
+    ("MD", "MD", 4, 0.2),
+    ("TF", "TF", 5, 0.12),
+    ("FALL", "Fall", 6, 0.13),
+]
+
+# Championship bracket rounds in the order they are wrestled, with the
+# TrackWrestling round labels OpenTW passes through.
+CHAMPIONSHIP_ROUNDS = [
+    ("C1", "Champ. Round 1"),
+    ("C2", "Champ. Round 2"),
+    ("CR1", "Cons. Round 1"),
+    ("QF", "Quarterfinal"),
+    ("CR2", "Cons. Round 2"),
+    ("CR3", "Cons. Round 3"),
+    ("SF", "Semifinal"),
+    ("CR4", "Cons. Round 4"),
+    ("CQF", "Cons. Quarterfinal"),
+    ("CSF", "Cons. Semifinal"),
+    ("P7", "7th Place Match"),
+    ("P5", "5th Place Match"),
+    ("P3", "3rd Place Match"),
+    ("F", "1st Place Match"),
+]
+BRACKET_SIZE = 32
+_ROUND_HOURS = 4
+
+
+def _rng(*key) -> random.Random:
+    return random.Random(":".join(str(k) for k in key))
+
+
+def _short_name(name: str) -> str:
+    return name.replace(" State", " St.")
+
+
+def _seo(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def seed_order(size: int) -> list[int]:
+    """Seeds in bracket-slot order, e.g. ``[1, 4, 2, 3]`` for 4 (1 v 4, 2 v 3)."""
+    order = [1]
+    while len(order) < size:
+        n = len(order) * 2
+        order = [s for seed in order for s in (seed, n + 1 - seed)]
+    return order
+
+
+class SyntheticSeason:
+    """A generated season that renders NCAA/OpenTW API responses.
+
+    Args:
+        season: Season year (the 2025-26 season is ``2026``).
+        teams: Number of teams. The first ones come from ``data/conferences.json``.
+        duals_per_team: Approximate number of duals each team wrestles.
+        seed: Seed for every random choice.
+    """
+
+    def __init__(self, season: int = 2026, teams: int = 75, duals_per_team: int = 16, seed: int = 0):
+        self.season = season
+        self.n_teams = teams
+        self.duals_per_team = duals_per_team
+        self.seed = seed
+        self.tournament_id = f"ncaa-{season}"
+        self.tournament_start = self._third_thursday_of_march()
+
+    # ------------------------------------------------------------------
+    # Teams, rosters and schedule
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def teams(self) -> list[dict]:
+        conferences = json.loads((_DATA_DIR / "conferences.json").read_text())
+        named = [(school, conf["name"]) for conf in conferences for school in conf["schools"]]
+        teams = []
+        for i in range(self.n_teams):
+            name, conference = named[i] if i < len(named) else (f"Team {i + 1}", "Independent")
+            rng = _rng(self.seed, "team", i)
+            teams.append({
+                "index": i,
+                "name": name,
+                "short": _short_name(name),
+                "full": f"{name} University" if "University" not in name else name,
+                "seo": _seo(name),
+                "conference": conference,
+                "strength": rng.gauss(0.0, 1.0),
+            })
+        return teams
+
+    @lru_cache(maxsize=None)
+    def wrestler(self, team: int, weight: int) -> dict:
+        """The team's starter at ``weight``."""
+        rng = _rng(self.seed, "wrestler", team, weight)
+        return {
+            "id": f"{self.teams[team]['seo']}-{weight}",
+            "name": f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            "team": self.teams[team]["short"],
+            "weight": weight,
+            "rating": self.teams[team]["strength"] + rng.gauss(0.0, 0.8),
+        }
+
+    @cached_property
+    def games(self) -> list[dict]:
+        """Every dual of the season, sorted by start time."""
+        first = date(self.season - 1, 11, 1)
+        last = date(self.season, 2, 28)
+        days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        fridays = [d for d in days if d.weekday() == 4]
+        games = []
+        for week in range(self.duals_per_team):
+            # Spread the rounds evenly over the season's weekends
+            friday = fridays[week * len(fridays) // self.duals_per_team]
+            rng = _rng(self.seed, "week", week)
+            order = list(range(self.n_teams))
+            rng.shuffle(order)
+            for slot, (away, home) in enumerate(zip(order[::2], order[1::2])):
+                day = friday + timedelta(days=rng.choice([0, 1, 1, 2]))
+                hour = rng.choice([13, 14, 18, 19, 19, 20])
+                start = datetime.combine(day, time(hour), tzinfo=ET)
+                games.append({
+                    "game_id": str(6_000_000 + week * 1000 + slot),
+                    "date": day,
+                    "start": start,
+                    "away": away,
+                    "home": home,
+                    "network": rng.choice(_NETWORKS),
+                    "location": f"{self.teams[home]['name']} Arena",
+                })
+        games.sort(key=lambda g: (g["start"], g["game_id"]))
+        return games
+
+    @cached_property
+    def _games_by_id(self) -> dict[str, dict]:
+        return {g["game_id"]: g for g in self.games}
+
+    @cached_property
+    def _games_by_date(self) -> dict[date, list[dict]]:
+        by_date: dict[date, list[dict]] = {}
+        for g in self.games:
+            by_date.setdefault(g["date"], []).append(g)
+        return by_date
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @lru_cache(maxsize=None)
+    def _bouts(self, game_id: str) -> tuple[dict, ...]:
+        """Full bout-by-bout result of a dual (as if it were final)."""
+        game = self._games_by_id[game_id]
+        rng = _rng(self.seed, "bouts", game_id)
+        start_at = rng.randrange(len(WEIGHT_CLASSES))  # duals start at a drawn weight
+        order = WEIGHT_CLASSES[start_at:] + WEIGHT_CLASSES[:start_at]
+        away_score = home_score = 0
+        bouts = []
+        for number, weight in enumerate(order, start=1):
+            away = self.wrestler(game["away"], weight)
+            home = self.wrestler(game["home"], weight)
+            home_wins = rng.random() < _win_probability(home["rating"] + 0.1, away["rating"])
+            code, label, points, detail = _draw_decision(rng, abs(home["rating"] - away["rating"]))
+            if home_wins:
+                home_score += points
+            else:
+                away_score += points
+            bouts.append({
+                "boutNumber": number,
+                "weightClass": str(weight),
+                "winner": "home" if home_wins else "away",
+                "decision": code,
+                "result": f"{label} {detail}",
+                "teamPoints": points,
+                "away": {"id": away["id"], "name": away["name"], "team": away["team"]},
+                "home": {"id": home["id"], "name": home["name"], "team": home["team"]},
+                "awayTeamScore": away_score,
+                "homeTeamScore": home_score,
+            })
+        return tuple(bouts)
+
+    def game_progress(self, game_id: str, now: datetime) -> tuple[str, list[dict]]:
+        """``(state, completed_bouts)`` for a dual at ``now``."""
+        game = self._games_by_id[game_id]
+        elapsed = (now - game["start"]).total_seconds() / 60
+        if elapsed < 0:
+            return "pre", []
+        bouts = list(self._bouts(game_id))
+        if elapsed >= DUAL_MINUTES:
+            return "final", bouts
+        return "live", bouts[: int(elapsed // BOUT_MINUTES)]
+
+    @lru_cache(maxsize=None)
+    def _records_before(self, day: date) -> tuple[tuple[int, int, int, int], ...]:
+        """``(wins, losses, conf_wins, conf_losses)`` per team from duals before ``day``."""
+        records = [[0, 0, 0, 0] for _ in self.teams]
+        for g in self.games:
+            if g["date"] >= day:
+                break
+            bouts = self._bouts(g["game_id"])
+            home_won = bouts[-1]["homeTeamScore"] > bouts[-1]["awayTeamScore"]
+            winner, loser = (g["home"], g["away"]) if home_won else (g["away"], g["home"])
+            records[winner][0] += 1
+            records[loser][1] += 1
+            if self.teams[winner]["conference"] == self.teams[loser]["conference"]:
+                records[winner][2] += 1
+                records[loser][3] += 1
+        return tuple(tuple(r) for r in records)
+
+    def _poll_ranks(self, poll_date: date) -> list[int]:
+        """Team indices in poll order for the poll released on ``poll_date``."""
+        records = self._records_before(poll_date)
+
+        def score(i):
+            wins, losses = records[i][:2]
+            return self.teams[i]["strength"] + 0.15 * (wins - losses)
+
+        return sorted(range(self.n_teams), key=score, reverse=True)
+
+    @staticmethod
+    def _poll_date(now: datetime) -> date:
+        """Most recent Monday poll release on or before ``now``."""
+        today = now.astimezone(ET).date()
+        return today - timedelta(days=today.weekday())
+
+    def _current_ranks(self, now: datetime) -> dict[int, int]:
+        order = self._poll_ranks(self._poll_date(now))
+        return {team: rank for rank, team in enumerate(order[:RANKED_TEAMS], start=1)}
+
+    # ------------------------------------------------------------------
+    # NCAA API responses
+    # ------------------------------------------------------------------
+
+    def scoreboard(self, day: date, now: datetime) -> dict:
+        """``/scoreboard/wrestling/d1/{y}/{m}/{d}/all-conf``."""
+        ranks = self._current_ranks(now)
+        records = self._records_before(now.astimezone(ET).date() + timedelta(days=1))
+        games = []
+        for g in self._games_by_date.get(day, []):
+            state, bouts = self.game_progress(g["game_id"], now)
+            away_score = bouts[-1]["awayTeamScore"] if bouts else 0
+            home_score = bouts[-1]["homeTeamScore"] if bouts else 0
+            sides = {}
+            for side in ("away", "home"):
+                team = self.teams[g[side]]
+                score = away_score if side == "away" else home_score
+                other = home_score if side == "away" else away_score
+                wins, losses = records[team["index"]][:2]
+                sides[side] = {
+                    "score": "" if state == "pre" else str(score),
+                    "names": {"short": team["short"], "full": team["full"], "seo": team["seo"],
+                              "char6": team["short"][:6].upper()},
+                    "rank": str(ranks.get(team["index"], "")),
+                    "winner": state == "final" and score > other,
+                    "description": f"({wins}-{losses})",
+                    "conferences": [{"conferenceName": team["conference"],
+                                     "conferenceSeo": _seo(team["conference"])}],
+                }
+            games.append({"game": {
+                "gameID": g["game_id"],
+                "away": sides["away"],
+                "home": sides["home"],
+                "gameState": state,
+                "startDate": g["date"].strftime("%m-%d-%Y"),
+                "startTime": g["start"].strftime("%-I:%M%p ET"),
+                "startTimeEpoch": str(int(g["start"].timestamp())),
+                "network": g["network"],
+                "finalMessage": "FINAL" if state == "final" else "",
+                "title": f"{sides['away']['names']['short']} {sides['home']['names']['short']}",
+                "currentPeriod": {"final": "FINAL", "live": f"Bout {len(bouts) + 1}", "pre": ""}[state],
+                "contestClock": "0:00" if state != "pre" else "",
+                "url": f"/game/{g['game_id']}",
+                "location": g["location"],
+            }})
+        return {"inputMD5Sum": "", "updated_at": now.isoformat(), "games": games}
+
+    def rankings(self, now: datetime) -> dict:
+        """``/rankings/wrestling/d1/current`` (NWCA Coaches Poll)."""
+        poll_date = self._poll_date(now)
+        order = self._poll_ranks(poll_date)
+        previous = {team: rank for rank, team in enumerate(
+            self._poll_ranks(poll_date - timedelta(days=7))[:RANKED_TEAMS], start=1)}
+        records = self._records_before(poll_date)
+        rows = []
+        for rank, team in enumerate(order[:RANKED_TEAMS], start=1):
+            school = self.teams[team]["short"]
+            if rank == 1:
+                school += " (16)"
+            wins, losses = records[team][:2]
+            rows.append({
+                "RANK": str(rank),
+                "SCHOOL": school,
+                "POINTS": str(16 * (RANKED_TEAMS + 1 - rank)),
+                "PREVIOUS": str(previous.get(team, "NR")),
+                "RECORD": f"{wins}-{losses}",
+            })
+        return {
+            "sport": "Wrestling",
+            "title": "NWCA Coaches Poll",
+            "updated": poll_date.strftime("%B %-d, %Y"),
+            "page": 1,
+            "pages": 1,
+            "data": rows,
+        }
+
+    def standings(self, now: datetime) -> dict:
+        """``/standings/wrestling/d1/{year}``."""
+        records = self._records_before(now.astimezone(ET).date() + timedelta(days=1))
+        blocks: dict[str, list[dict]] = {}
+        for team in self.teams:
+            wins, losses, conf_wins, conf_losses = records[team["index"]]
+            blocks.setdefault(team["conference"], []).append({
+                "School": team["short"],
+                "Conference W": str(conf_wins),
+                "Conference L": str(conf_losses),
+                "Conference Pct": _pct(conf_wins, conf_losses),
+                "Overall W": str(wins),
+                "Overall L": str(losses),
+                "Overall Pct": _pct(wins, losses),
+            })
+        data = []
+        for conference, rows in blocks.items():
+            rows.sort(key=lambda r: (-int(r["Conference W"]), int(r["Conference L"])))
+            data.append({"conference": conference, "standings": rows})
+        return {"sport": "Wrestling", "title": "Standings", "data": data}
+
+    def team_stats(self, stat_id: int, page: int, now: datetime) -> dict:
+        """``/stats/wrestling/d1/current/team/{stat_id}`` (winning percentage)."""
+        records = self._records_before(now.astimezone(ET).date() + timedelta(days=1))
+        rows = []
+        for team in self.teams:
+            wins, losses = records[team["index"]][:2]
+            rows.append({"Team": team["short"], "W": str(wins), "L": str(losses), "T": "0",
+                         "Pct": _pct(wins, losses)})
+        rows.sort(key=lambda r: (-float(r["Pct"]), -int(r["W"])))
+        return _stats_page(rows, page, "Winning Percentage")
+
+    def individual_stats(self, stat_id: int, page: int, now: datetime) -> dict:
+        """``/stats/wrestling/d1/current/individual/{stat_id}`` (wins)."""
+        today = now.astimezone(ET).date()
+        tallies: dict[str, list] = {}
+        for g in self.games:
+            if g["start"] + timedelta(minutes=DUAL_MINUTES) > now or g["date"] > today:
+                break
+            for bout in self._bouts(g["game_id"]):
+                for side in ("away", "home"):
+                    w = bout[side]
+                    entry = tallies.setdefault(w["id"], [w, int(bout["weightClass"]), 0, 0, 0])
+                    if bout["winner"] == side:
+                        entry[2] += 1
+                        entry[4] += bout["decision"] == "FALL"
+                    else:
+                        entry[3] += 1
+        rows = [
+            {"Name": w["name"], "Team": w["team"], "Cl": "Jr.", "Wt": str(weight),
+             "W": str(wins), "L": str(losses), "Falls": str(falls)}
+            for w, weight, wins, losses, falls in tallies.values()
+        ]
+        rows.sort(key=lambda r: (-int(r["W"]), int(r["L"]), r["Name"]))
+        return _stats_page(rows, page, "Wins")
+
+    def schools_index(self) -> list[dict]:
+        """``/schools-index``."""
+        return [{"slug": t["seo"], "name": t["short"], "long": t["full"]} for t in self.teams]
+
+    def boxscore(self, game_id: str, now: datetime) -> dict | None:
+        """``/game/{id}/boxscore``: teams, dual score and every completed bout."""
+        if game_id not in self._games_by_id:
+            return None
+        game = self._games_by_id[game_id]
+        state, bouts = self.game_progress(game_id, now)
+        last = bouts[-1] if bouts else {"awayTeamScore": 0, "homeTeamScore": 0}
+        return {
+            "gameID": game_id,
+            "status": state,
+            "startDate": game["date"].isoformat(),
+            "location": game["location"],
+            "teams": [
+                {"side": side, "teamId": self.teams[game[side]]["seo"],
+                 "nameShort": self.teams[game[side]]["short"],
+                 "score": last[f"{side}TeamScore"]}
+                for side in ("away", "home")
+            ],
+            "bouts": bouts,
+        }
+
+    def play_by_play(self, game_id: str, now: datetime) -> dict | None:
+        """``/game/{id}/play-by-play``: one entry per completed bout."""
+        box = self.boxscore(game_id, now)
+        if box is None:
+            return None
+        plays = [
+            {"boutNumber": b["boutNumber"], "weightClass": b["weightClass"],
+             "description": f"{b[b['winner']]['name']} ({b[b['winner']]['team']}) wins by {b['result']}",
+             "awayTeamScore": b["awayTeamScore"], "homeTeamScore": b["homeTeamScore"]}
+            for b in box["bouts"]
+        ]
+        return {"gameID": game_id, "status": box["status"], "plays": plays}
+
+    def scoring_summary(self, game_id: str, now: datetime) -> dict | None:
+        """``/game/{id}/scoring-summary``: team points per completed bout."""
+        box = self.boxscore(game_id, now)
+        if box is None:
+            return None
+        summary = [
+            {"weightClass": b["weightClass"], "winner": b["winner"], "decision": b["decision"],
+             "teamPoints": b["teamPoints"]}
+            for b in box["bouts"]
+        ]
+        return {"gameID": game_id, "status": box["status"], "summary": summary}
+
+    def game_team_stats(self, game_id: str, now: datetime) -> dict | None:
+        """``/game/{id}/team-stats``: wins by decision type per team."""
+        box = self.boxscore(game_id, now)
+        if box is None:
+            return None
+        teams = []
+        for side in ("away", "home"):
+            won = [b for b in box["bouts"] if b["winner"] == side]
+            teams.append({
+                "side": side,
+                "boutsWon": len(won),
+                **{code.lower(): sum(b["decision"] == code for b in won) for code, *_ in _DECISIONS},
+            })
+        return {"gameID": game_id, "status": box["status"], "teams": teams}
+
+    # ------------------------------------------------------------------
+    # NCAA Championships (OpenTW API responses)
+    # ------------------------------------------------------------------
+
+    def _third_thursday_of_march(self) -> date:
+        first = date(self.season, 3, 1)
+        return first + timedelta(days=(3 - first.weekday()) % 7 + 14)
+
+    def round_starts(self) -> dict[str, datetime]:
+        """Start time of each championship round."""
+        opening = datetime.combine(self.tournament_start, time(12), tzinfo=ET)
+        return {
+            code: opening + timedelta(hours=_ROUND_HOURS * i)
+            for i, (code, _) in enumerate(CHAMPIONSHIP_ROUNDS)
+        }
+
+    @lru_cache(maxsize=None)
+    def _bracket(self, weight: int) -> tuple[tuple[dict, ...], tuple[dict, ...]]:
+        """``(entrants, matches)`` for one weight class, fully wrestled out."""
+        field = sorted(
+            (self.wrestler(t, weight) for t in range(self.n_teams)),
+            key=lambda w: w["rating"], reverse=True,
+        )[:BRACKET_SIZE]
+        entrants = tuple({**w, "seed": seed} for seed, w in enumerate(field, start=1))
+        by_seed = {w["seed"]: w for w in entrants}
+
+        matches = {m["id"]: m for m in bracket_template(weight)}
+        slots = seed_order(len(entrants))
+        for i, m in enumerate(m for m in matches.values() if m["round"] == "C1"):
+            m["top"] = by_seed.get(slots[2 * i])
+            m["bottom"] = by_seed.get(slots[2 * i + 1])
+
+        for code, _ in CHAMPIONSHIP_ROUNDS:
+            for m in (m for m in matches.values() if m["round"] == code):
+                top, bottom = m["top"], m["bottom"]
+                if top is None or bottom is None:
+                    winner, loser, result = top or bottom, None, "Bye"
+                else:
+                    rng = _rng(self.seed, "ncaa", m["id"])
+                    top_wins = rng.random() < _win_probability(top["rating"], bottom["rating"])
+                    winner, loser = (top, bottom) if top_wins else (bottom, top)
+                    code_, label, _, detail = _draw_decision(rng, abs(top["rating"] - bottom["rating"]))
+                    result = f"{label} {detail}"
+                    m["decision"] = code_
+                m["winner"], m["loser"], m["result"] = winner, loser, result
+                for target, who in ((m["winner_to"], winner), (m["loser_to"], loser)):
+                    if target:
+                        dest_id, slot = target
+                        matches[dest_id][slot] = who
+        return entrants, tuple(matches.values())
+
+    def tournament(self) -> dict:
+        """``/tournaments/collegiate/{id}``."""
+        end = self.tournament_start + timedelta(days=2)
+        teams = sorted({w["team"] for weight in WEIGHT_CLASSES for w in self._bracket(weight)[0]})
+        return {
+            "id": self.tournament_id,
+            "name": f"{self.season} NCAA Division I Wrestling Championships",
+            "type": "collegiate",
+            "startDate": self.tournament_start.isoformat(),
+            "endDate": end.isoformat(),
+            "weightClasses": [str(w) for w in WEIGHT_CLASSES],
+            "teams": [{"name": t} for t in teams],
+        }
+
+    def tournament_brackets(self, now: datetime) -> list[dict]:
+        """``/tournaments/collegiate/{id}/brackets``: one bracket per weight class."""
+        brackets = []
+        for weight in WEIGHT_CLASSES:
+            entrants, matches = self._bracket(weight)
+            brackets.append({
+                "weightClass": str(weight),
+                "wrestlers": [
+                    {"id": w["id"], "name": w["name"], "team": w["team"], "seed": w["seed"]}
+                    for w in entrants
+                ],
+                "matches": [self._match_json(m, now) for m in matches],
+            })
+        return brackets
+
+    def tournament_matches(self, now: datetime) -> list[dict]:
+        """``/tournaments/collegiate/{id}/matches``: every match with its status and mat."""
+        rows = []
+        for bracket in self.tournament_brackets(now):
+            for m in bracket["matches"]:
+                rows.append({**m, "weightClass": bracket["weightClass"]})
+        return rows
+
+    def _match_json(self, m: dict, now: datetime) -> dict:
+        starts = self.round_starts()
+        weight_pos = WEIGHT_CLASSES.index(m["weight"])
+        match_time = starts[m["round"]] + timedelta(minutes=BOUT_MINUTES * (weight_pos + m["index"]))
+        done = now >= match_time + timedelta(minutes=BOUT_MINUTES)
+        round_open = now >= starts[m["round"]]
+        show_top = round_open or m["round"] == "C1"
+
+        def who(w):
+            return w["id"] if w is not None and show_top else None
+
+        return {
+            "id": m["id"],
+            "round": dict(CHAMPIONSHIP_ROUNDS)[m["round"]],
+            "boutNumber": m["bout"],
+            "mat": (m["index"] % 8) + 1,
+            "status": "final" if done else ("in progress" if now >= match_time else "pre"),
+            "topWrestlerId": who(m["top"]),
+            "bottomWrestlerId": who(m["bottom"]),
+            "winnerId": m["winner"]["id"] if done and m["winner"] else None,
+            "decision": m.get("decision") if done else None,
+            "result": m["result"] if done else None,
+            "winnerTo": m["winner_to"][0] if m["winner_to"] else None,
+            "loserTo": m["loser_to"][0] if m["loser_to"] else None,
+        }
+
+
+def bracket_template(weight: int) -> list[dict]:
+    """Empty 32-man NCAA double-elimination bracket with advancement links.
+
+    Each match has ``winner_to`` / ``loser_to`` set to ``(match_id, "top" |
+    "bottom")`` or ``None``. Consolation pairings cross to the neighbouring
+    championship match so first-round opponents can't meet again right away.
+    """
+    counts = {"C1": 16, "C2": 8, "QF": 4, "SF": 2, "F": 1,
+              "CR1": 8, "CR2": 8, "CR3": 4, "CR4": 4, "CQF": 2, "CSF": 2,
+              "P3": 1, "P5": 1, "P7": 1}
+    matches, bout = {}, 0
+    for code, _ in CHAMPIONSHIP_ROUNDS:
+        for i in range(counts[code]):
+            bout += 1
+            mid = f"{weight}-{code}-{i + 1:02d}"
+            matches[mid] = {"id": mid, "weight": weight, "round": code, "index": i, "bout": bout,
+                            "top": None, "bottom": None, "winner_to": None, "loser_to": None}
+
+    def link(src: str, i: int, kind: str, dst: str, j: int, slot: str) -> None:
+        matches[f"{weight}-{src}-{i + 1:02d}"][kind] = (f"{weight}-{dst}-{j + 1:02d}", slot)
+
+    def halves(src, dst, n, kind="winner_to"):
+        for i in range(n):
+            link(src, i, kind, dst, i // 2, "top" if i % 2 == 0 else "bottom")
+
+    halves("C1", "C2", 16)
+    halves("C2", "QF", 8)
+    halves("QF", "SF", 4)
+    halves("SF", "F", 2)
+    halves("C1", "CR1", 16, "loser_to")
+    for i in range(8):
+        link("CR1", i, "winner_to", "CR2", i, "top")
+        link("C2", i, "loser_to", "CR2", i ^ 1, "bottom")
+    halves("CR2", "CR3", 8)
+    for i in range(4):
+        link("CR3", i, "winner_to", "CR4", i, "top")
+        link("QF", i, "loser_to", "CR4", i ^ 1, "bottom")
+    halves("CR4", "CQF", 4)
+    for i in range(2):
+        link("CQF", i, "winner_to", "CSF", i, "top")
+        link("SF", i, "loser_to", "CSF", i ^ 1, "bottom")
+        link("CQF", i, "loser_to", "P7", 0, "top" if i == 0 else "bottom")
+        link("CSF", i, "winner_to", "P3", 0, "top" if i == 0 else "bottom")
+        link("CSF", i, "loser_to", "P5", 0, "top" if i == 0 else "bottom")
+    return list(matches.values())
+
+
+def _win_probability(rating: float, opponent: float) -> float:
+    return 1.0 / (1.0 + 10 ** ((opponent - rating) / 1.5))
+
+
+def _draw_decision(rng: random.Random, gap: float) -> tuple[str, str, int, str]:
+    """Pick a decision type (bigger rating gaps mean more bonus points) and a score."""
+    weights = [w * (1.0 + gap) ** (i * 0.8) for i, (*_, w) in enumerate(_DECISIONS)]
+    code, label, points, _ = rng.choices(_DECISIONS, weights=weights)[0]
+    if code == "FALL":
+        detail = f"{rng.randint(0, 6)}:{rng.randint(0, 59):02d}"
+    elif code == "TF":
+        detail = f"{rng.randint(15, 19)}-{rng.randint(0, 4)}"
+    elif code == "MD":
+        loser = rng.randint(0, 6)
+        detail = f"{loser + rng.randint(8, 14)}-{loser}"
+    else:
+        loser = rng.randint(0, 5)
+        detail = f"{loser + rng.randint(1, 7)}-{loser}"
+    return code, label, points, detail
+
+
+def _pct(wins: int, losses: int) -> str:
+    return f"{wins / (wins + losses):.3f}" if wins + losses else "0.000"
+
+
+def _stats_page(rows: list[dict], page: int, title: str) -> dict:
+    pages = max(1, -(-len(rows) // STATS_PAGE_SIZE))
+    start = (page - 1) * STATS_PAGE_SIZE
+    ranked = [{"Rank": str(start + i + 1), **row}
+              for i, row in enumerate(rows[start:start + STATS_PAGE_SIZE])]
+    return {"sport": "Wrestling", "title": title, "page": page, "pages": pages, "data": ranked}
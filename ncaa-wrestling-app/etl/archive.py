@@ -0,0 +1,170 @@
+"""Season archive: Hive-partitioned Parquet history of the ETL's results.
+
+The pins are "current only" — ``schedule`` covers a 37-day window and
+``rankings`` is overwritten every week. The archive keeps everything, as a
+Parquet dataset per kind of record under ``pin_cache/archive/``::
+
+    archive/games/season=2026/date=2026-02-07/part-0.parquet
+    archive/rankings/season=2026/date=2026-02-02/part-0.parquet
+    archive/standings/season=2026/date=2026-02-07/part-0.parquet
+
+Each partition is a single file. Appending rewrites only the partitions the
+new rows fall in, deduplicated on the dataset's key (the last write wins), so
+re-running the ETL never duplicates history:
+
+- ``games``: one row per ``game_id``, partitioned by game date,
+- ``rankings``: one row per school per poll week (partitioned by the week's Monday),
+- ``standings``: one snapshot per day.
+
+``read_archive`` reads through ``pyarrow.dataset`` with the season/date
+predicates applied to the partition paths, so a one-season or one-month
+query opens only those directories; column filters are pushed down to the
+Parquet row-group statistics.
+"""
+
+import logging
+import os
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from etl.pin_retention import season_for_date
+from etl.pin_writer import _LOCAL_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("season", pa.int16()), ("date", pa.string())]), flavor="hive",
+)
+
+# dataset -> dedup key columns (partition columns are implied)
+ARCHIVE_KEYS = {
+    "games": ["game_id"],
+    "rankings": ["school"],
+    "standings": ["conference", "team"],
+}
+
+
+def archive_root() -> Path:
+    """``archive/`` next to the local pins board (``pin_cache/`` or ``NCAA_PINS_DIR``)."""
+    return Path(os.environ.get("NCAA_PINS_DIR") or _LOCAL_CACHE_DIR) / "archive"
+
+
+def append_to_archive(dataset: str, df: pd.DataFrame, dates: pd.Series, root: Path | None = None) -> int:
+    """Upsert ``df`` into ``dataset``, partitioned by ``dates`` (one per row).
+
+    Returns the number of partitions rewritten.
+    """
+    if df.empty:
+        return 0
+    keys = ARCHIVE_KEYS[dataset]
+    root = (root or archive_root()) / dataset
+    days = pd.to_datetime(dates, errors="coerce").dt.date
+    df = df[days.notna().to_numpy()]
+    days = days[days.notna()]
+
+    # The partition path carries the date; a "date" column would clash with it.
+    df = df.drop(columns=["date"], errors="ignore")
+    rewritten = 0
+    for day, rows in df.groupby(days.to_numpy(), sort=True):
+        part_dir = root / f"season={season_for_date(day)}" / f"date={day.isoformat()}"
+        path = part_dir / "part-0.parquet"
+        if path.exists():
+            rows = pd.concat([pq.read_table(path).to_pandas(), rows], ignore_index=True)
+        rows = rows.drop_duplicates(subset=keys, keep="last").reset_index(drop=True)
+        part_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pandas(rows, preserve_index=False), tmp)
+        tmp.replace(path)
+        rewritten += 1
+    logger.info("Archive: %d rows into %d '%s' partitions", len(df), rewritten, dataset)
+    return rewritten
+
+
+def archive_daily_results(
+    schedule: pd.DataFrame | None = None,
+    rankings: pd.DataFrame | None = None,
+    standings: pd.DataFrame | None = None,
+    today: date | None = None,
+    root: Path | None = None,
+) -> None:
+    """Append one daily ETL run's frames to the archive."""
+    today = today or date.today()
+    if schedule is not None and not schedule.empty:
+        append_to_archive("games", schedule, schedule["date"], root)
+    if rankings is not None and not rankings.empty:
+        week = today - timedelta(days=today.weekday())
+        append_to_archive("rankings", rankings, pd.Series([week] * len(rankings)), root)
+    if standings is not None and not standings.empty:
+        append_to_archive("standings", standings, pd.Series([today] * len(standings)), root)
+
+
+def read_archive(
+    dataset: str,
+    columns: list[str] | None = None,
+    seasons: list[int] | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    filter: ds.Expression | None = None,
+    root: Path | None = None,
+) -> pd.DataFrame:
+    """Read rows of an archive dataset.
+
+    Args:
+        dataset: ``"games"``, ``"rankings"`` or ``"standings"``.
+        columns: Columns to read (partition columns ``season``/``date`` included
+            if asked for); all columns by default.
+        seasons: Only these seasons' partitions.
+        start / end: Only partitions dated within ``[start, end]``.
+        filter: Extra ``pyarrow.dataset`` expression on data columns, e.g.
+            ``ds.field("home_team") == "Iowa"``.
+
+    Returns:
+        The matching rows; an empty frame if the dataset doesn't exist yet.
+    """
+    path = (root or archive_root()) / dataset
+    if not path.exists():
+        return pd.DataFrame(columns=columns or [])
+
+    expr = _partition_filter(seasons, start, end)
+    if filter is not None:
+        expr = filter if expr is None else expr & filter
+    data = ds.dataset(path, format="parquet", partitioning=PARTITIONING)
+    df = data.to_table(columns=columns, filter=expr).to_pandas()
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def team_games(team: str, seasons: list[int] | None = None, root: Path | None = None) -> pd.DataFrame:
+    """Every archived game involving ``team`` (short name), oldest first."""
+    team_filter = (ds.field("away_team") == team) | (ds.field("home_team") == team)
+    df = read_archive("games", seasons=seasons, filter=team_filter, root=root)
+    return df.sort_values("date").reset_index(drop=True) if not df.empty else df
+
+
+def rank_trajectory(school: str, seasons: list[int] | None = None, root: Path | None = None) -> pd.DataFrame:
+    """``date``/``rank`` of each archived poll week in which ``school`` was ranked."""
+    df = read_archive(
+        "rankings", columns=["season", "date", "rank"], seasons=seasons,
+        filter=ds.field("school") == school, root=root,
+    )
+    return df.sort_values("date").reset_index(drop=True) if not df.empty else df
+
+
+def _partition_filter(seasons, start, end) -> ds.Expression | None:
+    parts = []
+    if seasons:
+        parts.append(ds.field("season").isin([int(s) for s in seasons]))
+    if start is not None:
+        parts.append(ds.field("date") >= start.isoformat())
+    if end is not None:
+        parts.append(ds.field("date") <= end.isoformat())
+    expr = None
+    for part in parts:
+        expr = part if expr is None else expr & part
+    return expr
@@ -0,0 +1,255 @@
+"""Monte Carlo simulation of the NCAA Championships from OpenTW bracket data.
+
+Each weight class's bracket (``OpenTWClient.get_tournament_brackets``,
+parsed into an ``etl.brackets.Bracket``) is compiled into arrays — matches
+in an order where every match follows its feeders, the ``(match, slot)``
+each winner and loser advances to, entry wrestlers, and already-decided
+results. A simulation then walks the matches
+once, with every tournament as one lane of a NumPy array: for ``n``
+tournaments a match is a handful of vectorized operations over ``n``
+lanes, so 100,000 tournaments across all ten weights run in seconds.
+
+Bout outcomes come from a per-weight ``win_prob[a, b]`` matrix (by default a
+seed model, ``NCAA_TOURNAMENT["seed_strength"]``). Matches already final
+keep their real winner and decision, so re-running during the tournament
+conditions on everything wrestled so far. Team scores follow NCAA scoring
+(``TEAM_SCORING``): advancement points for championship and consolation
+wins, bonus points drawn from the decision mix (fall, tech fall, major), and
+placement points for the place matches.
+
+Results are two pins: ``bracket_sim_wrestlers`` (placement probabilities and
+expected points per wrestler) and ``bracket_sim_teams`` (team-title
+probability and the team-score distribution).
+"""
+
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from etl.brackets import CONS, FINAL, Bracket, parse_bracket
+from etl.config import NCAA_TOURNAMENT, TEAM_SCORING
+from etl.pin_writer import PinWriter
+from etl.transformers.schemas import BRACKET_SIM_TEAMS_SCHEMA, BRACKET_SIM_WRESTLERS_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+SIM_WRESTLERS_PIN = "bracket_sim_wrestlers"
+SIM_TEAMS_PIN = "bracket_sim_teams"
+
+PLACES = 8
+_BONUS_CODES = list(TEAM_SCORING["bonus_mix"])
+
+
+class CompiledBracket:
+    """One weight class's bracket as arrays, ready to simulate.
+
+    Match ``k`` of the compiled order has its two participants in slots
+    ``(k, 0)`` and ``(k, 1)``; ``winner_to[k]`` / ``loser_to[k]`` give the
+    destination ``match * 2 + slot`` (or -1).
+    """
+
+    def __init__(self, bracket: dict | Bracket):
+        if not isinstance(bracket, Bracket):
+            bracket = parse_bracket(bracket)
+        self.weight_class = bracket.weight_class
+        self.wrestler_ids = bracket.wrestler_ids
+        self.names = bracket.names
+        self.teams = bracket.teams
+        self.seeds = bracket.seeds
+
+        # Slots fed by an earlier match are filled during the simulation
+        self.entries = np.where(bracket.feeders >= 0, -1, bracket.slots).astype(np.int16)
+        self.winner_to = bracket.winner_to
+        self.loser_to = bracket.loser_to
+        final = bracket.status == FINAL
+        self.fixed_winner = np.where(final, bracket.winner, -1).astype(np.int16)
+        bonus_points = {code: points for code, (_, points) in TEAM_SCORING["bonus_mix"].items()}
+        self.fixed_bonus = np.array([
+            bonus_points.get(str(d or "").upper(), 0.0) if done else 0.0
+            for d, done in zip(bracket.decisions, final)
+        ], dtype=np.float32)
+        self.place = bracket.place
+        self.advancement = np.where(
+            bracket.place > 0, 0.0,
+            np.where(bracket.round_code == CONS,
+                     TEAM_SCORING["advancement"]["consolation"], TEAM_SCORING["advancement"]["championship"]),
+        ).astype(np.float32)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def seed_win_matrix(
+        self,
+        strength: float = NCAA_TOURNAMENT["seed_strength"],
+        unseeded: int = NCAA_TOURNAMENT["unseeded_seed"],
+    ) -> np.ndarray:
+        """``P[a, b]``: probability wrestler ``a`` beats ``b``, from seeds alone."""
+        seeds = np.array([s if s else unseeded for s in self.seeds], dtype=np.float64)
+        ratio = (seeds[:, None] / seeds[None, :]) ** strength
+        return (1.0 / (1.0 + ratio)).astype(np.float32)
+
+    def simulate(self, n: int, rng: np.random.Generator, win_prob: np.ndarray | None = None):
+        """Run ``n`` tournaments of this weight.
+
+        Returns ``(points, places)``: team points scored by each wrestler in
+        each tournament (``(wrestlers, n)``) and how many tournaments each
+        wrestler finished in each place (``(wrestlers, PLACES + 1)``, column 0 unused).
+        """
+        if win_prob is None:
+            win_prob = self.seed_win_matrix()
+        n_wrestlers = len(self.wrestler_ids)
+        flat_prob = np.ascontiguousarray(win_prob, dtype=np.float32).ravel()
+        bonus_lut = _bonus_lookup()
+        placement_points = TEAM_SCORING["placement"]
+        slots = np.empty((len(self) * 2, n), dtype=np.int16)
+        slots[:] = self.entries.reshape(-1, 1)
+        places = np.zeros((n_wrestlers, PLACES + 1), dtype=np.int64)
+        scorers, scored = [], []  # per match: who scored and how much, summed once at the end
+
+        for k in range(len(self)):
+            a, b = slots[2 * k], slots[2 * k + 1]
+            bye = (a < 0) | (b < 0)
+            if self.fixed_winner[k] >= 0:
+                winner = np.full(n, self.fixed_winner[k], dtype=np.int16)
+                loser = np.where(a == winner, b, a)
+                bonus = np.float32(self.fixed_bonus[k])
+            else:
+                pair = np.maximum(a, 0).astype(np.intp) * n_wrestlers + np.maximum(b, 0)
+                a_wins = rng.random(n, dtype=np.float32) < flat_prob[pair]
+                a_wins = np.where(bye, b < 0, a_wins)
+                winner = np.where(a_wins, a, b)
+                loser = np.where(a_wins, b, a)
+                bonus = bonus_lut[(rng.random(n, dtype=np.float32) * len(bonus_lut)).astype(np.intp)]
+
+            earned = np.where(bye, 0.0, self.advancement[k] + bonus).astype(np.float32)
+            if self.place[k]:
+                place = int(self.place[k])
+                earned += placement_points.get(place, 0.0)
+                scorers.append(loser)
+                scored.append(np.full(n, placement_points.get(place + 1, 0.0), dtype=np.float32))
+                for who, p in ((winner, place), (loser, place + 1)):
+                    if p <= PLACES:
+                        places[:, p] += np.bincount(who[who >= 0], minlength=n_wrestlers)[:n_wrestlers]
+            scorers.append(winner)
+            scored.append(earned)
+
+            if self.winner_to[k] >= 0:
+                slots[self.winner_to[k]] = winner
+            if self.loser_to[k] >= 0:
+                slots[self.loser_to[k]] = loser
+
+        # One weighted bincount over (wrestler, lane) instead of a scatter per match
+        who = np.concatenate(scorers).astype(np.intp)
+        lane = np.tile(np.arange(n), len(scorers))
+        earned = np.concatenate(scored)
+        valid = who >= 0
+        points = np.bincount(
+            who[valid] * n + lane[valid], weights=earned[valid], minlength=n_wrestlers * n,
+        ).astype(np.float32).reshape(n_wrestlers, n)
+        return points, places
+
+
+def simulate_tournament(
+    brackets: list[dict | Bracket],
+    n: int = NCAA_TOURNAMENT["simulations"],
+    seed: int | None = None,
+    win_probs: dict[int, np.ndarray] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Simulate ``n`` tournaments across every weight class in ``brackets``.
+
+    Args:
+        brackets: ``get_tournament_brackets`` output (one bracket per
+            weight), or those brackets parsed by ``etl.brackets``.
+        n: Number of simulated tournaments.
+        seed: Random seed, for reproducible results.
+        win_probs: Optional ``{weight_class: P}`` bout win-probability
+            matrices (indexed like each bracket's ``wrestlers``); weights
+            without one use the seed model.
+
+    Returns:
+        ``(wrestlers, teams)`` frames in ``BRACKET_SIM_WRESTLERS_SCHEMA`` /
+        ``BRACKET_SIM_TEAMS_SCHEMA``.
+    """
+    rng = np.random.default_rng(seed)
+    compiled = [CompiledBracket(b) for b in brackets or []]
+    team_names = sorted({t for c in compiled for t in c.teams if t})
+    team_index = {t: i for i, t in enumerate(team_names)}
+    team_points = np.zeros((len(team_names), n), dtype=np.float32)
+
+    wrestler_rows = []
+    start = time.perf_counter()
+    for bracket in compiled:
+        if not bracket.wrestler_ids or not len(bracket):
+            continue
+        points, places = bracket.simulate(n, rng, (win_probs or {}).get(bracket.weight_class))
+        membership = np.zeros((len(team_names), len(bracket.wrestler_ids)), dtype=np.float32)
+        for i, team in enumerate(bracket.teams):
+            if team in team_index:
+                membership[team_index[team], i] = 1.0
+        team_points += membership @ points
+
+        probs = places / n
+        for i, wid in enumerate(bracket.wrestler_ids):
+            wrestler_rows.append({
+                "weight_class": bracket.weight_class,
+                "wrestler_id": wid,
+                "name": bracket.names[i],
+                "team": bracket.teams[i],
+                "seed": bracket.seeds[i],
+                **{f"p_place_{p}": probs[i, p] for p in range(1, PLACES + 1)},
+                "p_all_american": probs[i, 1:].sum(),
+                "expected_points": float(points[i].mean()),
+            })
+    logger.info("Simulated %d tournaments over %d weight classes in %.2fs",
+                n, len(compiled), time.perf_counter() - start)
+
+    wrestlers = conform(pd.DataFrame(wrestler_rows), BRACKET_SIM_WRESTLERS_SCHEMA)
+    teams = conform(pd.DataFrame(_team_rows(team_names, team_points)), BRACKET_SIM_TEAMS_SCHEMA)
+    if not teams.empty:
+        teams = teams.sort_values(["p_title", "expected_points"], ascending=False).reset_index(drop=True)
+    return wrestlers, teams
+
+
+def refresh_bracket_simulation(
+    writer: PinWriter,
+    brackets: list[dict | Bracket],
+    n: int = NCAA_TOURNAMENT["simulations"],
+    seed: int | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Simulate the tournament and write both simulation pins."""
+    wrestlers, teams = simulate_tournament(brackets, n=n, seed=seed)
+    writer.write_pin(SIM_WRESTLERS_PIN, wrestlers)
+    writer.write_pin(SIM_TEAMS_PIN, teams)
+    return wrestlers, teams
+
+
+def _bonus_lookup(size: int = 1000) -> np.ndarray:
+    """Bonus points indexed by ``int(u * size)`` for uniform ``u``: a draw from the decision mix."""
+    mix = TEAM_SCORING["bonus_mix"]
+    shares = np.array([mix[c][0] for c in _BONUS_CODES], dtype=np.float64)
+    bounds = np.cumsum(shares / shares.sum())
+    choice = np.minimum(np.searchsorted(bounds, (np.arange(size) + 0.5) / size), len(shares) - 1)
+    return np.array([mix[c][1] for c in _BONUS_CODES], dtype=np.float32)[choice]
+
+
+def _team_rows(team_names: list[str], team_points: np.ndarray) -> list[dict]:
+    if not team_names:
+        return []
+    best = team_points.max(axis=0)
+    leaders = team_points == best
+    title_share = (leaders / leaders.sum(axis=0)).mean(axis=1)  # ties split the title
+    p10, p50, p90 = np.percentile(team_points, [10, 50, 90], axis=1)
+    return [
+        {
+            "team": team,
+            "p_title": float(title_share[i]),
+            "expected_points": float(team_points[i].mean()),
+            "points_p10": float(p10[i]),
+            "points_median": float(p50[i]),
+            "points_p90": float(p90[i]),
+        }
+        for i, team in enumerate(team_names)
+    ]
+
@@ -0,0 +1,368 @@
+"""Structured bracket model for OpenTW (TrackWrestling) bracket data.
+
+``parse_bracket`` turns one weight class of ``get_tournament_brackets`` JSON
+into a ``Bracket``: parallel NumPy arrays with one entry per match, in an
+order where every match follows the matches feeding it. Each match has two
+slots (0 = top, 1 = bottom) holding wrestler indices, its children
+(``feeders``: the matches whose winner/loser fills each slot) and its
+parents (``winner_to`` / ``loser_to``: the ``match * 2 + slot`` the winner
+and loser move on to), a round code matching the Brackets page options
+(``ROUND_CODES``) and the result once final.
+
+``Bracket.apply_results`` takes a newer fetch of the same bracket and
+applies only the matches that became final since, moving their winners and
+losers into the parent slots — no re-parse. ``to_frame`` / ``from_frame``
+convert to and from the ``brackets`` pin (``BRACKETS_SCHEMA``, one row per
+match), which the app indexes by weight class and round.
+
+``tournament_dates`` gives the championship's start and end dates, looked up
+from OpenTW once and then cached in the ``tournament`` pin.
+"""
+
+import heapq
+import logging
+import re
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from etl.config import NCAA_TOURNAMENT
+from etl.pin_writer import PinWriter
+from etl.transformers.schemas import BRACKETS_SCHEMA, TOURNAMENT_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+BRACKETS_PIN = "brackets"
+TOURNAMENT_PIN = "tournament"
+
+# Championship rounds by distance from the final, then every consolation/place match
+ROUND_CODES = ("finals", "sf", "qf", "r16", "r32", "cons")
+CONS = ROUND_CODES.index("cons")
+STATUSES = ("pre", "in progress", "final")
+PRE, LIVE, FINAL = range(3)
+
+_PLACE_LABEL = re.compile(r"(\d+)(?:st|nd|rd|th)\s+place", re.IGNORECASE)
+
+
+class Bracket:
+    """One weight class's bracket as parallel per-match arrays."""
+
+    def __init__(
+        self,
+        weight_class: int,
+        wrestlers: list[dict],
+        matches: list[dict],
+    ):
+        """Build from OpenTW ``wrestlers`` / ``matches`` lists; see ``parse_bracket``."""
+        self.weight_class = weight_class
+        self.wrestler_ids = [str(w.get("id")) for w in wrestlers]
+        self.names = [w.get("name") or "" for w in wrestlers]
+        self.teams = [w.get("team") or "" for w in wrestlers]
+        self.seeds = [w.get("seed") for w in wrestlers]
+        self.wrestler_index = {wid: i for i, wid in enumerate(self.wrestler_ids)}
+
+        matches = _feeder_order(matches)
+        self.match_ids = [str(m["id"]) for m in matches]
+        self.position = {mid: k for k, mid in enumerate(self.match_ids)}
+        n = len(matches)
+        self.bouts = np.array([_int_or(m.get("boutNumber"), -1) for m in matches], dtype=np.int32)
+        self.round_labels = [str(m.get("round") or "") for m in matches]
+        self.place = np.zeros(n, dtype=np.int8)
+        self.round_code = np.zeros(n, dtype=np.int8)
+        self.slots = np.full((n, 2), -1, dtype=np.int16)
+        self.feeders = np.full((n, 2), -1, dtype=np.int32)
+        self.winner_to = np.full(n, -1, dtype=np.int32)
+        self.loser_to = np.full(n, -1, dtype=np.int32)
+        self.winner = np.full(n, -1, dtype=np.int16)
+        self.status = np.zeros(n, dtype=np.int8)
+        self.decisions: list[str | None] = [None] * n
+        self.results: list[str | None] = [None] * n
+
+        # Feeders fill a match's slots in feeder order
+        fed = np.zeros(n, dtype=np.int8)
+        for k, m in enumerate(matches):
+            for key, parent in (("winnerTo", self.winner_to), ("loserTo", self.loser_to)):
+                dest = self.position.get(str(m.get(key)))
+                if dest is not None and fed[dest] < 2:
+                    parent[k] = dest * 2 + fed[dest]
+                    self.feeders[dest, fed[dest]] = k
+                    fed[dest] += 1
+        self._assign_rounds()
+
+        # Unfed slots take the listed wrestlers who haven't entered the bracket elsewhere
+        entered: set[int] = set()
+        for k, m in enumerate(matches):
+            listed = [self.wrestler_index.get(str(m.get(side))) for side in ("topWrestlerId", "bottomWrestlerId")]
+            listed = [i for i in listed if i is not None and i not in entered]
+            for slot in (0, 1):
+                if self.feeders[k, slot] < 0 and listed:
+                    self.slots[k, slot] = listed.pop(0)
+                    entered.add(int(self.slots[k, slot]))
+        self.apply_results({"matches": matches})
+
+    def __len__(self) -> int:
+        return len(self.match_ids)
+
+    def apply_results(self, bracket: dict) -> list[int]:
+        """Apply the matches of a newer fetch of this bracket that became final.
+
+        Matches already final are skipped; newly final ones record their
+        winner and result and advance their winner and loser into the parent
+        slots. Status changes of unfinished matches are picked up too.
+        Returns the positions of the newly final matches.
+        """
+        updates = []
+        for m in bracket.get("matches") or []:
+            k = self.position.get(str(m.get("id")))
+            if k is None:
+                logger.warning("Bracket %s: unknown match %s ignored", self.weight_class, m.get("id"))
+                continue
+            if self.status[k] == FINAL:
+                continue
+            status = _status_code(m.get("status"))
+            winner = self.wrestler_index.get(str(m.get("winnerId")))
+            if status == FINAL and winner is not None:
+                updates.append((k, winner, m))
+            else:
+                self.status[k] = min(status, LIVE)
+
+        # Feeders before the matches they feed, so advanced wrestlers land first
+        newly_final = []
+        for k, winner, m in sorted(updates, key=lambda u: u[0]):
+            top, bottom = self.slots[k]
+            if winner not in (top, bottom):
+                # A slot we couldn't fill (unlisted entrant): the winner takes it
+                self.slots[k, 0 if top < 0 else 1] = winner
+            loser = self.slots[k, 1] if self.slots[k, 0] == winner else self.slots[k, 0]
+            self.winner[k] = winner
+            self.status[k] = FINAL
+            self.decisions[k] = m.get("decision")
+            self.results[k] = m.get("result")
+            for dest, who in ((self.winner_to[k], winner), (self.loser_to[k], loser)):
+                if dest >= 0:
+                    self.slots[dest // 2, dest % 2] = who
+            newly_final.append(k)
+        return newly_final
+
+    def matches_in(self, round_code: str) -> np.ndarray:
+        """Positions of the matches in ``round_code`` (one of ``ROUND_CODES``), by bout number."""
+        ks = np.flatnonzero(self.round_code == ROUND_CODES.index(round_code))
+        return ks[np.argsort(self.bouts[ks], kind="stable")]
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per match in ``BRACKETS_SCHEMA``, in bracket order."""
+        n = len(self)
+        columns = {
+            "weight_class": np.full(n, self.weight_class),
+            "match_index": np.arange(n),
+            "match_id": self.match_ids,
+            "bout": self.bouts,
+            "round_code": [ROUND_CODES[c] for c in self.round_code],
+            "round": self.round_labels,
+            "place": self.place,
+        }
+        for slot, side in enumerate(("top", "bottom")):
+            who = self.slots[:, slot]
+            columns[f"{side}_id"] = [self.wrestler_ids[i] if i >= 0 else None for i in who]
+            columns[f"{side}_name"] = [self.names[i] if i >= 0 else None for i in who]
+            columns[f"{side}_team"] = [self.teams[i] if i >= 0 else None for i in who]
+            columns[f"{side}_seed"] = [self.seeds[i] if i >= 0 else None for i in who]
+            columns[f"{side}_from"] = self.feeders[:, slot]
+        columns["winner_slot"] = np.select(
+            [(self.winner >= 0) & (self.winner == self.slots[:, 0]), self.winner >= 0], [0, 1], -1,
+        )
+        columns["status"] = [STATUSES[s] for s in self.status]
+        columns["decision"] = self.decisions
+        columns["result"] = self.results
+        columns["winner_to"] = self.winner_to
+        columns["loser_to"] = self.loser_to
+        return conform(pd.DataFrame(columns), BRACKETS_SCHEMA)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "Bracket":
+        """Rebuild a bracket from its ``to_frame`` rows (one weight class)."""
+        df = df.sort_values("match_index")
+        wrestlers: dict[str, dict] = {}
+        for side in ("top", "bottom"):
+            for wid, name, team, seed in zip(df[f"{side}_id"], df[f"{side}_name"], df[f"{side}_team"], df[f"{side}_seed"]):
+                if wid and wid not in wrestlers:
+                    wrestlers[wid] = {"id": wid, "name": name, "team": team, "seed": None if pd.isna(seed) else int(seed)}
+
+        match_ids = df["match_id"].astype(str).tolist()
+        matches = []
+        for row in df.itertuples(index=False):
+            top = row.top_id if row.top_from < 0 and row.top_id else None
+            bottom = row.bottom_id if row.bottom_from < 0 and row.bottom_id else None
+            matches.append({
+                "id": row.match_id,
+                "round": row.round,
+                "boutNumber": None if pd.isna(row.bout) else int(row.bout),
+                "topWrestlerId": top,
+                "bottomWrestlerId": bottom,
+                "winnerTo": match_ids[row.winner_to // 2] if row.winner_to >= 0 else None,
+                "loserTo": match_ids[row.loser_to // 2] if row.loser_to >= 0 else None,
+            })
+        bracket = cls(int(df["weight_class"].iloc[0]) if len(df) else 0, list(wrestlers.values()), matches)
+
+        # Replay the results in bracket order
+        results = []
+        for row in df.itertuples(index=False):
+            winner = row.top_id if row.winner_slot == 0 else row.bottom_id if row.winner_slot == 1 else None
+            results.append({
+                "id": row.match_id, "status": row.status, "winnerId": winner,
+                "decision": _text_or_none(row.decision), "result": _text_or_none(row.result),
+            })
+        bracket.apply_results({"matches": results})
+        return bracket
+
+    def _assign_rounds(self) -> None:
+        """Place and round code of every match.
+
+        Championship matches are coded by how many winner hops they are from
+        their final; consolation and place matches (other than 1st) are ``cons``.
+        """
+        n = len(self)
+        consolation = np.zeros(n, dtype=bool)
+        for k, label in enumerate(self.round_labels):
+            place = _PLACE_LABEL.search(label)
+            if place:
+                self.place[k] = int(place.group(1))
+            consolation[k] = "cons" in label.lower() or self.place[k] > 1
+
+        depth = np.zeros(n, dtype=np.int8)
+        for k in range(n - 1, -1, -1):  # parents come later in bracket order
+            dest = self.winner_to[k]
+            if dest >= 0:
+                depth[k] = depth[dest // 2] + 1
+        self.round_code[:] = np.where(consolation, CONS, np.minimum(depth, ROUND_CODES.index("r32")))
+
+
+def parse_bracket(bracket: dict) -> Bracket:
+    """Parse one weight class of ``get_tournament_brackets`` JSON."""
+    return Bracket(_int_or(bracket.get("weightClass"), 0), bracket.get("wrestlers") or [], bracket.get("matches") or [])
+
+
+def parse_brackets(brackets: list[dict] | None) -> list[Bracket]:
+    """Parse every weight class of a ``get_tournament_brackets`` response."""
+    return [parse_bracket(b) for b in brackets or []]
+
+
+def brackets_from_frame(df: pd.DataFrame | None) -> dict[int, Bracket]:
+    """The ``brackets`` pin as ``{weight_class: Bracket}``."""
+    if df is None or df.empty:
+        return {}
+    return {int(wt): Bracket.from_frame(rows) for wt, rows in df.groupby("weight_class", sort=True, observed=True)}
+
+
+def refresh_brackets(
+    writer: PinWriter,
+    raw: list[dict],
+    previous: dict[int, Bracket] | None = None,
+) -> list[Bracket]:
+    """Update the ``brackets`` pin from a fresh ``get_tournament_brackets`` response.
+
+    Weight classes already in ``previous`` (by default, the published pin)
+    with the same matches are updated incrementally; new or restructured
+    ones are parsed from scratch. Returns the brackets in response order.
+    """
+    if previous is None:
+        previous = brackets_from_frame(writer.read_pin(BRACKETS_PIN))
+    brackets, applied = [], 0
+    for data in raw or []:
+        bracket = previous.get(_int_or(data.get("weightClass"), 0))
+        ids = {str(m.get("id")) for m in data.get("matches") or []}
+        if bracket is not None and ids == set(bracket.position):
+            applied += len(bracket.apply_results(data))
+        else:
+            bracket = parse_bracket(data)
+            applied += int((bracket.status == FINAL).sum())
+        brackets.append(bracket)
+
+    frames = [b.to_frame() for b in brackets]
+    writer.write_pin(BRACKETS_PIN, pd.concat(frames, ignore_index=True) if frames else conform(pd.DataFrame(), BRACKETS_SCHEMA))
+    logger.info("Brackets: %d weight classes, %d newly final matches", len(brackets), applied)
+    return brackets
+
+
+def tournament_dates(
+    client,
+    writer: PinWriter,
+    tournament_type: str = NCAA_TOURNAMENT["tournament_type"],
+    tournament_id: str = NCAA_TOURNAMENT["tournament_id"],
+) -> tuple[date, date] | None:
+    """``(start, end)`` of the tournament, or ``None`` if they can't be known yet.
+
+    Read from the ``tournament`` pin; only when it has no row for this
+    tournament is OpenTW asked (``client.get_tournament``), and a successful
+    answer is cached in the pin. A failed lookup returns ``None`` rather
+    than a guess, so callers retry instead of ruling the day out.
+    """
+    cached = writer.read_pin(TOURNAMENT_PIN)
+    if cached is not None and not cached.empty:
+        row = cached[(cached["tournament_type"] == tournament_type) & (cached["tournament_id"] == tournament_id)]
+        if not row.empty and pd.notna(row["start_date"].iloc[0]) and pd.notna(row["end_date"].iloc[0]):
+            return row["start_date"].iloc[0].date(), row["end_date"].iloc[0].date()
+
+    info = client.get_tournament(tournament_type, tournament_id)
+    try:
+        start = datetime.fromisoformat(str(info["startDate"])).date()
+        end = datetime.fromisoformat(str(info["endDate"])).date()
+    except (TypeError, KeyError, ValueError):
+        logger.warning("Could not look up the dates of tournament %s/%s", tournament_type, tournament_id)
+        return None
+
+    row = pd.DataFrame([{"tournament_type": tournament_type, "tournament_id": tournament_id,
+                         "start_date": start, "end_date": end}])
+    frames = [row] if cached is None else [cached[cached["tournament_id"] != tournament_id], row]
+    writer.write_pin(TOURNAMENT_PIN, conform(pd.concat(frames, ignore_index=True), TOURNAMENT_SCHEMA))
+    return start, end
+
+
+def _status_code(status) -> int:
+    text = str(status or "").lower()
+    if text == "final":
+        return FINAL
+    return LIVE if text in ("in progress", "live") else PRE
+
+
+def _text_or_none(value) -> str | None:
+    return None if pd.isna(value) or value == "" else str(value)
+
+
+def _int_or(value, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _feeder_order(matches: list[dict]) -> list[dict]:
+    """Matches in an order where every match follows the ones feeding it (by bout number otherwise)."""
+    by_id = {str(m.get("id")): m for m in matches}
+    pending = {mid: 0 for mid in by_id}
+    for m in matches:
+        for key in ("winnerTo", "loserTo"):
+            dest = str(m.get(key))
+            if dest in pending:
+                pending[dest] += 1
+
+    def sort_key(mid: str):
+        bout = by_id[mid].get("boutNumber")
+        return (bout if isinstance(bout, int) else 10**9, mid)
+
+    ready = [sort_key(mid) for mid, count in pending.items() if count == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, mid = heapq.heappop(ready)
+        ordered.append(by_id[mid])
+        for key in ("winnerTo", "loserTo"):
+            dest = str(by_id[mid].get(key))
+            if dest in pending:
+                pending[dest] -= 1
+                if pending[dest] == 0:
+                    heapq.heappush(ready, sort_key(dest))
+    if len(ordered) < len(matches):
+        logger.warning("Bracket has a cycle; %d matches dropped", len(matches) - len(ordered))
+    return ordered
@@ -15,10 +15,116 @@ OPENTW_API = {
     "retry_attempts": 3,
 }
 
+# D1 weight classes (must match WEIGHT_CLASSES in app/utils/constants.py)
+WEIGHT_CLASSES = [125, 133, 141, 149, 157, 165, 174, 184, 197, 285]
+
+# NCAA Championships on TrackWrestling/OpenTW, and the bracket simulation
+# run by ``python etl/run_brackets.py`` (see etl/brackets.py, etl/bracket_sim.py)
+NCAA_TOURNAMENT = {
+    "tournament_type": "collegiate",
+    "tournament_id": "ncaa-2026",
+    "simulations": 100_000,
+    "seed_strength": 1.2,     # P(a beats b) = 1 / (1 + (seed_a / seed_b) ** seed_strength)
+    "unseeded_seed": 33,      # seed assumed for wrestlers without one
+}
+
+# NCAA team scoring
+TEAM_SCORING = {
+    "advancement": {"championship": 1.0, "consolation": 0.5},
+    # Share of wins by decision type and the bonus points each earns
+    "bonus_mix": {"DEC": (0.55, 0.0), "MD": (0.20, 1.0), "TF": (0.12, 1.5), "FALL": (0.13, 2.0)},
+    "placement": {1: 16.0, 2: 12.0, 3: 10.0, 4: 9.0, 5: 7.0, 6: 6.0, 7: 4.0, 8: 3.0},
+}
+
 # Pins configuration
 PINS_CONFIG = {
     "board_dir": "pin_cache",
     "versioned": True,
+    "meta_ttl_seconds": 30,  # how long a PinWriter trusts its cached listing / latest metadata
+}
+
+# Pin version retention (applied by the ETL after writes; see etl/pin_retention.py)
+PINS_RETENTION = {
+    "pins": [
+        "rankings", "team_stats", "individual_stats", "standings",
+        "schools", "schedule", "schedule_manifest", "live_scores", "bouts",
+        "rankings_history", "search_index", "search_terms", "elo_ratings", "elo_ledger",
+        "brackets", "bracket_sim_wrestlers", "bracket_sim_teams", "team_scores", "tournament",
+        "h2h_entities", "h2h_results",
+        *(f"individual_rankings_{wt}" for wt in WEIGHT_CLASSES),
+    ],
+    "default": {
+        "keep_last": 10,
+        "keep_daily_days": 30,
+        "max_bytes": 200 * 1024 * 1024,
+    },
+    "live_scores": {
+        "keep_last": 60,
+        "keep_daily_days": 7,
+        "max_bytes": 50 * 1024 * 1024,
+        "compact_first": True,  # only prune versions already folded into a season history pin
+    },
+    "team_scores": {
+        "keep_last": 60,
+        "keep_daily_days": 7,
+        "max_bytes": 50 * 1024 * 1024,
+    },
+    "schedule_manifest": {
+        "keep_last": 3,
+        "keep_daily_days": None,
+        "max_bytes": None,
+    },
+}
+LIVE_RETENTION_INTERVAL_SECONDS = 3600  # how often the live poller (daemon or cron) prunes
+
+# Schedule window and incremental refresh
+SCHEDULE_WINDOW = {
+    "days_back": 7,
+    "days_ahead": 30,
+    "incremental": True,
+    "always_refresh_days_ahead": 1,   # today + tomorrow are always re-pulled
+    "future_refresh_every_days": 7,   # other future dates rotate through a weekly refresh
+}
+
+# Live-score daemon (``python etl/run_live.py --daemon``)
+LIVE_POLLER = {
+    "live_interval_seconds": 15,     # while any game is live
+    "active_interval_seconds": 120,  # games today, none live right now
+    "idle_max_sleep_seconds": 3600,  # cap on sleeping until the next start time
+    "start_lead_seconds": 300,       # wake up this long before a scheduled start
+    "tournament_interval_seconds": 30,  # NCAA Championships bracket polls while a bout is on
+}
+
+# Game-detail fan-out (bout results for live and just-finished duals)
+GAME_DETAIL = {
+    "workers": 4,  # concurrent requests; the client's rate limit still applies
+    # A final game whose detail fetch comes back empty is retried at most
+    # this many times by the daemon, and by anyone only this long after its start
+    "final_retries": 3,
+    "final_retry_seconds": 4 * 3600,
+}
+
+# Append-only change-event log written by the live poller (see etl/live_events.py)
+LIVE_EVENTS = {
+    "dir": "events",             # next to the local pins board
+    "segment_events": 10_000,    # events per JSONL segment
+    "keep_segments": 50,         # older segments are deleted with the live pin retention
+}
+
+# Favorite team/wrestler notifications (see etl/notifications.py). The
+# subscription store and outbox are a SQLite file next to the local pins board.
+NOTIFICATIONS = {
+    "db_file": "notifications.sqlite",
+    "events": ["start", "finish", "score", "bout"],
+    "delivered_keep_days": 7,  # delivered outbox rows are pruned after this
+}
+
+# Elo team ratings from dual-meet finals (see etl/elo.py)
+ELO = {
+    "initial_rating": 1500.0,
+    "k_factor": 32.0,
+    "home_advantage": 30.0,       # rating points added to the home side
+    "season_carryover": 0.75,     # a new season starts 75% of the way from the mean to last rating
 }
 
 # ETL schedule (cron expressions for Posit Connect)
@@ -0,0 +1,155 @@
+"""Incremental Elo team ratings from dual-meet finals.
+
+State lives in two small pins:
+
+- ``elo_ratings``: one row per team — current rating, record and the date
+  of its last rated dual (``ELO_RATINGS_SCHEMA``),
+- ``elo_ledger``: the ``game_id`` of every final already applied that is
+  still inside the ``schedule`` window (``ELO_LEDGER_SCHEMA``).
+
+Each daily run reads both, applies only the ``schedule`` finals missing from
+the ledger (oldest first) and writes them back, so the cost is O(new games)
+rather than a replay of the season. Ledger entries older than the schedule
+window are dropped: those games can no longer appear in ``schedule``.
+
+The update is standard Elo with a home-mat advantage and a margin-of-victory
+multiplier (``ln(margin + 1)``, damped for heavy favourites so lopsided
+wins by strong teams don't inflate ratings). A team's first dual of a new
+season regresses its rating toward the mean by ``season_carryover``.
+"""
+
+import logging
+import math
+from pathlib import Path
+
+import pandas as pd
+
+from etl.archive import read_archive
+from etl.config import ELO
+from etl.pin_retention import season_for_date
+from etl.pin_writer import PinWriter
+from etl.transformers.schemas import ELO_LEDGER_SCHEMA, ELO_RATINGS_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+ELO_RATINGS_PIN = "elo_ratings"
+ELO_LEDGER_PIN = "elo_ledger"
+
+
+def home_win_probability(away_rating: float, home_rating: float, home_advantage: float = ELO["home_advantage"]) -> float:
+    """Elo expectation for the home team."""
+    return 1.0 / (1.0 + 10 ** ((away_rating - home_rating - home_advantage) / 400.0))
+
+
+def margin_multiplier(margin: float, winner_rating_edge: float) -> float:
+    """Scale the update by the margin of victory, less so when the winner was favoured."""
+    return math.log(abs(margin) + 1.0) * 2.2 / (max(winner_rating_edge, -400.0) * 0.001 + 2.2)
+
+
+def apply_finals(
+    ratings: pd.DataFrame | None,
+    ledger: pd.DataFrame | None,
+    schedule: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame, int]:
+    """Apply the finals in ``schedule`` that aren't in ``ledger`` yet.
+
+    Returns the updated ``(ratings, ledger, games_applied)``.
+    """
+    ratings = _or_empty(ratings, ELO_RATINGS_SCHEMA)
+    ledger = _or_empty(ledger, ELO_LEDGER_SCHEMA)
+    if schedule is None or schedule.empty:
+        return ratings, ledger, 0
+
+    away = pd.to_numeric(schedule["away_score"], errors="coerce")
+    home = pd.to_numeric(schedule["home_score"], errors="coerce")
+    finals = schedule[(schedule["status"].astype("string") == "Final") & away.notna() & home.notna()]
+    new = finals[~finals["game_id"].astype(str).isin(set(ledger["game_id"].astype(str)))]
+    if not new.empty:
+        sort_cols = [c for c in ("date", "start_time_epoch", "game_id") if c in new.columns]
+        new = new.sort_values(sort_cols, kind="stable")
+
+    state = {
+        row.team: [row.rating, row.season, row.games, row.wins, row.losses, row.ties, row.last_game]
+        for row in ratings.itertuples(index=False)
+    }
+    for game in new.itertuples(index=False):
+        _apply_game(state, game)
+
+    ratings = conform(pd.DataFrame(
+        [[team, *values] for team, values in state.items()], columns=ELO_RATINGS_SCHEMA.names,
+    ), ELO_RATINGS_SCHEMA)
+    ratings = ratings.sort_values(["rating", "team"], ascending=[False, True]).reset_index(drop=True)
+
+    # Only games still inside the schedule window can come back; forget older ones
+    window_start = pd.to_datetime(schedule["date"], errors="coerce").min()
+    applied = conform(new[["game_id", "date"]], ELO_LEDGER_SCHEMA)
+    ledger = pd.concat([ledger, applied], ignore_index=True)
+    if pd.notna(window_start):
+        ledger = ledger[ledger["date"] >= window_start]
+    ledger = ledger.sort_values(["date", "game_id"], kind="stable").reset_index(drop=True)
+    return ratings, ledger, len(new)
+
+
+def refresh_elo(writer: PinWriter, schedule: pd.DataFrame, archive_root: Path | None = None) -> pd.DataFrame:
+    """Apply the schedule's new finals to the Elo pins. Returns the ratings.
+
+    Without an ``elo_ratings`` pin, the season archive's games are replayed
+    once to seed it.
+    """
+    ratings, ledger = writer.read_pin(ELO_RATINGS_PIN), writer.read_pin(ELO_LEDGER_PIN)
+    if ratings is None or ratings.empty:
+        ratings, ledger, seeded = apply_finals(None, None, read_archive("games", root=archive_root))
+        logger.info("Elo: seeded from %d archived finals", seeded)
+    ratings, ledger, applied = apply_finals(ratings, ledger, schedule)
+    # The app's win probabilities must use the same constants as the ratings
+    params = {"initial_rating": ELO["initial_rating"], "home_advantage": ELO["home_advantage"]}
+    writer.write_pin(ELO_RATINGS_PIN, ratings, metadata=params)
+    writer.write_pin(ELO_LEDGER_PIN, ledger)
+    logger.info("Elo: applied %d new finals, %d teams rated", applied, len(ratings))
+    return ratings
+
+
+def _apply_game(state: dict[str, list], game) -> None:
+    day = pd.Timestamp(game.date)
+    season = season_for_date(day.date()) if pd.notna(day) else None
+    away = _team_state(state, game.away_team, season)
+    home = _team_state(state, game.home_team, season)
+
+    expected_home = home_win_probability(away[0], home[0])
+    margin = float(game.home_score) - float(game.away_score)
+    if margin > 0:
+        result, edge = 1.0, home[0] + ELO["home_advantage"] - away[0]
+    elif margin < 0:
+        result, edge = 0.0, away[0] - home[0] - ELO["home_advantage"]
+    else:
+        result, edge = 0.5, 0.0
+    multiplier = margin_multiplier(margin, edge) if margin else 1.0
+    delta = ELO["k_factor"] * multiplier * (result - expected_home)
+
+    for team, sign, won in ((home, 1, margin > 0), (away, -1, margin < 0)):
+        team[0] += sign * delta
+        team[2] += 1
+        if margin == 0:
+            team[5] += 1
+        elif won:
+            team[3] += 1
+        else:
+            team[4] += 1
+        team[6] = day
+
+
+def _team_state(state: dict[str, list], team: str, season: int | None) -> list:
+    """``team``'s mutable state, created at the mean or regressed for a new season."""
+    entry = state.get(team)
+    if entry is None:
+        entry = state[team] = [ELO["initial_rating"], season, 0, 0, 0, 0, pd.NaT]
+    elif season is not None and not pd.isna(entry[1]) and season > entry[1]:
+        mean = ELO["initial_rating"]
+        entry[:6] = [mean + ELO["season_carryover"] * (entry[0] - mean), season, 0, 0, 0, 0]
+    elif pd.isna(entry[1]):
+        entry[1] = season
+    return entry
+
+
+def _or_empty(df: pd.DataFrame | None, schema) -> pd.DataFrame:
+    return conform(pd.DataFrame(), schema) if df is None or df.empty else df
@@ -0,0 +1,193 @@
+"""Game-detail fan-out: bout-by-bout results for live and just-finished duals.
+
+After each live-score poll, the games on today's scoreboard that are live or
+final are checked against the ``bouts`` pin. A game's boxscore is fetched
+only when:
+
+- it has no final detail yet (finished games are fetched once more after
+  they go final, then never again), and
+- for live games, its dual score moved since the cached detail — every bout
+  adds team points, so an unchanged (or still 0-0) score means no new bouts.
+
+The detail fetched once a game is final on the scoreboard is stored as
+``final`` whatever status the boxscore carried. A final game whose fetch
+keeps coming back empty is retried at most ``GAME_DETAIL["final_retries"]``
+times by a caller that keeps an ``attempts`` count (the live daemon), and
+never later than ``GAME_DETAIL["final_retry_seconds"]`` after its start.
+
+The selected games are fetched concurrently on a small thread pool sharing
+one ``NCAAApiClient``, whose throttle keeps the whole fan-out within the API
+rate limit. Results are merged into the ``bouts`` pin (one row per bout,
+sorted by weight class) so the app never has to call the API per user.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from etl.config import GAME_DETAIL
+from etl.ncaa_api import NCAAApiClient
+from etl.pin_writer import PinWriter
+from etl.transformers.bouts import transform_boxscore
+from etl.transformers.schemas import BOUTS_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+BOUTS_PIN = "bouts"
+
+
+def games_needing_detail(
+    scoreboard: pd.DataFrame,
+    bouts: pd.DataFrame | None,
+    now: float | None = None,
+    attempts: dict[str, int] | None = None,
+) -> list[str]:
+    """Game ids on ``scoreboard`` whose bout detail is missing or stale.
+
+    ``attempts`` counts the empty fetches of each final game so far.
+    """
+    if scoreboard.empty or "game_state" not in scoreboard.columns:
+        return []
+    states = scoreboard["game_state"].astype("string").fillna("").str.lower()
+    candidates = scoreboard[states.isin(["live", "final"])]
+    if candidates.empty:
+        return []
+
+    now = time.time() if now is None else now
+    retry_until = pd.Series(float("inf"), index=candidates.index)
+    if "start_time_epoch" in candidates.columns:
+        starts = pd.to_numeric(candidates["start_time_epoch"], errors="coerce")
+        retry_until = (starts + GAME_DETAIL["final_retry_seconds"]).fillna(float("inf"))
+
+    cached = _cached_detail(bouts)
+    selected = []
+    for game_id, state, away, home, until in zip(
+        candidates["game_id"].astype(str), states[candidates.index],
+        pd.to_numeric(candidates["away_score"], errors="coerce"),
+        pd.to_numeric(candidates["home_score"], errors="coerce"),
+        retry_until,
+    ):
+        entry = cached.get(game_id)
+        if state == "final" and (entry is None or entry[0] != "final"):
+            if now > until or (attempts or {}).get(game_id, 0) >= GAME_DETAIL["final_retries"]:
+                continue  # gave up on final detail for this game
+        if entry is None:
+            if state == "live" and away == 0 and home == 0:
+                continue  # no bout finished yet
+            selected.append(game_id)
+        elif entry[0] == "final":
+            continue
+        elif state == "final" or (away, home) != entry[1:]:
+            selected.append(game_id)
+    return selected
+
+
+def fetch_game_details(
+    client: NCAAApiClient,
+    game_ids: list[str],
+    workers: int = GAME_DETAIL["workers"],
+) -> dict[str, pd.DataFrame]:
+    """Fetch and transform the bouts of each game, ``workers`` requests at a time.
+
+    The scoring summary is only requested for games whose boxscore has no bouts.
+    """
+    def fetch(game_id: str) -> pd.DataFrame:
+        boxscore = client.get_game_boxscore(game_id)
+        summary = None
+        if not (boxscore and boxscore.get("bouts")):
+            summary = client.get_game_scoring(game_id)
+        return transform_boxscore(game_id, boxscore, summary)
+
+    if not game_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return dict(zip(game_ids, pool.map(fetch, game_ids)))
+
+
+def merge_bouts(existing: pd.DataFrame | None, fresh: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Replace the bouts of every game in ``fresh`` that returned rows.
+
+    Games whose fetch came back empty (request failed, no bouts yet) keep
+    whatever was cached for them.
+    """
+    updated = {game_id: df for game_id, df in fresh.items() if not df.empty}
+    frames = []
+    if existing is not None and not existing.empty:
+        frames.append(existing[~existing["game_id"].astype(str).isin(list(updated))])
+    frames.extend(updated.values())
+    if not frames:
+        return conform(pd.DataFrame(), BOUTS_SCHEMA)
+
+    merged = conform(pd.concat(frames, ignore_index=True), BOUTS_SCHEMA)
+    merged = merged.sort_values(["weight_class", "game_id", "bout_number"], kind="stable")
+    return merged.reset_index(drop=True)
+
+
+def refresh_game_details(
+    client: NCAAApiClient,
+    writer: PinWriter,
+    scoreboard: pd.DataFrame,
+    bouts: pd.DataFrame | None = None,
+    attempts: dict[str, int] | None = None,
+) -> pd.DataFrame:
+    """Fetch detail for the scoreboard's live/final games and update the ``bouts`` pin.
+
+    Args:
+        client: API client (shared by the worker threads).
+        writer: Pin writer for the ``bouts`` pin.
+        scoreboard: Today's ``transform_scoreboard`` output.
+        bouts: The current ``bouts`` frame if the caller already holds it
+            (the live daemon does); otherwise it is read from the board.
+        attempts: Empty final-detail fetches per game, updated in place
+            (kept across polls by the live daemon to cap retries).
+
+    Returns:
+        The up-to-date ``bouts`` frame.
+    """
+    if bouts is None:
+        bouts = writer.read_pin(BOUTS_PIN)
+    game_ids = games_needing_detail(scoreboard, bouts, attempts=attempts)
+    if not game_ids:
+        return bouts if bouts is not None else conform(pd.DataFrame(), BOUTS_SCHEMA)
+
+    fresh = fetch_game_details(client, game_ids)
+    # Detail fetched after the scoreboard went final is the game's final
+    # detail, even when the boxscore carried no status (or only the scoring
+    # summary answered) — mark it so the game is never fetched again
+    final = set(scoreboard.loc[
+        scoreboard["game_state"].astype("string").str.lower().eq("final").fillna(False), "game_id"
+    ].astype(str))
+    fresh = {
+        game_id: df.assign(detail_status="final") if game_id in final and not df.empty else df
+        for game_id, df in fresh.items()
+    }
+    if attempts is not None:
+        for game_id, df in fresh.items():
+            if game_id in final and df.empty:
+                attempts[game_id] = attempts.get(game_id, 0) + 1
+    merged = merge_bouts(bouts, fresh)
+    writer.write_pin(BOUTS_PIN, merged)
+    logger.info(
+        "Game detail: fetched %d games (%d with bouts), %d bouts pinned",
+        len(game_ids), sum(not df.empty for df in fresh.values()), len(merged),
+    )
+    return merged
+
+
+def _cached_detail(bouts: pd.DataFrame | None) -> dict[str, tuple]:
+    """``{game_id: (detail_status, away_team_score, home_team_score)}`` after each game's last bout."""
+    if bouts is None or bouts.empty:
+        return {}
+    last = bouts.sort_values("bout_number", kind="stable").groupby("game_id", observed=True).tail(1)
+    return {
+        str(game_id): (str(status), _score(away), _score(home))
+        for game_id, status, away, home in zip(
+            last["game_id"], last["detail_status"], last["away_team_score"], last["home_team_score"],
+        )
+    }
+
+
+def _score(value) -> float:
+    return float("nan") if pd.isna(value) else float(value)
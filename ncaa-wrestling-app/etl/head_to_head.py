@@ -0,0 +1,192 @@
+"""Head-to-head index over the season's dual and bout results.
+
+Two pins, rebuilt by the daily ETL:
+
+- ``h2h_entities``: one row per team or wrestler (``H2H_ENTITIES_SCHEMA``)
+  with its season record and the ``[first_row, first_row + row_count)``
+  range of its results,
+- ``h2h_results``: every result seen from both sides (``H2H_RESULTS_SCHEMA``)
+  — entity, opponent, outcome and score — sorted by ``(entity_id,
+  opponent_id, date)``.
+
+The results pin is an adjacency list: an entity's opponents are one
+contiguous, sorted run of rows. A direct matchup ``(a, b)`` is a binary
+search inside ``a``'s run, and common opponents (depth 2: ``a`` and ``b``
+both met ``c``) are the intersection of two sorted opponent arrays, so the
+app answers a comparison without scanning the season's results.
+
+Team results come from the season archive's games plus the current
+``schedule``; wrestler results from the ``bouts`` pin (bouts of games the
+live poller saw). Teams are keyed by normalized name, wrestlers by their
+NCAA id (or team and name when the source has no id).
+"""
+
+import logging
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from etl.archive import read_archive
+from etl.pin_retention import season_for_date
+from etl.pin_writer import PinWriter
+from etl.search_index import normalize_name
+from etl.transformers.schemas import H2H_ENTITIES_SCHEMA, H2H_RESULTS_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+H2H_ENTITIES_PIN = "h2h_entities"
+H2H_RESULTS_PIN = "h2h_results"
+
+
+def build_head_to_head(
+    games: pd.DataFrame | None,
+    bouts: pd.DataFrame | None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the ``h2h_entities`` and ``h2h_results`` frames.
+
+    Args:
+        games: Dual meets (``SCHEDULE_SCHEMA`` rows); only finals count.
+        bouts: Bout results (``BOUTS_SCHEMA`` rows); only decided bouts count.
+    """
+    dates = _game_dates(games)
+    sides = [s for s in (_team_results(games), _wrestler_results(bouts, dates)) if not s.empty]
+    results = pd.concat(sides, ignore_index=True) if sides else pd.DataFrame(columns=_RESULT_COLUMNS)
+
+    # One entity per key; ids in (kind, name) order so reruns are stable
+    entities = (
+        results.sort_values("date", kind="stable")[["kind", "key", "name", "team", "weight_class"]]
+        .drop_duplicates(["kind", "key"], keep="last")
+        .sort_values(["kind", "name", "key"], kind="stable")
+        .reset_index(drop=True)
+    )
+    entities["entity_id"] = np.arange(len(entities))
+    ids = dict(zip(zip(entities["kind"], entities["key"]), entities["entity_id"]))
+    results["entity_id"] = [ids[k] for k in zip(results["kind"], results["key"])]
+    results["opponent_id"] = [ids[k] for k in zip(results["kind"], results["opponent_key"])]
+    results = results.sort_values(["entity_id", "opponent_id", "date", "game_id"], kind="stable")
+    results = conform(results[H2H_RESULTS_SCHEMA.names].reset_index(drop=True), H2H_RESULTS_SCHEMA)
+
+    # Adjacency bounds and season records
+    entity = results["entity_id"].to_numpy(dtype=np.int64)
+    outcome = results["outcome"].astype(str).to_numpy()
+    n = len(entities)
+    entities["row_count"] = np.bincount(entity, minlength=n)
+    entities["first_row"] = np.r_[0, np.cumsum(entities["row_count"])[:-1]] if n else []
+    for column, code in (("wins", "W"), ("losses", "L"), ("ties", "T")):
+        entities[column] = np.bincount(entity, weights=outcome == code, minlength=n)
+    return conform(entities, H2H_ENTITIES_SCHEMA), results
+
+
+def refresh_head_to_head(
+    writer: PinWriter,
+    schedule: pd.DataFrame,
+    today: date | None = None,
+    archive_root: Path | None = None,
+) -> pd.DataFrame:
+    """Rebuild both head-to-head pins for the current season. Returns the entities."""
+    season = season_for_date(today or date.today())
+    frames = [f for f in (read_archive("games", seasons=[season], root=archive_root), schedule)
+              if f is not None and not f.empty]
+    games = pd.concat(frames, ignore_index=True).drop_duplicates("game_id", keep="last") if frames else None
+
+    entities, results = build_head_to_head(games, writer.read_pin("bouts"))
+    writer.write_pin(H2H_ENTITIES_PIN, entities)
+    writer.write_pin(H2H_RESULTS_PIN, results)
+    logger.info(
+        "Head-to-head: %d teams, %d wrestlers, %d results",
+        (entities["kind"] == "team").sum(), (entities["kind"] == "wrestler").sum(), len(results) // 2,
+    )
+    return entities
+
+
+_RESULT_COLUMNS = [
+    "kind", "key", "name", "team", "weight_class", "opponent_key",
+    "date", "game_id", "outcome", "score_for", "score_against", "result",
+]
+
+
+def _both_sides(df: pd.DataFrame, away: dict, home: dict, shared: dict) -> pd.DataFrame:
+    """Stack each result once from the away side and once from the home side."""
+    frames = []
+    for me, them in ((away, home), (home, away)):
+        frames.append(pd.DataFrame({
+            **{column: me[column] for column in ("key", "name", "team", "score_for", "outcome")},
+            "opponent_key": them["key"],
+            "score_against": them["score_for"],
+            **shared,
+        }))
+    return pd.concat(frames, ignore_index=True)[_RESULT_COLUMNS]
+
+
+def _team_results(games: pd.DataFrame | None) -> pd.DataFrame:
+    if games is None or games.empty:
+        return pd.DataFrame(columns=_RESULT_COLUMNS)
+    away_score = pd.to_numeric(games["away_score"], errors="coerce")
+    home_score = pd.to_numeric(games["home_score"], errors="coerce")
+    finals = (games["status"].astype("string") == "Final") & away_score.notna() & home_score.notna() \
+        & games["away_team"].notna() & games["home_team"].notna()
+    df, away_score, home_score = games[finals], away_score[finals], home_score[finals]
+    if df.empty:
+        return pd.DataFrame(columns=_RESULT_COLUMNS)
+
+    margin = (away_score - home_score).to_numpy()
+    sides = {}
+    for side, score, sign in (("away", away_score, 1), ("home", home_score, -1)):
+        names = df[f"{side}_team"].astype(str).str.strip()
+        sides[side] = {
+            "key": names.map(normalize_name).to_numpy(),
+            "name": names.to_numpy(),
+            "team": names.to_numpy(),
+            "score_for": score.to_numpy(),
+            "outcome": np.select([sign * margin > 0, sign * margin < 0], ["W", "L"], "T"),
+        }
+    results = _both_sides(df, sides["away"], sides["home"], {
+        "kind": "team", "weight_class": None, "date": df["date"].to_numpy(),
+        "game_id": df["game_id"].astype(str).to_numpy(), "result": "",
+    })
+    results["result"] = [f"{a:g}-{b:g}" for a, b in zip(results["score_for"], results["score_against"])]
+    return results
+
+
+def _wrestler_results(bouts: pd.DataFrame | None, dates: dict[str, pd.Timestamp]) -> pd.DataFrame:
+    if bouts is None or bouts.empty:
+        return pd.DataFrame(columns=_RESULT_COLUMNS)
+    winner = bouts["winner_side"].astype("string").str.lower()
+    decided = winner.isin(["away", "home"]) & bouts["away_wrestler"].astype("string").fillna("").ne("") \
+        & bouts["home_wrestler"].astype("string").fillna("").ne("")
+    df = bouts[decided]
+    if df.empty:
+        return pd.DataFrame(columns=_RESULT_COLUMNS)
+
+    won = winner[decided].to_numpy()
+    sides = {}
+    for side in ("away", "home"):
+        names = df[f"{side}_wrestler"].astype(str).str.strip()
+        teams = df[f"{side}_team"].astype("string").fillna("").str.strip()
+        ids = df[f"{side}_wrestler_id"].astype("string").fillna("")
+        keys = [
+            wid if wid else f"{normalize_name(team)}/{normalize_name(name)}"
+            for wid, team, name in zip(ids, teams, names)
+        ]
+        sides[side] = {
+            "key": np.array(keys, dtype=object),
+            "name": names.to_numpy(),
+            "team": teams.to_numpy(),
+            "score_for": np.full(len(df), np.nan),
+            "outcome": np.where(won == side, "W", "L"),
+        }
+    game_ids = df["game_id"].astype(str)
+    return _both_sides(df, sides["away"], sides["home"], {
+        "kind": "wrestler", "weight_class": df["weight_class"].to_numpy(),
+        "date": game_ids.map(dates).to_numpy(), "game_id": game_ids.to_numpy(),
+        "result": df["result"].astype("string").fillna("").to_numpy(),
+    })
+
+
+def _game_dates(games: pd.DataFrame | None) -> dict[str, pd.Timestamp]:
+    if games is None or games.empty:
+        return {}
+    return dict(zip(games["game_id"].astype(str), pd.to_datetime(games["date"], errors="coerce")))
+
@@ -0,0 +1,63 @@
+"""Individual wrestler rankings, partitioned by weight class.
+
+The daily ETL publishes every wrestler in ``individual_stats``
+(``INDIVIDUAL_STATS_SCHEMA``, overall order) and each of ``WEIGHT_CLASSES``
+as its own small ``individual_rankings_{weight}`` pin in ``weight_rank``
+order. The app's weight-class view reads only the selected class's pin, a
+few hundred rows instead of the whole stat list, and a class whose
+wrestlers didn't change keeps its version (``PinWriter`` skips unchanged
+content), so readers of that class keep their cached frame.
+
+The class pins are written before ``individual_stats``: once a reader sees
+a new ``individual_stats`` version, the classes it was built with are
+already published.
+"""
+
+import logging
+
+import pandas as pd
+
+from etl.config import WEIGHT_CLASSES
+from etl.pin_writer import PinWriter
+from etl.transformers.individuals import transform_individual_stats
+
+logger = logging.getLogger(__name__)
+
+INDIVIDUAL_STATS_PIN = "individual_stats"
+
+
+def individual_rankings_pin(weight_class: int) -> str:
+    """Name of the rankings pin for one weight class."""
+    return f"individual_rankings_{weight_class}"
+
+
+INDIVIDUAL_RANKINGS_PINS = [individual_rankings_pin(wt) for wt in WEIGHT_CLASSES]
+
+
+def partition_by_weight(df: pd.DataFrame) -> dict[int, pd.DataFrame]:
+    """Split ``individual_stats`` into one frame per weight class, by ``weight_rank``.
+
+    Every class in ``WEIGHT_CLASSES`` gets a frame (empty if nobody wrestles
+    it); wrestlers at other or unknown weights are left out.
+    """
+    weights = df["weight_class"]
+    return {
+        wt: df[weights == wt].sort_values("weight_rank", kind="stable").reset_index(drop=True)
+        for wt in WEIGHT_CLASSES
+    }
+
+
+def refresh_individual_rankings(writer: PinWriter, raw_rows: list[dict]) -> pd.DataFrame:
+    """Normalize the individual stats and publish them overall and per weight class."""
+    df = transform_individual_stats(raw_rows)
+    classes = partition_by_weight(df)
+    changed = [wt for wt, part in classes.items() if writer.write_pin(individual_rankings_pin(wt), part)]
+    writer.write_pin(INDIVIDUAL_STATS_PIN, df)
+
+    unplaced = len(df) - sum(len(part) for part in classes.values())
+    logger.info(
+        "Individual rankings: %d wrestlers, %d/%d weight classes changed%s",
+        len(df), len(changed), len(classes),
+        f", {unplaced} outside WEIGHT_CLASSES" if unplaced else "",
+    )
+    return df
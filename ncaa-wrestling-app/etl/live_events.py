@@ -0,0 +1,212 @@
+"""Change events from the live poller, and the append-only log they go to.
+
+``diff_scoreboards`` compares two ``live_scores`` snapshots keyed on
+``game_id`` and returns one row per change (``LIVE_EVENT_COLUMNS``):
+
+- ``new``: a game that wasn't on the previous scoreboard,
+- ``state``: a ``game_state`` transition (``pre`` -> ``live`` -> ``final``),
+- ``score``: either dual score changed, with the old and new values.
+
+A game can produce several events in one poll (e.g. the last bout both
+changes the score and makes the dual final). ``decided_bouts`` does the
+same for the ``bouts`` pin: bouts that got a winner since the previous
+frame, logged as ``bout`` events (``BOUT_EVENT_COLUMNS``).
+
+``EventLog`` appends each poll's events (``poll_events``) to JSONL segments
+under ``events/`` next to the local pins board. Every event gets the next
+sequence number (``seq``) and a UTC timestamp (``ts``); a segment is named
+after its first ``seq`` and a new one is started once it holds
+``LIVE_EVENTS["segment_events"]``. Consumers keep their own cursor (the last
+``seq`` they handled) and ``read(after=cursor)`` opens only the segments
+past it, so they see just the deltas instead of re-reading and comparing
+full snapshots. The poller is the only writer; a reader that catches a
+half-written last line skips it and sees it on its next read.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from etl.config import LIVE_EVENTS
+from etl.pin_writer import _LOCAL_CACHE_DIR
+
+LIVE_EVENT_COLUMNS = [
+    "game_id", "event", "old_state", "game_state",
+    "away_team", "away_team_full", "home_team", "home_team_full",
+    "old_away_score", "old_home_score", "away_score", "home_score",
+]
+
+BOUT_EVENT_COLUMNS = [
+    "game_id", "event", "weight_class", "bout_number", "winner_side", "decision", "result",
+    "away_wrestler", "away_team", "home_wrestler", "home_team",
+]
+
+_SCORES = ["away_score", "home_score"]
+
+
+def diff_scoreboards(previous: pd.DataFrame | None, current: pd.DataFrame) -> pd.DataFrame:
+    """Events that turn ``previous`` into ``current`` (both ``SCOREBOARD_SCHEMA`` frames)."""
+    if current is None or current.empty:
+        return pd.DataFrame(columns=LIVE_EVENT_COLUMNS)
+    cur = current.drop_duplicates("game_id", keep="last").set_index("game_id")
+    if previous is None or previous.empty:
+        prev = pd.DataFrame(index=pd.Index([], name="game_id"), columns=["game_state", *_SCORES])
+    else:
+        prev = previous.drop_duplicates("game_id", keep="last").set_index("game_id")
+    is_new = pd.Series(~cur.index.isin(prev.index), index=cur.index)
+    prev = prev.reindex(cur.index)
+
+    old_state = prev["game_state"].astype("string")
+    new_state = cur["game_state"].astype("string")
+    state_changed = ~is_new & new_state.ne(old_state).fillna(new_state.notna() | old_state.notna())
+    score_changed = pd.Series(False, index=cur.index)
+    for column in _SCORES:
+        old, new = pd.to_numeric(prev[column], errors="coerce"), pd.to_numeric(cur[column], errors="coerce")
+        score_changed |= old.ne(new).fillna(old.notna() | new.notna())
+    score_changed &= ~is_new
+
+    base = pd.DataFrame({
+        "game_id": cur.index.astype(str),
+        "old_state": old_state.to_numpy(),
+        "game_state": new_state.to_numpy(),
+        **{c: cur[c].to_numpy() if c in cur.columns else None
+           for c in ("away_team", "away_team_full", "home_team", "home_team_full")},
+        "old_away_score": pd.to_numeric(prev["away_score"], errors="coerce").to_numpy(),
+        "old_home_score": pd.to_numeric(prev["home_score"], errors="coerce").to_numpy(),
+        "away_score": pd.to_numeric(cur["away_score"], errors="coerce").to_numpy(),
+        "home_score": pd.to_numeric(cur["home_score"], errors="coerce").to_numpy(),
+    })
+    events = [
+        base[mask.to_numpy()].assign(event=name)
+        for name, mask in (("new", is_new), ("state", state_changed), ("score", score_changed))
+    ]
+    events = [e for e in events if not e.empty]
+    if not events:
+        return pd.DataFrame(columns=LIVE_EVENT_COLUMNS)
+    return pd.concat(events, ignore_index=True)[LIVE_EVENT_COLUMNS]
+
+
+def decided_bouts(previous: pd.DataFrame | None, current: pd.DataFrame | None) -> pd.DataFrame:
+    """Rows of ``current`` (``BOUTS_SCHEMA``) with a winner that ``previous`` didn't have yet."""
+    if current is None or current.empty:
+        return pd.DataFrame(columns=current.columns if current is not None else [])
+    decided = _winner_known(current)
+    if previous is not None and not previous.empty:
+        seen = pd.MultiIndex.from_frame(previous.loc[_winner_known(previous), ["game_id", "bout_number"]])
+        decided &= ~pd.MultiIndex.from_frame(current[["game_id", "bout_number"]]).isin(seen)
+    return current[decided]
+
+
+def poll_events(
+    previous: pd.DataFrame | None,
+    current: pd.DataFrame,
+    previous_bouts: pd.DataFrame | None = None,
+    bouts: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """All events of one poll: the scoreboard's changes, then newly decided bouts.
+
+    Without ``previous_bouts`` there is no baseline for the bouts, so no
+    ``bout`` events are produced (rather than one for every bout of the day).
+    """
+    frames = [diff_scoreboards(previous, current)]
+    if previous_bouts is not None and bouts is not None and not bouts.empty:
+        decided = decided_bouts(previous_bouts, bouts)
+        frames.append(decided.assign(event="bout").reindex(columns=BOUT_EVENT_COLUMNS))
+    frames = [f for f in frames if not f.empty]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["game_id", "event"])
+
+
+def event_log_root() -> Path:
+    """``events/`` next to the local pins board (``pin_cache/`` or ``NCAA_PINS_DIR``)."""
+    return Path(os.environ.get("NCAA_PINS_DIR") or _LOCAL_CACHE_DIR) / LIVE_EVENTS["dir"]
+
+
+class EventLog:
+    """Append-only, sequence-numbered JSONL segments of live events."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root or event_log_root())
+        self.root.mkdir(parents=True, exist_ok=True)
+        segments = self.segments()
+        last = _read_segment(segments[-1][1]) if segments else []
+        self.last_seq = last[-1]["seq"] if last else (segments[-1][0] - 1 if segments else 0)
+        self._segment_events = len(last)
+        if segments and not _ends_cleanly(segments[-1][1]):
+            self._segment_events = LIVE_EVENTS["segment_events"]  # torn write: start a new segment
+
+    def segments(self) -> list[tuple[int, Path]]:
+        """``(first seq, path)`` of every segment, oldest first."""
+        return sorted((int(p.stem), p) for p in self.root.glob("*.jsonl") if p.stem.isdigit())
+
+    def append(self, events: pd.DataFrame) -> int:
+        """Assign sequence numbers to ``events`` and append them. Returns the last ``seq``."""
+        if events.empty:
+            return self.last_seq
+        first = self.last_seq + 1
+        segments = self.segments()
+        if not segments or self._segment_events >= LIVE_EVENTS["segment_events"]:
+            path, self._segment_events = self.root / f"{first:012d}.jsonl", 0
+        else:
+            path = segments[-1][1]
+
+        records = events.assign(
+            seq=range(first, first + len(events)),
+            ts=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+        lines = records.to_json(orient="records", lines=True, date_format="iso")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines if lines.endswith("\n") else lines + "\n")
+        self.last_seq = first + len(events) - 1
+        self._segment_events += len(events)
+        return self.last_seq
+
+    def read(self, after: int = 0, limit: int | None = None) -> pd.DataFrame:
+        """Events with ``seq > after`` (at most ``limit``), oldest first."""
+        segments = self.segments()
+        starts = [first for first, _ in segments] + [None]
+        records: list[dict] = []
+        for (first, path), next_first in zip(segments, starts[1:]):
+            if next_first is not None and next_first <= after + 1:
+                continue  # every event in this segment is at or before the cursor
+            records.extend(r for r in _read_segment(path) if r["seq"] > after)
+            if limit is not None and len(records) >= limit:
+                break
+        records = records[:limit] if limit is not None else records
+        if not records:
+            return pd.DataFrame(columns=["seq", "ts", "game_id", "event"])
+        df = pd.DataFrame.from_records(records)
+        return df[["seq", "ts", *[c for c in df.columns if c not in ("seq", "ts")]]]
+
+    def prune(self, keep_segments: int = LIVE_EVENTS["keep_segments"]) -> int:
+        """Delete all but the newest ``keep_segments`` segments. Returns how many were removed."""
+        old = self.segments()[:-keep_segments] if keep_segments > 0 else []
+        for _, path in old:
+            path.unlink(missing_ok=True)
+        return len(old)
+
+
+def _ends_cleanly(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def _read_segment(path: Path) -> list[dict]:
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # the writer's partial last line
+    return records
+
+
+def _winner_known(bouts: pd.DataFrame) -> pd.Series:
+    return bouts["winner_side"].astype("string").str.lower().isin(["away", "home"]).fillna(False)
@@ -3,9 +3,14 @@
 Wraps the henrygd/ncaa-api which mirrors NCAA.com URL paths and returns JSON.
 Public instance: https://ncaa-api.henrygd.me
 Rate limit: 5 requests/second per IP.
+
+Set ``NCAA_API_BASE_URL`` to point the client elsewhere (e.g. the local stand-in in
+``benchmarks/api_standin.py``).
 """
 
 import logging
+import os
+import threading
 import time
 from datetime import date, datetime, timedelta
 from typing import Any
@@ -21,17 +26,26 @@ _RATE_LIMIT_DELAY = 0.22  # ~4.5 req/s to stay under the 5/s limit
 
 
 class NCAAApiClient:
-    """Client for the NCAA wrestling API."""
+    """Client for the NCAA wrestling API. Safe to share between threads."""
 
-    def __init__(self, base_url: str = NCAA_API_BASE, timeout: float = 30.0):
-        self.base_url = base_url.rstrip("/")
+    def __init__(self, base_url: str | None = None, timeout: float = 30.0):
+        self.base_url = (base_url or os.environ.get("NCAA_API_BASE_URL") or NCAA_API_BASE).rstrip("/")
         self.timeout = timeout
-        self._last_request_time: float = 0.0
+        self._next_request_time: float = 0.0
+        self._throttle_lock = threading.Lock()
 
     def _throttle(self) -> None:
-        elapsed = time.monotonic() - self._last_request_time
-        if elapsed < _RATE_LIMIT_DELAY:
-            time.sleep(_RATE_LIMIT_DELAY - elapsed)
+        """Wait for the next request slot.
+
+        Slots are reserved under a lock, so threads sharing one client stay
+        within the rate limit together while their requests overlap in flight.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + _RATE_LIMIT_DELAY
+        if start > now:
+            time.sleep(start - now)
 
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict | list | None:
         url = f"{self.base_url}{path}"
@@ -39,7 +53,6 @@ class NCAAApiClient:
         try:
             with httpx.Client(timeout=self.timeout) as client:
                 resp = client.get(url, params=params)
-                self._last_request_time = time.monotonic()
                 resp.raise_for_status()
                 return resp.json()
         except httpx.HTTPStatusError as exc:
@@ -64,17 +77,30 @@ class NCAAApiClient:
 
     def get_scoreboard_range(self, start: date, end: date) -> list[dict]:
         """Fetch scoreboards across a date range and merge the games lists."""
-        all_games: list[dict] = []
-        current = start
-        while current <= end:
-            data = self.get_scoreboard(current)
-            if data and "games" in data:
-                for g in data["games"]:
-                    game = g.get("game", g)
-                    game["_fetch_date"] = current.isoformat()
-                    all_games.append(game)
-            current += timedelta(days=1)
-        return all_games
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        by_date = self.get_scoreboards(dates)
+        return [game for d in dates for game in by_date.get(d, [])]
+
+    def get_scoreboards(self, dates: list[date]) -> dict[date, list[dict]]:
+        """Fetch the scoreboard for each of ``dates``.
+
+        Returns ``{date: [game, ...]}`` for every date that was fetched (an
+        empty list when the day has no games). Dates whose request failed are
+        left out, so callers can tell them from days without games. Each game
+        is the inner ``game`` object with an added ``_fetch_date`` field.
+        """
+        by_date: dict[date, list[dict]] = {}
+        for d in dates:
+            data = self.get_scoreboard(d)
+            if data is None:
+                continue
+            games: list[dict] = []
+            for g in data.get("games") or []:
+                game = g.get("game", g)
+                game["_fetch_date"] = d.isoformat()
+                games.append(game)
+            by_date[d] = games
+        return by_date
 
     # ------------------------------------------------------------------
     # Rankings
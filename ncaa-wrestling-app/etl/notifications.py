@@ -0,0 +1,301 @@
+"""Favorite team/wrestler notifications from the live poller.
+
+Subscriptions (a subscriber id, ``team`` or ``wrestler``, and a name) and the
+outbox of matched notifications live in a SQLite file next to the local pins
+board (``NOTIFICATIONS["db_file"]``). After each poll the live poller calls
+``Notifier.consume``, which reads the change-event log (``etl/live_events.py``)
+past its cursor and turns the events into notifications:
+
+- ``start``: a dual went live,
+- ``finish``: a dual went final (with the final score),
+- ``score``: the dual score changed while live,
+- ``bout``: a bout got a winner (for subscribers of either wrestler).
+
+The cursor is stored in the same database and advanced in the same
+transaction as the outbox rows, so every event is notified exactly once
+even if the poller dies between polls.
+
+Events are matched through ``SubscriptionIndex`` — normalized team or
+wrestler name -> array of subscribers, rebuilt only when the subscriptions
+change — so a poll costs O(events + notifications), however many
+subscribers there are. All of a poll's notifications are appended to the
+``outbox`` table in one transaction; delivery (email, push, ...) is a
+separate consumer of ``pending()`` / ``mark_delivered()``.
+
+Subscriptions are managed with ``python etl/run_notifications.py``.
+"""
+
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from etl.config import NOTIFICATIONS
+from etl.live_events import BOUT_EVENT_COLUMNS, LIVE_EVENT_COLUMNS, EventLog
+from etl.pin_writer import _LOCAL_CACHE_DIR
+from etl.search_index import name_variants, normalize_name
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("team", "wrestler")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    subscriber TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (subscriber, kind, key)
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    subscriber TEXT NOT NULL,
+    event TEXT NOT NULL,
+    game_id TEXT,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    delivered_at TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (delivered_at, id);
+CREATE TABLE IF NOT EXISTS cursors (
+    consumer TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+"""
+
+
+def notifications_db() -> Path:
+    """The SQLite file next to the local pins board (``pin_cache/`` or ``NCAA_PINS_DIR``)."""
+    return Path(os.environ.get("NCAA_PINS_DIR") or _LOCAL_CACHE_DIR) / NOTIFICATIONS["db_file"]
+
+
+class SubscriptionStore:
+    """Subscriptions and the notification outbox in one SQLite database."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path or notifications_db())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # readers/other writers don't block the poller
+        self._conn.executescript(_SCHEMA)
+        self._writes = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def subscribe(self, subscriber: str, kind: str, name: str) -> bool:
+        """Follow a team or wrestler. Returns ``False`` if already subscribed."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown subscription kind {kind!r} (expected one of {KINDS})")
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO subscriptions VALUES (?, ?, ?, ?, ?)",
+                (subscriber, kind, normalize_name(name), name.strip(), _now()),
+            )
+        self._writes += 1
+        return cursor.rowcount > 0
+
+    def unsubscribe(self, subscriber: str, kind: str | None = None, name: str | None = None) -> int:
+        """Drop one subscription, or all of ``subscriber``'s. Returns how many were removed."""
+        query, params = "DELETE FROM subscriptions WHERE subscriber = ?", [subscriber]
+        if kind is not None:
+            query, params = query + " AND kind = ?", params + [kind]
+        if name is not None:
+            query, params = query + " AND key = ?", params + [normalize_name(name)]
+        with self._conn:
+            removed = self._conn.execute(query, params).rowcount
+        self._writes += 1
+        return removed
+
+    def subscriptions(self) -> pd.DataFrame:
+        return pd.read_sql_query(
+            "SELECT subscriber, kind, key, name, created_at FROM subscriptions ORDER BY kind, key, subscriber",
+            self._conn,
+        )
+
+    def version(self) -> tuple[int, int]:
+        """Changes whenever the subscriptions may have changed (here or in another process)."""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0], self._writes
+
+    def cursor(self, consumer: str) -> int | None:
+        """Last event-log ``seq`` handled by ``consumer`` (``None`` if it never ran)."""
+        row = self._conn.execute("SELECT seq FROM cursors WHERE consumer = ?", (consumer,)).fetchone()
+        return row[0] if row else None
+
+    def enqueue(self, rows: list[tuple], cursor: tuple[str, int] | None = None) -> int:
+        """Append ``(created_at, subscriber, event, game_id, subject, message)`` rows to the outbox.
+
+        ``cursor`` (consumer, seq) is saved in the same transaction.
+        """
+        with self._conn:
+            if rows:
+                self._conn.executemany(
+                    "INSERT INTO outbox (created_at, subscriber, event, game_id, subject, message) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            if cursor is not None:
+                self._conn.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)", cursor)
+        return len(rows)
+
+    def pending(self, limit: int = 1000) -> pd.DataFrame:
+        """Undelivered notifications, oldest first."""
+        return pd.read_sql_query(
+            "SELECT id, created_at, subscriber, event, game_id, subject, message FROM outbox "
+            "WHERE delivered_at IS NULL ORDER BY id LIMIT ?",
+            self._conn, params=(limit,),
+        )
+
+    def mark_delivered(self, ids) -> int:
+        now = _now()
+        with self._conn:
+            return self._conn.executemany(
+                "UPDATE outbox SET delivered_at = ? WHERE id = ?", [(now, int(i)) for i in ids],
+            ).rowcount
+
+    def prune_delivered(self, keep_days: int = NOTIFICATIONS["delivered_keep_days"]) -> int:
+        """Delete notifications delivered more than ``keep_days`` ago."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=keep_days)).isoformat(timespec="seconds")
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM outbox WHERE delivered_at IS NOT NULL AND delivered_at < ?", (cutoff,),
+            ).rowcount
+
+
+class SubscriptionIndex:
+    """``(kind, normalized name)`` -> subscribers, over one version of the subscriptions."""
+
+    def __init__(self, subscriptions: pd.DataFrame):
+        self._subscribers: dict[tuple[str, str], np.ndarray] = {
+            key: group.to_numpy(dtype=object)
+            for key, group in subscriptions.groupby(["kind", "key"], sort=False)["subscriber"]
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def kinds(self) -> set[str]:
+        return {kind for kind, _ in self._subscribers}
+
+    def match(self, kind: str, names) -> np.ndarray:
+        """Distinct subscribers of any of ``names`` (each also tried with its "St."/"State" swap)."""
+        hits = [
+            self._subscribers[(kind, key)]
+            for name in names if isinstance(name, str) and name
+            for key in name_variants(name) if (kind, key) in self._subscribers
+        ]
+        if not hits:
+            return np.array([], dtype=object)
+        return hits[0] if len(hits) == 1 else np.unique(np.concatenate(hits))
+
+
+class Notifier:
+    """Turns consecutive poll results into outbox rows for the matching subscribers."""
+
+    def __init__(self, store: SubscriptionStore | None = None, events: list[str] | None = None):
+        self.store = store or SubscriptionStore()
+        self.events = set(events or NOTIFICATIONS["events"])
+        self._index: tuple[tuple[int, int], SubscriptionIndex] | None = None
+
+    def index(self) -> SubscriptionIndex:
+        version = self.store.version()
+        if self._index is None or self._index[0] != version:
+            self._index = (version, SubscriptionIndex(self.store.subscriptions()))
+        return self._index[1]
+
+    def consume(self, log: EventLog, consumer: str = "notifications") -> int:
+        """Queue notifications for the log's events since this consumer's cursor.
+
+        Returns how many were queued. On its first run (or when the log was
+        reset behind it) the cursor starts at the end of the log, so history
+        isn't announced.
+        """
+        cursor = self.store.cursor(consumer)
+        if cursor is None or cursor > log.last_seq:
+            self.store.enqueue([], cursor=(consumer, log.last_seq))
+            return 0
+        events = log.read(after=cursor)
+        if events.empty:
+            return 0
+
+        queued = self.store.enqueue(self.notifications(events), cursor=(consumer, int(events["seq"].max())))
+        if queued:
+            logger.info("Notifications: %d queued for events %d-%d", queued, cursor + 1, events["seq"].max())
+        return queued
+
+    def notifications(self, events: pd.DataFrame) -> list[tuple]:
+        """Outbox rows for ``events`` (``etl.live_events`` event rows) and the current subscriptions."""
+        index = self.index()
+        rows: list[tuple] = []
+        if not index:
+            return rows
+        now = _now()
+        if "team" in index.kinds():
+            for event, game_id, subject, message, teams in _game_events(events, self.events):
+                subscribers = index.match("team", teams)
+                rows.extend((now, s, event, game_id, subject, message) for s in subscribers)
+        if "bout" in self.events and "wrestler" in index.kinds():
+            for game_id, subject, message, wrestlers in _bout_events(events):
+                subscribers = index.match("wrestler", wrestlers)
+                rows.extend((now, s, "bout", game_id, subject, message) for s in subscribers)
+        return rows
+
+
+def _game_events(events: pd.DataFrame, wanted: set[str]):
+    """``(event, game_id, subject, message, team names)`` for each start/finish/score change."""
+    diff = events[events["event"].isin(["new", "state", "score"])].reindex(columns=LIVE_EVENT_COLUMNS)
+    if diff.empty:
+        return
+    state = diff["game_state"].astype("string").str.lower()
+    old_state = diff["old_state"].astype("string").str.lower()
+    started = ((diff["event"] == "state") & (state == "live") & (old_state != "live").fillna(True)) \
+        | ((diff["event"] == "new") & (state == "live"))
+    finished = (diff["event"] == "state") & (state == "final")
+    scored = (diff["event"] == "score") & (state == "live") \
+        & (diff["old_away_score"].notna() | diff["old_home_score"].notna())  # not the first 0-0
+    # The final whistle's score change is part of the "finish" message
+    scored &= ~diff["game_id"].isin(diff.loc[finished, "game_id"])
+
+    for event, mask in (("start", started), ("finish", finished), ("score", scored)):
+        if event not in wanted:
+            continue
+        for row in diff[mask.fillna(False).to_numpy()].itertuples(index=False):
+            subject = f"{row.away_team} at {row.home_team}"
+            score = f"{row.away_team} {_score(row.away_score)}, {row.home_team} {_score(row.home_score)}"
+            message = {
+                "start": f"{subject} has started",
+                "finish": f"Final: {score}",
+                "score": score,
+            }[event]
+            teams = (row.away_team, row.away_team_full, row.home_team, row.home_team_full)
+            yield event, row.game_id, subject, message, teams
+
+
+def _bout_events(events: pd.DataFrame):
+    """``(game_id, subject, message, wrestler names)`` for each newly decided bout."""
+    for row in events[events["event"] == "bout"].reindex(columns=BOUT_EVENT_COLUMNS).itertuples(index=False):
+        won_away = str(row.winner_side).lower() == "away"
+        winner, loser = (row.away_wrestler, row.home_wrestler) if won_away else (row.home_wrestler, row.away_wrestler)
+        winner_team, loser_team = (row.away_team, row.home_team) if won_away else (row.home_team, row.away_team)
+        weight = f"{row.weight_class:g} " if pd.notna(row.weight_class) else ""
+        result = f" ({row.result})" if isinstance(row.result, str) and row.result else ""
+        yield (
+            row.game_id,
+            f"{row.away_wrestler} vs {row.home_wrestler}",
+            f"{weight}{winner} ({winner_team}) def. {loser} ({loser_team}){result}",
+            (row.away_wrestler, row.home_wrestler),
+        )
+
+
+def _score(value) -> str:
+    return "" if pd.isna(value) else f"{value:g}"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
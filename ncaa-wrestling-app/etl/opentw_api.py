@@ -2,9 +2,13 @@
 
 The OpenTW API is a middleware that parses TrackWrestling into structured JSON.
 GitHub: https://github.com/vehbiu/opentw-api
+
+Set ``OPENTW_API_BASE_URL`` to point the client elsewhere (e.g. the local stand-in in
+``benchmarks/api_standin.py``).
 """
 
 import logging
+import os
 from typing import Any
 
 import httpx
@@ -17,8 +21,8 @@ OPENTW_BASE = "https://opentw-api.henrygd.me"
 class OpenTWClient:
     """Client for the OpenTW (TrackWrestling) API."""
 
-    def __init__(self, base_url: str = OPENTW_BASE, timeout: float = 30.0):
-        self.base_url = base_url.rstrip("/")
+    def __init__(self, base_url: str | None = None, timeout: float = 30.0):
+        self.base_url = (base_url or os.environ.get("OPENTW_API_BASE_URL") or OPENTW_BASE).rstrip("/")
         self.timeout = timeout
 
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict | list | None:
@@ -0,0 +1,308 @@
+"""Version retention and compaction for the NCAA wrestling pins board.
+
+Every ETL write creates a new pin version (``PINS_CONFIG["versioned"]``), and
+nothing removed old ones. The live-score job alone produced hundreds of
+``live_scores`` versions per event day. Over time that grows ``pin_cache/``
+(or the Connect content store) and slows down ``pin_meta`` / ``pin_versions``.
+
+Retention (``apply_retention``) keeps, per pin:
+
+- the newest ``keep_last`` versions,
+- the newest version of each day for the last ``keep_daily_days`` days,
+- and then trims the oldest of those until the total size fits ``max_bytes``.
+
+The most recent version is never deleted. Policies live in
+``etl.config.PINS_RETENTION`` and are applied by the ETL after it writes.
+
+Compaction (``compact_live_scores``) folds ``live_scores`` versions into one
+``live_scores_history_<season>`` pin per season: a Parquet file with one row
+group per game date that holds only the snapshots where a game changed. It
+is incremental — each run folds only the versions created after the
+history's ``compacted_through`` time — and the daily ETL runs it. Pins whose
+policy sets ``compact_first`` (``live_scores``) only ever lose versions that
+are already in a history pin.
+
+Usage::
+
+    python etl/pin_retention.py prune
+    python etl/pin_retention.py compact [--season 2026] [--delete-versions]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from etl.config import PINS_RETENTION
+from etl.pin_writer import PinWriter, _pin_name
+
+logger = logging.getLogger(__name__)
+
+# Columns that identify a distinct state of a game in the live scoreboard
+_LIVE_STATE_COLUMNS = [
+    "game_state", "away_score", "home_score", "current_period",
+    "contest_clock", "final_message", "away_winner", "home_winner",
+]
+
+
+def season_for_date(d: date) -> int:
+    """Return the season year for a date (the 2025-26 season is ``2026``).
+
+    Seasons roll over on July 1, well clear of the November–March schedule.
+    """
+    return d.year + 1 if d.month >= 7 else d.year
+
+
+def retention_policy(name: str) -> dict:
+    """Return the retention settings for a short pin name."""
+    policy = dict(PINS_RETENTION["default"])
+    policy.update(PINS_RETENTION.get(name, {}))
+    return policy
+
+
+def history_pin(season: int) -> str:
+    """Short name of a season's compacted ``live_scores`` history pin."""
+    return f"live_scores_history_{season}"
+
+
+def select_versions_to_delete(
+    versions: pd.DataFrame,
+    keep_last: int | None = None,
+    keep_daily_days: int | None = None,
+    max_bytes: int | None = None,
+    now: datetime | None = None,
+) -> list[str]:
+    """Choose which versions a policy would delete.
+
+    Args:
+        versions: One row per version with ``version`` and ``created`` columns
+            (and ``file_size`` when ``max_bytes`` is set), in any order.
+        keep_last: Always keep this many of the newest versions.
+        keep_daily_days: Keep the newest version of each day within this many days.
+        max_bytes: Trim the oldest kept versions until their total size fits.
+        now: Reference time for ``keep_daily_days`` (defaults to now, UTC).
+
+    Returns:
+        Version identifiers to delete. Never includes the newest version.
+    """
+    if versions.empty:
+        return []
+    # Version times are compared in UTC; naive values are taken to be UTC.
+    now = pd.Timestamp(now or datetime.now(timezone.utc))
+    now = now.tz_localize("UTC") if now.tzinfo is None else now
+    ordered = versions.assign(created=pd.to_datetime(versions["created"], utc=True))
+    ordered = ordered.sort_values("created", ascending=False).reset_index(drop=True)
+
+    keep = {ordered.loc[0, "version"]}
+    if keep_last:
+        keep.update(ordered["version"].head(keep_last))
+    if keep_daily_days:
+        cutoff = now - timedelta(days=keep_daily_days)
+        recent = ordered[ordered["created"] >= cutoff]
+        daily = recent.groupby(recent["created"].dt.date, sort=False).head(1)
+        keep.update(daily["version"])
+
+    if max_bytes is not None and "file_size" in ordered.columns:
+        total = 0
+        for i, row in ordered.iterrows():
+            if row["version"] not in keep:
+                continue
+            total += int(row["file_size"] or 0)
+            if total > max_bytes and i > 0:
+                keep.discard(row["version"])
+
+    return [v for v in ordered["version"] if v not in keep]
+
+
+def list_versions(writer: PinWriter, name: str, with_sizes: bool = False) -> pd.DataFrame:
+    """Return ``version``/``created`` (and optionally ``file_size``) for a pin."""
+    full_name = _pin_name(name)
+    versions = writer.board.pin_versions(full_name)
+    if versions.empty:
+        return pd.DataFrame(columns=["version", "created", "file_size"])
+
+    needs_meta = with_sizes or "created" not in versions.columns
+    if needs_meta:
+        # Connect only lists version ids — fill in the rest from each version's meta.
+        metas = [writer.board.pin_meta(full_name, v) for v in versions["version"]]
+        versions = versions.assign(
+            created=[m.created for m in metas],
+            file_size=[_total_size(m.file_size) for m in metas],
+        )
+    versions["created"] = pd.to_datetime(versions["created"], utc=True)
+    return versions
+
+
+def apply_retention(writer: PinWriter, names: list[str]) -> dict[str, int]:
+    """Apply each pin's retention policy. Returns versions deleted per pin."""
+    deleted: dict[str, int] = {}
+    for name in names:
+        policy = retention_policy(name)
+        compact_first = policy.pop("compact_first", False)
+        try:
+            if not writer.pin_exists(name):
+                continue
+            versions = list_versions(writer, name, with_sizes=policy.get("max_bytes") is not None)
+            doomed = select_versions_to_delete(versions, **policy)
+            if compact_first and doomed:
+                doomed = _compacted_only(writer, versions, doomed)
+        except Exception as exc:
+            logger.warning("Could not evaluate retention for '%s': %s", name, exc)
+            continue
+
+        full_name = _pin_name(name)
+        for version in doomed:
+            writer.board.pin_version_delete(full_name, version)
+        deleted[name] = len(doomed)
+        if doomed:
+            logger.info("Retention: deleted %d old versions of '%s'", len(doomed), full_name)
+    return deleted
+
+
+def compact_live_scores(writer: PinWriter, season: int | None = None, delete_versions: bool = False) -> int:
+    """Fold ``live_scores`` versions into each season's history pin.
+
+    Only versions created after a history's ``compacted_through`` time are
+    read; each is tagged with its ``snapshot_at`` time and appended to the
+    existing history, and rows that repeat a game's previous state are
+    dropped. The history is written sorted by ``start_date`` with one row
+    group per date, so readers can pull a single day without scanning the
+    season.
+
+    Args:
+        season: Compact only this season (default: every season with versions).
+        delete_versions: Delete the season's folded versions afterwards
+            (except the newest ``live_scores`` version).
+
+    Returns the number of history rows written.
+    """
+    full_name = _pin_name("live_scores")
+    if not writer.pin_exists("live_scores"):
+        return 0
+    versions = list_versions(writer, "live_scores").sort_values("created")
+    seasons = versions["created"].dt.date.map(season_for_date)
+    written = 0
+    for s in [season] if season is not None else sorted(int(s) for s in seasons.unique()):
+        in_season = versions[seasons == s]
+        if in_season.empty:
+            logger.info("No live_scores versions found for season %d", s)
+            continue
+        history, through = _read_history(writer, s)
+        new = in_season if through is None else in_season[in_season["created"] > through]
+
+        frames = [] if history is None else [history]
+        for version, created in zip(new["version"], new["created"]):
+            snap = writer.board.pin_read(full_name, version=version)
+            if not snap.empty:
+                frames.append(snap.assign(snapshot_at=created))
+        if not new.empty and frames:
+            history = _drop_repeated_states(pd.concat(frames, ignore_index=True))
+            _write_history_pin(writer, history_pin(s), history, s, new["created"].iloc[-1])
+            written += len(history)
+        logger.info("Compacted %d new live_scores versions for season %d", len(new), s)
+
+        if delete_versions:
+            latest = versions["version"].iloc[-1]
+            for version in in_season["version"]:
+                if version != latest:
+                    writer.board.pin_version_delete(full_name, version)
+    return written
+
+
+def _read_history(writer: PinWriter, season: int) -> tuple[pd.DataFrame | None, pd.Timestamp | None]:
+    """A season's history pin and the version time it is compacted through."""
+    full_name = _pin_name(history_pin(season))
+    try:
+        meta = writer.board.pin_meta(full_name)
+        paths = writer.board.pin_download(full_name)
+    except Exception:
+        return None, None
+    through = meta.user.get("compacted_through")
+    history = pq.read_table(paths[0]).to_pandas()
+    return history, pd.Timestamp(through) if through else None
+
+
+def _compacted_through(writer: PinWriter, season: int) -> pd.Timestamp | None:
+    try:
+        through = writer.board.pin_meta(_pin_name(history_pin(season))).user.get("compacted_through")
+    except Exception:
+        return None
+    return pd.Timestamp(through) if through else None
+
+
+def _compacted_only(writer: PinWriter, versions: pd.DataFrame, doomed: list[str]) -> list[str]:
+    """The versions in ``doomed`` that are already folded into their season's history pin."""
+    created = versions.set_index("version")["created"]
+    seasons = created.dt.date.map(season_for_date)
+    through = {s: _compacted_through(writer, s) for s in seasons[doomed].unique()}
+    return [v for v in doomed if through[seasons[v]] is not None and created[v] <= through[seasons[v]]]
+
+
+def _drop_repeated_states(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only snapshots where a game's state differs from its previous snapshot."""
+    df = df.sort_values(["game_id", "snapshot_at"], kind="stable").reset_index(drop=True)
+    state_cols = [c for c in _LIVE_STATE_COLUMNS if c in df.columns]
+    state = df[state_cols].astype(str).agg("|".join, axis=1)
+    changed = (df["game_id"] != df["game_id"].shift()) | (state != state.shift())
+    return df[changed].reset_index(drop=True)
+
+
+def _write_history_pin(
+    writer: PinWriter, name: str, history: pd.DataFrame, season: int, compacted_through: pd.Timestamp,
+) -> None:
+    history = history.sort_values(["start_date", "snapshot_at"], kind="stable").reset_index(drop=True)
+    table = pa.Table.from_pandas(history, preserve_index=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"{name}.parquet"
+        with pq.ParquetWriter(path, table.schema) as pf:
+            for _, idx in history.groupby("start_date", sort=True, dropna=False).indices.items():
+                pf.write_table(table.take(idx))
+        writer.board.pin_upload(
+            str(path),
+            _pin_name(name),
+            title=f"NCAA wrestling live score history, {season - 1}-{str(season)[-2:]} season",
+            metadata={
+                "season": season,
+                "row_groups": "start_date",
+                "compacted_through": compacted_through.isoformat(),
+            },
+        )
+    logger.info("Wrote history pin '%s': %d rows", _pin_name(name), len(history))
+
+
+def _total_size(file_size) -> int:
+    if isinstance(file_size, (list, tuple)):
+        return sum(file_size)
+    return int(file_size or 0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    parser = argparse.ArgumentParser(description="Prune or compact NCAA wrestling pin versions.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    prune = sub.add_parser("prune", help="Apply retention policies to every ETL pin.")
+    prune.add_argument("names", nargs="*", help="Short pin names (default: all configured pins).")
+    compact = sub.add_parser("compact", help="Fold new live_scores versions into the season history pins.")
+    compact.add_argument("--season", type=int, default=None, help="Only this season (default: all).")
+    compact.add_argument("--delete-versions", action="store_true",
+                         help="Delete the folded live_scores versions afterwards.")
+    args = parser.parse_args()
+
+    writer = PinWriter()
+    if args.command == "prune":
+        apply_retention(writer, args.names or PINS_RETENTION["pins"])
+    else:
+        compact_live_scores(writer, args.season, delete_versions=args.delete_versions)
@@ -6,16 +6,22 @@ On Posit Connect:
     (injected automatically when content runs on Connect).
 
 For local development:
-    Falls back to ``pins.board_folder()`` using a local ``pin_cache/`` directory.
-    Set CONNECT_SERVER + CONNECT_API_KEY env vars to test against a real board.
+    Falls back to ``pins.board_folder()`` using a local ``pin_cache/`` directory
+    (or ``NCAA_PINS_DIR`` if set). Set CONNECT_SERVER + CONNECT_API_KEY env vars
+    to test against a real board.
 """
 
+import hashlib
 import logging
 import os
+import time
 from pathlib import Path
 
 import pandas as pd
 import pins
+from pins.boards import BaseBoard
+
+from etl.config import PINS_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +36,11 @@ def _is_on_connect() -> bool:
     return bool(os.environ.get("CONNECT_SERVER"))
 
 
-def get_board() -> pins.BaseBoard:
+def get_board() -> BaseBoard:
     """Return the appropriate pins board for the current environment.
 
     On Connect: ``board_connect()`` using env vars.
-    Locally: ``board_folder()`` writing to ``pin_cache/``.
+    Locally: ``board_folder()`` writing to ``pin_cache/`` (or ``NCAA_PINS_DIR``).
     """
     if _is_on_connect():
         logger.info("Using Posit Connect pins board")
@@ -44,52 +50,152 @@ def get_board() -> pins.BaseBoard:
             allow_pickle_read=False,
         )
     else:
-        _LOCAL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        logger.info("Using local pins board at %s", _LOCAL_CACHE_DIR)
-        return pins.board_folder(_LOCAL_CACHE_DIR, allow_pickle_read=False)
+        cache_dir = Path(os.environ.get("NCAA_PINS_DIR") or _LOCAL_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.info("Using local pins board at %s", cache_dir)
+        return pins.board_folder(cache_dir, allow_pickle_read=False)
 
 
 def _pin_name(name: str) -> str:
-    """Build the full pin name with prefix."""
-    return f"{PIN_PREFIX}/{name}"
+    """Build the full pin name with prefix.
+
+    Connect pin names are ``owner/name``; folder boards reject ``/``, so local
+    pins are named ``ncaa_wrestling__name`` instead.
+    """
+    separator = "/" if _is_on_connect() else "__"
+    return f"{PIN_PREFIX}{separator}{name}"
+
+
+def frame_content_hash(df: pd.DataFrame) -> str:
+    """Return a stable hex digest of a DataFrame's columns, dtypes and values."""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+        digest.update(row_hashes.to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cell values (lists/dicts) — fall back to a JSON rendering.
+        digest.update(df.to_json(orient="split", date_format="iso").encode())
+    return digest.hexdigest()
 
 
 class PinWriter:
-    """Write DataFrames to the pins board."""
+    """Write DataFrames to the pins board.
 
-    def __init__(self):
+    The board listing and each pin's latest metadata are cached for
+    ``PINS_CONFIG["meta_ttl_seconds"]`` and kept current as the writer
+    writes, so existence/version checks don't hit the board — a network
+    round trip on Connect — every time. The TTL keeps a long-lived writer
+    (the live daemon) from missing pins or versions published by other jobs.
+    """
+
+    def __init__(self, meta_ttl: float | None = None):
         self.board = get_board()
+        self.meta_ttl = float(PINS_CONFIG["meta_ttl_seconds"] if meta_ttl is None else meta_ttl)
+        self._pin_names: tuple[float, set[str]] | None = None
+        self._metas: dict[str, tuple[float, pins.meta.Meta | None]] = {}
+
+    def write_pin(self, name: str, df: pd.DataFrame, force: bool = False, metadata: dict | None = None) -> bool:
+        """Write a DataFrame as a pin, unless its content is unchanged.
 
-    def write_pin(self, name: str, df: pd.DataFrame) -> None:
-        """Write a DataFrame as a pin.
+        A content hash of the frame (and ``metadata``) is stored in the pin's
+        user metadata. When the latest version already carries the same hash
+        the write is skipped, so unchanged data doesn't create a new version
+        (or invalidate readers' caches).
 
         Args:
             name: Short pin name (e.g. ``"rankings"``). Will be prefixed
-                  with ``ncaa_wrestling/``.
+                  with ``ncaa_wrestling/`` on Connect and
+                  ``ncaa_wrestling__`` on folder boards (see ``_pin_name``).
             df: The DataFrame to persist.
+            force: Write a new version even if the content is unchanged.
+            metadata: Extra user metadata for readers (e.g. the parameters
+                  the frame was computed with).
+
+        Returns:
+            ``True`` if a new version was written, ``False`` if it was skipped.
         """
         full_name = _pin_name(name)
-        self.board.pin_write(df, full_name, type="parquet")
+        content_hash = frame_content_hash(df)
+        if metadata:
+            content_hash = hashlib.sha256((content_hash + repr(sorted(metadata.items()))).encode()).hexdigest()
+        if not force and self._latest_content_hash(full_name) == content_hash:
+            logger.info("Pin '%s' unchanged (%d rows) — skipping write", full_name, len(df))
+            return False
+
+        meta = self.board.pin_write(
+            df, full_name, type="parquet", metadata={**(metadata or {}), "content_hash": content_hash},
+        )
+        self._metas[full_name] = (time.monotonic(), meta)
+        if self._pin_names is not None:
+            self._pin_names[1].add(full_name)
         logger.info("Wrote pin '%s': %d rows", full_name, len(df))
+        return True
+
+    def _latest_content_hash(self, full_name: str) -> str | None:
+        meta = self._latest_meta(full_name)
+        return meta.user.get("content_hash") if meta is not None else None
+
+    def _list_pins(self) -> set[str]:
+        """Full names of every pin on the board (cached per TTL)."""
+        now = time.monotonic()
+        if self._pin_names is None or now - self._pin_names[0] >= self.meta_ttl:
+            try:
+                self._pin_names = (now, set(self.board.pin_list()))
+            except Exception as exc:
+                logger.warning("Could not list pins: %s", exc)
+                return set()
+        return self._pin_names[1]
+
+    def _latest_meta(self, full_name: str) -> pins.meta.Meta | None:
+        """Latest-version metadata for a pin (cached per TTL)."""
+        now = time.monotonic()
+        cached = self._metas.get(full_name)
+        if cached is not None and now - cached[0] < self.meta_ttl:
+            return cached[1]
+        meta = None
+        if full_name in self._list_pins():
+            try:
+                meta = self.board.pin_meta(full_name)
+            except Exception:
+                meta = None
+        self._metas[full_name] = (now, meta)
+        return meta
+
+    def read_pin(self, name: str) -> pd.DataFrame | None:
+        """Read the latest version of a pin, or ``None`` if it doesn't exist yet."""
+        full_name = _pin_name(name)
+        try:
+            if full_name not in self._list_pins():
+                return None
+            return self.board.pin_read(full_name)
+        except Exception as exc:
+            logger.info("No existing pin '%s' (%s)", full_name, exc)
+            return None
 
     def pin_exists(self, name: str) -> bool:
         """Check if a pin exists on the board."""
-        full_name = _pin_name(name)
-        try:
-            existing = self.board.pin_list()
-            return full_name in existing
-        except Exception:
-            return False
+        return _pin_name(name) in self._list_pins()
 
     def get_pin_meta(self, name: str) -> dict | None:
         """Read pin metadata (version info, created time)."""
         full_name = _pin_name(name)
-        try:
-            meta = self.board.pin_meta(full_name)
-            return {
-                "name": full_name,
-                "created": str(meta.created),
-                "version": str(meta.version),
-            }
-        except Exception:
+        meta = self._latest_meta(full_name)
+        if meta is None:
             return None
+        return {
+            "name": full_name,
+            "created": str(meta.created),
+            "version": str(meta.version.version),
+        }
+
+    def describe_pins(self) -> dict[str, dict]:
+        """Return ``get_pin_meta`` for every ``ncaa_wrestling`` pin, keyed by short name."""
+        prefix = _pin_name("")
+        described = {}
+        for full_name in sorted(self._list_pins()):
+            if full_name.startswith(prefix):
+                meta = self.get_pin_meta(full_name[len(prefix):])
+                if meta is not None:
+                    described[full_name[len(prefix):]] = meta
+        return described
@@ -0,0 +1,110 @@
+"""Rankings history: every team's poll rank, week by week, as one compact pin.
+
+The ``rankings`` pin only holds the current poll (with ``previous_rank``),
+so a team's trajectory over the season is lost. The ``rankings_history``
+pin keeps one row per (team, poll week) in ``RANKINGS_HISTORY_SCHEMA``:
+
+- teams are integer-coded: ``team_id`` is assigned on a team's first
+  appearance and never changes, so ids stay valid across versions,
+- rows are sorted by ``team_id`` then ``week``, so a team's full series is
+  one contiguous slice — the app indexes the slice boundaries once per pin
+  version and answers a series query without scanning (see
+  ``app/utils/rank_history.py``).
+
+Each daily run upserts the current poll under the week's Monday. The first
+run against a board without the pin seeds it from the season archive.
+"""
+
+import logging
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from etl.archive import read_archive
+from etl.pin_retention import season_for_date
+from etl.pin_writer import PinWriter
+from etl.transformers.schemas import RANKINGS_HISTORY_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+RANKINGS_HISTORY_PIN = "rankings_history"
+
+_POLL_COLUMNS = ["school", "rank", "points", "wins", "losses"]
+
+
+def poll_week(day: date) -> date:
+    """The Monday of ``day``'s week, which keys a poll."""
+    return day - timedelta(days=day.weekday())
+
+
+def update_rankings_history(history: pd.DataFrame | None, rankings: pd.DataFrame, week: date) -> pd.DataFrame:
+    """Upsert one poll into the history.
+
+    The rows already stored for ``week`` are replaced by ``rankings``; teams
+    seen for the first time get the next free ``team_id``.
+    """
+    if history is None or history.empty:
+        history = conform(pd.DataFrame(), RANKINGS_HISTORY_SCHEMA)
+    if rankings.empty:
+        return history
+
+    poll = rankings[[c for c in _POLL_COLUMNS if c in rankings.columns]].copy()
+    poll = poll[poll["school"].astype("string").fillna("") != ""]
+    poll = poll.drop_duplicates(subset=["school"], keep="first")
+    poll["week"] = pd.Timestamp(week)
+    poll["season"] = season_for_date(week)
+    poll["team_id"] = _assign_team_ids(history, poll["school"])
+
+    kept = history[history["week"] != pd.Timestamp(week)]
+    merged = conform(pd.concat([kept.astype({"school": "string"}), poll], ignore_index=True),
+                     RANKINGS_HISTORY_SCHEMA)
+    return merged.sort_values(["team_id", "week"], kind="stable").reset_index(drop=True)
+
+
+def history_from_archive(root: Path | None = None) -> pd.DataFrame:
+    """Rebuild the history from every poll week in the season archive."""
+    archived = read_archive("rankings", columns=["date", *_POLL_COLUMNS], root=root)
+    if archived.empty:
+        return conform(pd.DataFrame(), RANKINGS_HISTORY_SCHEMA)
+    history = None
+    for week, poll in archived.groupby("date", sort=True):
+        history = update_rankings_history(history, poll.sort_values("rank"), week.date())
+    return history
+
+
+def refresh_rankings_history(
+    writer: PinWriter,
+    rankings: pd.DataFrame,
+    today: date | None = None,
+    archive_root: Path | None = None,
+) -> pd.DataFrame:
+    """Add the current poll to the ``rankings_history`` pin.
+
+    When the pin doesn't exist yet it is seeded from the archive (which the
+    daily run has already updated with this week's poll).
+    """
+    week = poll_week(today or date.today())
+    history = writer.read_pin(RANKINGS_HISTORY_PIN)
+    if history is None or history.empty:
+        history = history_from_archive(archive_root)
+    history = update_rankings_history(history, rankings, week)
+    writer.write_pin(RANKINGS_HISTORY_PIN, history)
+    logger.info(
+        "Rankings history: %d rows, %d teams, %d poll weeks",
+        len(history), history["team_id"].nunique(), history["week"].nunique(),
+    )
+    return history
+
+
+def _assign_team_ids(history: pd.DataFrame, schools: pd.Series) -> pd.Series:
+    """Existing ids for known schools, the next free ids (in poll order) for new ones."""
+    known = dict(zip(history["school"].astype(str), history["team_id"].astype(int)))
+    next_id = max(known.values(), default=-1) + 1
+    ids = []
+    for school in schools.astype(str):
+        if school not in known:
+            known[school] = next_id
+            next_id += 1
+        ids.append(known[school])
+    return pd.Series(ids, index=schools.index)
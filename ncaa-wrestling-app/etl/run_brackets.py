@@ -0,0 +1,78 @@
+"""NCAA Championships bracket job.
+
+Fetches the tournament's brackets from the OpenTW API, updates the
+``brackets`` pin (``etl/brackets.py``; only newly final matches are applied
+to the published brackets) and runs the Monte Carlo simulation
+(``etl/bracket_sim.py``), publishing placement and team-title probabilities
+as pins. Run it before the tournament for
+pre-tournament odds and on a schedule during the tournament weekend:
+completed matches are fixed, so the odds tighten as results come in.
+
+Usage::
+
+    python etl/run_brackets.py
+    python etl/run_brackets.py --tournament-id 123456 --simulations 20000 --seed 1
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from etl.brackets import BRACKETS_PIN, refresh_brackets
+from etl.bracket_sim import SIM_TEAMS_PIN, SIM_WRESTLERS_PIN, refresh_bracket_simulation
+from etl.config import NCAA_TOURNAMENT
+from etl.opentw_api import OpenTWClient
+from etl.pin_retention import apply_retention
+from etl.pin_writer import PinWriter
+from etl.team_scores import TEAM_SCORES_PIN, refresh_team_scores
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def run_brackets(
+    tournament_type: str = NCAA_TOURNAMENT["tournament_type"],
+    tournament_id: str = NCAA_TOURNAMENT["tournament_id"],
+    simulations: int = NCAA_TOURNAMENT["simulations"],
+    seed: int | None = None,
+) -> dict[str, int]:
+    """Fetch the brackets and publish the simulation pins. Returns row counts per pin."""
+    client = OpenTWClient()
+    writer = PinWriter()
+
+    logger.info("Fetching brackets for %s/%s...", tournament_type, tournament_id)
+    brackets = client.get_tournament_brackets(tournament_type, tournament_id)
+    if not brackets:
+        logger.warning("No bracket data for %s/%s — nothing to simulate", tournament_type, tournament_id)
+        return {}
+
+    parsed = refresh_brackets(writer, brackets)
+    scores = refresh_team_scores(writer, parsed).frame(parsed)
+    wrestlers, teams = refresh_bracket_simulation(writer, parsed, n=simulations, seed=seed)
+    results = {
+        BRACKETS_PIN: sum(len(b) for b in parsed),
+        TEAM_SCORES_PIN: len(scores),
+        SIM_WRESTLERS_PIN: len(wrestlers),
+        SIM_TEAMS_PIN: len(teams),
+    }
+    apply_retention(writer, list(results))
+    logger.info("Bracket job complete. Results: %s", results)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate the NCAA Championships from OpenTW brackets.")
+    parser.add_argument("--tournament-type", default=NCAA_TOURNAMENT["tournament_type"])
+    parser.add_argument("--tournament-id", default=NCAA_TOURNAMENT["tournament_id"])
+    parser.add_argument("--simulations", type=int, default=NCAA_TOURNAMENT["simulations"])
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible odds.")
+    args = parser.parse_args()
+    run_brackets(args.tournament_type, args.tournament_id, args.simulations, args.seed)
@@ -8,7 +8,7 @@ Designed to run as a scheduled job on Posit Connect (via Quarto) or locally.
 
 import logging
 import sys
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
 
 # Ensure project root is on the path — needed when run from Quarto notebooks
@@ -17,11 +17,17 @@ _project_root = str(Path(__file__).resolve().parent.parent)
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from etl.archive import archive_daily_results
+from etl.elo import ELO_LEDGER_PIN, ELO_RATINGS_PIN, refresh_elo
+from etl.head_to_head import H2H_ENTITIES_PIN, H2H_RESULTS_PIN, refresh_head_to_head
+from etl.individual_rankings import INDIVIDUAL_RANKINGS_PINS, INDIVIDUAL_STATS_PIN, refresh_individual_rankings
 from etl.ncaa_api import NCAAApiClient
+from etl.pin_retention import apply_retention, compact_live_scores
 from etl.pin_writer import PinWriter
+from etl.rankings_history import RANKINGS_HISTORY_PIN, refresh_rankings_history
+from etl.schedule_refresh import MANIFEST_PIN, refresh_schedule
+from etl.search_index import SEARCH_INDEX_PIN, SEARCH_TERMS_PIN, refresh_search_index
 from etl.transformers.rankings import transform_team_rankings
-from etl.transformers.scores import transform_scoreboard
-from etl.transformers.schedules import build_schedule
 from etl.transformers.teams import transform_team_stats, transform_standings, transform_schools
 
 logging.basicConfig(
@@ -31,8 +37,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_daily_etl() -> dict[str, int]:
-    """Execute the full daily ETL pipeline. Returns row counts per pin."""
+def run_daily_etl(today: date | None = None) -> dict[str, int]:
+    """Execute the full daily ETL pipeline. Returns row counts per pin.
+
+    ``today`` anchors the schedule window (defaults to the current date).
+    """
     client = NCAAApiClient()
     writer = PinWriter()
     results: dict[str, int] = {}
@@ -54,9 +63,8 @@ def run_daily_etl() -> dict[str, int]:
     # --- Individual Stats ---
     logger.info("Fetching individual stats...")
     raw_ind_stats = client.get_all_individual_stats(stat_id=171)
-    df_ind_stats = transform_team_stats(raw_ind_stats)  # Same shape handler
-    writer.write_pin("individual_stats", df_ind_stats)
-    results["individual_stats"] = len(df_ind_stats)
+    df_ind_stats = refresh_individual_rankings(writer, raw_ind_stats)  # + one pin per weight class
+    results[INDIVIDUAL_STATS_PIN] = len(df_ind_stats)
 
     # --- Standings ---
     logger.info("Fetching standings...")
@@ -72,15 +80,44 @@ def run_daily_etl() -> dict[str, int]:
     writer.write_pin("schools", df_schools)
     results["schools"] = len(df_schools)
 
-    # --- Schedule (past 7 days + next 30 days) ---
-    logger.info("Fetching schedule (past 7 days + next 30 days)...")
-    start = date.today() - timedelta(days=7)
-    end = date.today() + timedelta(days=30)
-    raw_games = client.get_scoreboard_range(start, end)
-    df_schedule = build_schedule(raw_games)
-    writer.write_pin("schedule", df_schedule)
+    # --- Schedule (past 7 days + next 30 days, incremental) ---
+    logger.info("Refreshing schedule (past 7 days + next 30 days)...")
+    df_schedule = refresh_schedule(client, writer, today=today)
     results["schedule"] = len(df_schedule)
 
+    # --- Search index (pointers into the pins above) ---
+    logger.info("Building search index...")
+    df_search = refresh_search_index(
+        writer, schools=df_schools, rankings=df_rankings, standings=df_standings,
+        team_stats=df_team_stats, individual_stats=df_ind_stats, schedule=df_schedule,
+    )
+    results[SEARCH_INDEX_PIN] = len(df_search)
+
+    # --- Season archive (partitioned history under pin_cache/archive/) ---
+    archive_daily_results(df_schedule, df_rankings, df_standings, today=today)
+
+    # --- Elo ratings (new finals only; seeded from the archive on first run) ---
+    df_elo = refresh_elo(writer, df_schedule)
+    results[ELO_RATINGS_PIN] = len(df_elo)
+
+    # --- Head-to-head index (season's duals from the archive, bouts pin) ---
+    df_h2h = refresh_head_to_head(writer, df_schedule, today=today)
+    results[H2H_ENTITIES_PIN] = len(df_h2h)
+
+    # --- Rankings history (one row per team per poll week) ---
+    df_history = refresh_rankings_history(writer, df_rankings, today=today)
+    results[RANKINGS_HISTORY_PIN] = len(df_history)
+
+    # --- Live score history (so the live poller's retention may prune those versions) ---
+    compact_live_scores(writer)
+
+    # --- Retention ---
+    apply_retention(
+        writer,
+        list(results) + [MANIFEST_PIN, SEARCH_TERMS_PIN, ELO_LEDGER_PIN, H2H_RESULTS_PIN, *INDIVIDUAL_RANKINGS_PINS,
+                         "live_scores"],
+    )
+
     logger.info("Daily ETL complete. Results: %s", results)
     return results
 
@@ -2,19 +2,52 @@
 
 Fetches today's scoreboard from the NCAA API and writes it to the pins board.
 Designed to run as a frequently-scheduled job on Posit Connect (via Quarto).
+
+Daemon mode (``python etl/run_live.py --daemon``) keeps one process resident
+instead of cold-starting every minute. It reuses a single ``NCAAApiClient`` and
+``PinWriter``, polls on an adaptive interval (fast while a game is live, slow
+when everything is pre or final, asleep until the next scheduled start when
+idle) and only publishes ``live_scores`` when the scoreboard actually changed.
+
+Each poll also refreshes the ``bouts`` pin for live and just-finished games
+(see ``etl/game_details.py``). On NCAA Championships days (dates cached in
+the ``tournament`` pin) it also polls the OpenTW brackets, applies the newly
+final bouts to the ``brackets`` pin and publishes the live team race
+(``team_scores``, see ``etl/team_scores.py``).
+
+After each poll, what changed since the previous one (new games, state
+transitions and score changes keyed on ``game_id``, newly decided bouts) is
+appended to the change-event log (``etl/live_events.py``). Consumers read the
+log from their own cursor; the notifier (``etl/notifications.py``) matches the
+new events against the favorite team/wrestler subscriptions and queues them
+in the notification outbox.
 """
 
+import argparse
 import logging
+import os
+import signal
 import sys
+import time
 from datetime import date
 from pathlib import Path
 
+import pandas as pd
+
 _project_root = str(Path(__file__).resolve().parent.parent)
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from etl.brackets import BRACKETS_PIN, LIVE, Bracket, refresh_brackets, tournament_dates
+from etl.config import LIVE_POLLER, LIVE_RETENTION_INTERVAL_SECONDS, NCAA_TOURNAMENT
+from etl.game_details import BOUTS_PIN, refresh_game_details
+from etl.live_events import EventLog, poll_events
 from etl.ncaa_api import NCAAApiClient
-from etl.pin_writer import PinWriter
+from etl.notifications import Notifier
+from etl.opentw_api import OpenTWClient
+from etl.pin_retention import apply_retention
+from etl.pin_writer import _LOCAL_CACHE_DIR, PinWriter
+from etl.team_scores import TEAM_SCORES_PIN, TeamScoreboard, refresh_team_scores
 from etl.transformers.scores import transform_scoreboard
 
 logging.basicConfig(
@@ -24,7 +57,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def fetch_live_scores() -> int:
+def fetch_live_scores(today: date | None = None) -> int:
     """Fetch today's scoreboard and write to the live_scores pin.
 
     Returns the number of games found.
@@ -32,14 +65,197 @@ def fetch_live_scores() -> int:
     client = NCAAApiClient()
     writer = PinWriter()
 
-    raw = client.get_scoreboard(date.today())
+    previous, previous_bouts = writer.read_pin("live_scores"), writer.read_pin(BOUTS_PIN)
+    df = _poll_once(client, writer, today)
+    log, notifier = EventLog(), Notifier()
+    if df is not None:
+        bouts = refresh_game_details(client, writer, df, previous_bouts)
+        log.append(poll_events(previous, df, previous_bouts, bouts))
+        notifier.consume(log)
+    pins = ["live_scores", BOUTS_PIN]
+    tournament = OpenTWClient()
+    if _championship_day(tournament, writer, today or date.today()):
+        _poll_tournament(tournament, writer)
+        pins += [BRACKETS_PIN, TEAM_SCORES_PIN]
+    if _retention_due():
+        apply_retention(writer, pins)
+        notifier.store.prune_delivered()
+        log.prune()
+    return len(df) if df is not None else 0
+
+
+def _retention_due(now: float | None = None) -> bool:
+    """Whether a one-shot run should prune (at most every ``LIVE_RETENTION_INTERVAL_SECONDS``).
+
+    One-shot runs share no memory, so the last prune time is the mtime of a
+    stamp file next to the local pins board; claiming a run touches it.
+    """
+    stamp = Path(os.environ.get("NCAA_PINS_DIR") or _LOCAL_CACHE_DIR) / "live_retention.stamp"
+    now = time.time() if now is None else now
+    try:
+        if now - stamp.stat().st_mtime < LIVE_RETENTION_INTERVAL_SECONDS:
+            return False
+    except FileNotFoundError:
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.touch()
+    return True
+
+
+def _poll_once(client: NCAAApiClient, writer: PinWriter, today: date | None = None) -> pd.DataFrame | None:
+    """Fetch today's scoreboard and publish it if its content changed.
+
+    Returns ``None`` when the request failed; nothing is published then, so
+    an API outage doesn't blank the score cards.
+    """
+    raw = client.get_scoreboard(today or date.today())
+    if raw is None:
+        logger.warning("Live scores: scoreboard request failed; keeping the last published scores")
+        return None
     df = transform_scoreboard(raw)
-    writer.write_pin("live_scores", df)
+    if not writer.write_pin("live_scores", df):
+        return df
 
     live_count = len(df[df["game_state"] == "live"]) if not df.empty and "game_state" in df.columns else 0
     logger.info("Live scores: %d total games, %d live now", len(df), live_count)
-    return len(df)
+    return df
+
+
+def _championship_day(client: OpenTWClient, writer: PinWriter, today: date) -> bool | None:
+    """Whether ``today`` falls within the NCAA Championships (``None`` if the dates are unknown)."""
+    dates = tournament_dates(client, writer)
+    return None if dates is None else dates[0] <= today <= dates[1]
+
+
+def _poll_tournament(
+    client: OpenTWClient,
+    writer: PinWriter,
+    brackets: dict[int, Bracket] | None = None,
+    scoreboard: TeamScoreboard | None = None,
+) -> tuple[dict[int, Bracket], TeamScoreboard | None]:
+    """Apply newly final championship bouts to the brackets and the team race.
+
+    ``brackets`` / ``scoreboard`` are the previous poll's state (``None`` on
+    the first poll: rebuilt from the ``brackets`` pin).
+    """
+    raw = client.get_tournament_brackets(NCAA_TOURNAMENT["tournament_type"], NCAA_TOURNAMENT["tournament_id"])
+    if not raw:
+        return brackets or {}, scoreboard
+    parsed = refresh_brackets(writer, raw, brackets)
+    scoreboard = refresh_team_scores(writer, parsed, scoreboard)
+    return {b.weight_class: b for b in parsed}, scoreboard
+
+
+def next_poll_delay(df: pd.DataFrame, now: float | None = None) -> float:
+    """Seconds to wait before the next poll, based on the current scoreboard.
+
+    - Any game live: ``live_interval_seconds``.
+    - A game is past its start time but not live yet: ``active_interval_seconds``.
+    - Otherwise sleep until shortly before the next ``start_time_epoch``,
+      capped at ``idle_max_sleep_seconds`` so date rollovers are picked up.
+    """
+    now = time.time() if now is None else now
+    idle_max = float(LIVE_POLLER["idle_max_sleep_seconds"])
+    if df.empty or "game_state" not in df.columns:
+        return idle_max
+
+    states = df["game_state"].astype("string").fillna("").str.lower()
+    if (states == "live").any():
+        return float(LIVE_POLLER["live_interval_seconds"])
+
+    pending = df[states != "final"]
+    if pending.empty:
+        return idle_max
+
+    starts = pd.Series(dtype=float)
+    if "start_time_epoch" in pending.columns:
+        starts = pd.to_numeric(pending["start_time_epoch"], errors="coerce").dropna()
+    if starts.empty:
+        # Non-final games with no usable start time — keep a slow watch on them.
+        return float(LIVE_POLLER["active_interval_seconds"])
+
+    wake_at = starts.min() - LIVE_POLLER["start_lead_seconds"]
+    if wake_at <= now:
+        return float(LIVE_POLLER["active_interval_seconds"])
+    return min(wake_at - now, idle_max)
+
+
+def run_live_daemon(max_polls: int | None = None) -> None:
+    """Poll the scoreboard until interrupted (or for ``max_polls`` iterations)."""
+    client = NCAAApiClient()
+    writer = PinWriter()
+    stopping = False
+
+    def _stop(signum, frame):
+        nonlocal stopping
+        logger.info("Received signal %s — stopping after the current poll", signum)
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    latest: pd.DataFrame | None = None
+    bouts: pd.DataFrame | None = None
+    detail_attempts: dict[str, int] = {}  # empty final-detail fetches per game
+    log = EventLog()
+    notifier = Notifier()
+    tournament = OpenTWClient()
+    championship: tuple[date, bool] | None = None  # (day checked, is a championship day); retried while unknown
+    brackets: dict[int, Bracket] | None = None
+    scoreboard: TeamScoreboard | None = None
+    polls = 0
+    last_pruned = float("-inf")
+    while not stopping and (max_polls is None or polls < max_polls):
+        failed = True
+        try:
+            if latest is None:  # first poll: compare against what was last published
+                latest, bouts = writer.read_pin("live_scores"), writer.read_pin(BOUTS_PIN)
+            polled = _poll_once(client, writer)
+            if polled is not None:
+                # A failed fetch keeps the previous frame, so the next good
+                # poll diffs against the last scoreboard actually seen
+                previous, previous_bouts = latest, bouts
+                latest = polled
+                bouts = refresh_game_details(client, writer, latest, bouts, detail_attempts)
+                log.append(poll_events(previous, latest, previous_bouts, bouts))
+                notifier.consume(log)
+                failed = False
+            today = date.today()
+            if championship is None or championship[0] != today:
+                is_championship = _championship_day(tournament, writer, today)
+                championship = (today, is_championship) if is_championship is not None else None
+            if championship and championship[1]:
+                brackets, scoreboard = _poll_tournament(tournament, writer, brackets, scoreboard)
+            if time.monotonic() - last_pruned >= LIVE_RETENTION_INTERVAL_SECONDS:
+                apply_retention(writer, ["live_scores", BOUTS_PIN, BRACKETS_PIN, TEAM_SCORES_PIN])
+                notifier.store.prune_delivered()
+                log.prune()
+                last_pruned = time.monotonic()
+        except Exception:
+            logger.exception("Live score poll failed")
+        polls += 1
+
+        delay = next_poll_delay(latest if latest is not None else pd.DataFrame())
+        if failed:  # retry soon rather than trusting a stale or missing scoreboard
+            delay = min(delay, float(LIVE_POLLER["active_interval_seconds"]))
+        if brackets and championship and championship[1]:
+            live = any((b.status == LIVE).any() for b in brackets.values())
+            key = "tournament_interval_seconds" if live else "active_interval_seconds"
+            delay = min(delay, float(LIVE_POLLER[key]))
+        logger.info("Next live score poll in %.0fs", delay)
+        deadline = time.monotonic() + delay
+        while not stopping and (max_polls is None or polls < max_polls):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 1.0))
 
 
 if __name__ == "__main__":
-    fetch_live_scores()
+    parser = argparse.ArgumentParser(description="Fetch NCAA wrestling live scores.")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Stay resident and poll on an adaptive interval.")
+    args = parser.parse_args()
+    if args.daemon:
+        run_live_daemon()
+    else:
+        fetch_live_scores()
@@ -0,0 +1,71 @@
+"""Manage notification subscriptions and inspect the outbox.
+
+The live poller (``etl/run_live.py``) matches game and bout events against
+these subscriptions and queues notifications in the outbox; see
+``etl/notifications.py``.
+
+Usage::
+
+    python etl/run_notifications.py subscribe fan@example.com team "Penn St."
+    python etl/run_notifications.py subscribe fan@example.com wrestler "Carter Starocci"
+    python etl/run_notifications.py unsubscribe fan@example.com [--kind team] [--name "Penn St."]
+    python etl/run_notifications.py list
+    python etl/run_notifications.py pending [--limit 50]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+_project_root = str(Path(__file__).resolve().parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from etl.notifications import KINDS, SubscriptionStore
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Manage favorite team/wrestler notifications.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    subscribe = commands.add_parser("subscribe", help="Follow a team or wrestler.")
+    subscribe.add_argument("subscriber")
+    subscribe.add_argument("kind", choices=KINDS)
+    subscribe.add_argument("name")
+
+    unsubscribe = commands.add_parser("unsubscribe", help="Stop following one or all.")
+    unsubscribe.add_argument("subscriber")
+    unsubscribe.add_argument("--kind", choices=KINDS)
+    unsubscribe.add_argument("--name")
+
+    commands.add_parser("list", help="Show all subscriptions.")
+    pending = commands.add_parser("pending", help="Show undelivered notifications.")
+    pending.add_argument("--limit", type=int, default=50)
+
+    args = parser.parse_args(argv)
+    store = SubscriptionStore()
+    try:
+        if args.command == "subscribe":
+            added = store.subscribe(args.subscriber, args.kind, args.name)
+            logger.info("%s %s %s '%s'", args.subscriber, "now follows" if added else "already follows",
+                        args.kind, args.name)
+        elif args.command == "unsubscribe":
+            removed = store.unsubscribe(args.subscriber, args.kind, args.name)
+            logger.info("Removed %d subscription(s) for %s", removed, args.subscriber)
+        elif args.command == "list":
+            print(store.subscriptions().to_string(index=False))
+        else:
+            print(store.pending(args.limit).to_string(index=False))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
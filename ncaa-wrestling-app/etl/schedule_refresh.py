@@ -0,0 +1,127 @@
+"""Incremental refresh of the ``schedule`` pin.
+
+A full refresh pulls every scoreboard in the schedule window (7 days back +
+30 days ahead = 38 requests). Most of those dates can't have changed since
+the last run: past days whose games are all final are settled, and far-future
+days rarely move. This module keeps a per-date manifest (the
+``schedule_manifest`` pin) recording when each date was fetched and which
+game states it held, and only re-pulls dates whose games can still change.
+
+A date is refetched when it is:
+
+- not in the manifest yet (e.g. the day that just entered the window),
+- today or within ``always_refresh_days_ahead`` days of it,
+- in the past and still has non-final games, or
+- further in the future and due in its ``future_refresh_every_days`` rotation.
+
+The rotation spreads far-future dates evenly over the week so a daily run
+touches only a handful of them.
+"""
+
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+
+from etl.config import SCHEDULE_WINDOW
+from etl.ncaa_api import NCAAApiClient
+from etl.pin_writer import PinWriter
+from etl.transformers.schedules import (
+    build_schedule,
+    build_schedule_manifest,
+    merge_schedule,
+    merge_schedule_manifest,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PIN = "schedule_manifest"
+
+
+def schedule_window(today: date | None = None) -> tuple[date, date]:
+    """Return the ``(start, end)`` dates covered by the schedule pin."""
+    today = today or date.today()
+    return (
+        today - timedelta(days=SCHEDULE_WINDOW["days_back"]),
+        today + timedelta(days=SCHEDULE_WINDOW["days_ahead"]),
+    )
+
+
+def dates_to_refresh(
+    manifest: pd.DataFrame | None,
+    start: date,
+    end: date,
+    today: date,
+    always_refresh_days_ahead: int = SCHEDULE_WINDOW["always_refresh_days_ahead"],
+    future_refresh_every_days: int = SCHEDULE_WINDOW["future_refresh_every_days"],
+) -> list[date]:
+    """Pick the dates in ``[start, end]`` that need a new scoreboard fetch."""
+    known: dict[str, tuple[int, int]] = {}
+    if manifest is not None and not manifest.empty:
+        for d, games, finals in zip(manifest["date"], manifest["games"], manifest["final_games"]):
+            known[str(d)] = (int(games), int(finals))
+
+    every = max(future_refresh_every_days, 1)
+    selected = []
+    current = start
+    while current <= end:
+        entry = known.get(current.isoformat())
+        days_ahead = (current - today).days
+        if entry is None:
+            selected.append(current)
+        elif 0 <= days_ahead <= always_refresh_days_ahead:
+            selected.append(current)
+        elif days_ahead < 0 and entry[1] < entry[0]:
+            selected.append(current)
+        elif days_ahead > 0 and current.toordinal() % every == today.toordinal() % every:
+            selected.append(current)
+        current += timedelta(days=1)
+    return selected
+
+
+def refresh_schedule(
+    client: NCAAApiClient,
+    writer: PinWriter,
+    today: date | None = None,
+    incremental: bool | None = None,
+) -> pd.DataFrame:
+    """Refresh the ``schedule`` and ``schedule_manifest`` pins.
+
+    Falls back to a full-window fetch when incremental mode is off or there
+    is no existing schedule/manifest to merge into. Returns the new schedule.
+    """
+    today = today or date.today()
+    start, end = schedule_window(today)
+    if incremental is None:
+        incremental = SCHEDULE_WINDOW["incremental"]
+
+    existing = writer.read_pin("schedule") if incremental else None
+    manifest = writer.read_pin(MANIFEST_PIN) if incremental else None
+    if existing is None or manifest is None:
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        existing, manifest = None, None
+        logger.info("Schedule: full refresh of %d dates", len(dates))
+    else:
+        dates = dates_to_refresh(manifest, start, end, today)
+        logger.info("Schedule: incremental refresh of %d dates", len(dates))
+
+    fetched_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    games_by_date = client.get_scoreboards(dates)
+    failed = [d for d in dates if d not in games_by_date]
+    if failed:
+        # Keep the schedule rows we had for these dates, but drop them from
+        # the manifest so the next run retries them (an unknown date is
+        # always refetched)
+        logger.warning("Schedule: %d of %d scoreboard fetches failed", len(failed), len(dates))
+        dates = [d for d in dates if d in games_by_date]
+        if manifest is not None and not manifest.empty:
+            manifest = manifest[~manifest["date"].astype(str).isin({d.isoformat() for d in failed})]
+    fresh = build_schedule([g for d in dates for g in games_by_date[d]])
+
+    df_schedule = merge_schedule(existing, fresh, dates, start, end)
+    df_manifest = merge_schedule_manifest(
+        manifest, build_schedule_manifest(games_by_date, fetched_at), start, end,
+    )
+    writer.write_pin("schedule", df_schedule)
+    writer.write_pin(MANIFEST_PIN, df_manifest)
+    return df_schedule
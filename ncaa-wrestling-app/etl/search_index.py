@@ -0,0 +1,225 @@
+"""Global team/wrestler search index, built by the daily ETL.
+
+Two pins, written together after every other daily pin:
+
+- ``search_index``: one row per entity (team or wrestler) in
+  ``SEARCH_INDEX_SCHEMA`` — display name, normalized aliases, and row
+  pointers into the ``rankings``, ``standings``, ``team_stats``,
+  ``individual_stats`` and ``schedule`` pins written in the same run,
+- ``search_terms``: prefix postings, one row per term with the ids of every
+  entity having a name token that starts with it.
+
+Names are normalized (case, accents, punctuation) and teams pick up aliases
+from the ``schools`` index (short name, long name, slug) plus the
+"St."/"State" swap, so "penn state", "Penn St." and "penn-st" all resolve
+to the same team. Entity ids are assigned in display order — ranked teams
+by rank, other teams alphabetically, then wrestlers by wins — so postings
+are sorted, a multi-word query is an intersection of sorted arrays, and the
+first hits are the most relevant ones.
+
+The app (``app/utils/search_index.py``) turns ``search_terms`` into a dict,
+so a query costs one dict lookup per word regardless of the size of the pins.
+"""
+
+import logging
+import re
+import unicodedata
+
+import pandas as pd
+
+from etl.pin_writer import PinWriter
+from etl.transformers.schemas import SEARCH_INDEX_SCHEMA, SEARCH_TERMS_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_PIN = "search_index"
+SEARCH_TERMS_PIN = "search_terms"
+
+MAX_PREFIX = 12  # longer query words are matched on their first 12 characters, then verified
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_ABBREVIATIONS = {"st": "state", "state": "st"}
+
+
+def normalize_name(name: str) -> str:
+    """Lower-case, accent-free, punctuation-free form of a name (``"Penn St."`` -> ``"penn st"``)."""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    text = text.lower().replace("&", " and ").replace("'", "").replace(".", "")
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def name_variants(name: str) -> set[str]:
+    """``name`` normalized, plus its "St."/"State" swaps."""
+    base = normalize_name(name)
+    if not base:
+        return set()
+    variants = {base}
+    tokens = base.split()
+    for i, token in enumerate(tokens):
+        if token in _ABBREVIATIONS:
+            variants.add(" ".join(tokens[:i] + [_ABBREVIATIONS[token]] + tokens[i + 1:]))
+    return variants
+
+
+def build_search_index(
+    schools: pd.DataFrame | None = None,
+    rankings: pd.DataFrame | None = None,
+    standings: pd.DataFrame | None = None,
+    team_stats: pd.DataFrame | None = None,
+    individual_stats: pd.DataFrame | None = None,
+    schedule: pd.DataFrame | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build the ``search_index`` and ``search_terms`` frames from the daily pins."""
+    teams = _collect_teams(schools, rankings, standings, team_stats, schedule)
+    alias_to_team = {alias: i for i, team in enumerate(teams) for alias in team["aliases"]}
+
+    def team_of(name) -> int | None:
+        for variant in name_variants(name) if pd.notna(name) else ():
+            if variant in alias_to_team:
+                return alias_to_team[variant]
+        return None
+
+    for pin, df, column in (
+        ("rankings_row", rankings, "school"),
+        ("standings_row", standings, "team"),
+        ("team_stats_row", team_stats, "team"),
+    ):
+        if df is None or column not in df.columns:
+            continue
+        for row, name in enumerate(df[column]):
+            idx = team_of(name)
+            if idx is not None and teams[idx].get(pin) is None:
+                teams[idx][pin] = row
+    if schedule is not None and not schedule.empty:
+        for side in ("away_team", "home_team"):
+            for row, name in enumerate(schedule[side]):
+                idx = team_of(name)
+                if idx is not None:
+                    teams[idx]["schedule_rows"].append(row)
+
+    # Ranked teams by rank, then the rest alphabetically
+    def team_order(team: dict):
+        rank = None
+        if team.get("rankings_row") is not None and "rank" in rankings.columns:
+            rank = rankings["rank"].iloc[team["rankings_row"]]
+        return (0, int(rank), team["name"]) if pd.notna(rank) and rank else (1, 0, team["name"])
+
+    teams.sort(key=team_order)
+    rows = []
+    team_entity = {}
+    for entity_id, team in enumerate(teams):
+        team_entity[team["name"]] = entity_id
+        rows.append({
+            "entity_id": entity_id,
+            "kind": "team",
+            "key": team["key"],
+            "name": team["name"],
+            "team": team["name"],
+            "team_entity_id": entity_id,
+            "aliases": "|".join(sorted(team["aliases"])),
+            "rankings_row": team.get("rankings_row"),
+            "standings_row": team.get("standings_row"),
+            "team_stats_row": team.get("team_stats_row"),
+            "schedule_rows": sorted(set(team["schedule_rows"])),
+        })
+    rows.extend(_wrestler_rows(individual_stats, teams, team_of, team_entity, start=len(rows)))
+
+    index = conform(pd.DataFrame(rows), SEARCH_INDEX_SCHEMA)
+    return index, build_search_terms(index)
+
+
+def build_search_terms(index: pd.DataFrame) -> pd.DataFrame:
+    """Prefix postings (term -> sorted entity ids) for every alias token of every entity."""
+    postings: dict[str, set[int]] = {}
+    for entity_id, aliases in zip(index["entity_id"].astype(int), index["aliases"].astype(str)):
+        for token in {t for alias in aliases.split("|") for t in alias.split()}:
+            for n in range(1, min(len(token), MAX_PREFIX) + 1):
+                postings.setdefault(token[:n], set()).add(entity_id)
+    terms = pd.DataFrame({
+        "term": sorted(postings),
+        "entity_ids": [sorted(postings[t]) for t in sorted(postings)],
+    })
+    return conform(terms, SEARCH_TERMS_SCHEMA)
+
+
+def refresh_search_index(writer: PinWriter, **frames: pd.DataFrame) -> pd.DataFrame:
+    """Build the index from the daily frames and write both search pins.
+
+    ``frames`` are the keyword arguments of ``build_search_index``.
+    """
+    index, terms = build_search_index(**frames)
+    writer.write_pin(SEARCH_INDEX_PIN, index)
+    writer.write_pin(SEARCH_TERMS_PIN, terms)
+    logger.info(
+        "Search index: %d teams, %d wrestlers, %d terms",
+        (index["kind"] == "team").sum(), (index["kind"] == "wrestler").sum(), len(terms),
+    )
+    return index
+
+
+def _collect_teams(schools, rankings, standings, team_stats, schedule) -> list[dict]:
+    """One dict per distinct team: the schools index first, then names only seen in other pins."""
+    teams: list[dict] = []
+    by_alias: dict[str, dict] = {}
+
+    def add(name, key=None, *extra_names):
+        if pd.isna(name) or not str(name).strip():
+            return
+        variants = set().union(*(name_variants(n) for n in (name, *extra_names) if pd.notna(n) and n))
+        if any(v in by_alias for v in variants):
+            return
+        team = {"name": str(name).strip(), "key": key or _slug(name), "aliases": variants, "schedule_rows": []}
+        teams.append(team)
+        for v in variants:
+            by_alias[v] = team
+
+    if schools is not None and not schools.empty:
+        slugs = schools["slug"] if "slug" in schools.columns else pd.Series([None] * len(schools))
+        full = schools["full_name"] if "full_name" in schools.columns else pd.Series([None] * len(schools))
+        for name, slug, long in zip(schools["name"], slugs, full):
+            add(name, slug, long, str(slug).replace("-", " ") if pd.notna(slug) else None)
+
+    for df, columns in (
+        (rankings, ["school"]), (standings, ["team"]), (team_stats, ["team"]),
+        (schedule, ["away_team", "home_team"]),
+    ):
+        if df is None:
+            continue
+        for column in columns:
+            if column in df.columns:
+                for name in df[column].dropna().unique():
+                    add(name)
+    return teams
+
+
+def _wrestler_rows(individual_stats, teams, team_of, team_entity, start: int) -> list[dict]:
+    if individual_stats is None or individual_stats.empty or "name" not in individual_stats.columns:
+        return []
+    df = individual_stats.reset_index(drop=True)
+    wins = pd.to_numeric(df["wins"], errors="coerce").fillna(0) if "wins" in df.columns else pd.Series(0, index=df.index)
+    weights = df["weight_class"] if "weight_class" in df.columns else pd.Series([None] * len(df), index=df.index)
+    team_names = df["team"] if "team" in df.columns else pd.Series([None] * len(df), index=df.index)
+
+    rows = []
+    for row in wins.sort_values(ascending=False, kind="stable").index:
+        name = df["name"].iloc[row]
+        if pd.isna(name) or not str(name).strip():
+            continue
+        idx = team_of(team_names.iloc[row])
+        team = teams[idx]["name"] if idx is not None else team_names.iloc[row]
+        rows.append({
+            "entity_id": start + len(rows),
+            "kind": "wrestler",
+            "key": f"{teams[idx]['key'] if idx is not None else _slug(team)}/{_slug(name)}",
+            "name": str(name).strip(),
+            "team": team,
+            "team_entity_id": team_entity.get(team),
+            "weight_class": weights.iloc[row],
+            "aliases": "|".join(sorted(name_variants(name))),
+            "individual_stats_row": row,
+        })
+    return rows
+
+
+def _slug(name) -> str:
+    return normalize_name(name).replace(" ", "-")
@@ -0,0 +1,159 @@
+"""Live NCAA Championships team scores from bracket results.
+
+``TeamScoreboard`` keeps each team's advancement, bonus and placement points
+plus the set of matches already counted. ``apply`` adds only the finals it
+hasn't seen (matches in an ``etl.brackets.Bracket`` are never un-finalized),
+so a poll costs O(newly completed bouts) for the totals. Scoring follows
+``TEAM_SCORING``, the same rules as the bracket simulation:
+
+- advancement for every win that isn't a bye (championship 1, consolation
+  0.5; none in place matches),
+- bonus points for the decision (fall, tech fall, major; defaults,
+  forfeits and disqualifications count as a fall),
+- placement points to both wrestlers of a place match.
+
+"Max possible" is each team's current total plus, for every wrestler still
+alive, the points from winning out with a fall from their next match to the
+end of their path (1st for the championship side, 3rd through the
+consolations) — the ceiling a team can still reach, as shown on TV graphics.
+
+Results are the ``team_scores`` pin, published by the live poller during the
+championships (``etl/run_live.py``) and by ``etl/run_brackets.py``.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from etl.brackets import CONS, FINAL, Bracket
+from etl.config import TEAM_SCORING
+from etl.pin_writer import PinWriter
+from etl.transformers.schemas import TEAM_SCORES_SCHEMA, conform
+
+logger = logging.getLogger(__name__)
+
+TEAM_SCORES_PIN = "team_scores"
+
+_BONUS = {code: points for code, (_, points) in TEAM_SCORING["bonus_mix"].items()}
+_BONUS.update({"DFT": _BONUS["FALL"], "FF": _BONUS["FALL"], "DQ": _BONUS["FALL"], "INJ": _BONUS["FALL"]})
+_MAX_BONUS = max(_BONUS.values())
+ADVANCEMENT, BONUS, PLACEMENT = range(3)
+
+
+class TeamScoreboard:
+    """Running team totals over the finals applied so far."""
+
+    def __init__(self):
+        self.points: dict[str, np.ndarray] = {}  # team -> [advancement, bonus, placement]
+        self.scored: set[tuple[int, str]] = set()  # (weight_class, match_id)
+        self._win_out: dict[int, tuple[Bracket, np.ndarray]] = {}  # per bracket structure
+
+    def apply(self, bracket: Bracket) -> int:
+        """Score the finals of ``bracket`` not counted yet. Returns how many were added."""
+        added = 0
+        for k in np.flatnonzero(bracket.status == FINAL):
+            key = (bracket.weight_class, bracket.match_ids[k])
+            if key in self.scored:
+                continue
+            self.scored.add(key)
+            for wrestler, column, points in match_points(bracket, k):
+                team = bracket.teams[wrestler]
+                if team and points:
+                    self.points.setdefault(team, np.zeros(3))[column] += points
+            added += 1
+        return added
+
+    def frame(self, brackets: list[Bracket]) -> pd.DataFrame:
+        """Team standings in ``TEAM_SCORES_SCHEMA``, best first.
+
+        ``brackets`` are the current brackets, for the wrestlers still
+        alive and their remaining paths.
+        """
+        upside: dict[str, float] = {}
+        alive: dict[str, int] = {}
+        for bracket in brackets:
+            cached = self._win_out.get(bracket.weight_class)
+            if cached is None or cached[0] is not bracket:
+                cached = self._win_out[bracket.weight_class] = (bracket, _win_out_points(bracket))
+            win_out = cached[1]
+            pending = bracket.status != FINAL
+            for k, slot in zip(*np.nonzero((bracket.slots >= 0) & pending[:, None])):
+                team = bracket.teams[bracket.slots[k, slot]]
+                if team:
+                    upside[team] = upside.get(team, 0.0) + win_out[k]
+                    alive[team] = alive.get(team, 0) + 1
+
+        teams = sorted(set(self.points) | set(upside) | {t for b in brackets for t in b.teams if t})
+        rows = []
+        for team in teams:
+            adv, bonus, placement = self.points.get(team, np.zeros(3))
+            total = adv + bonus + placement
+            rows.append({
+                "team": team,
+                "points": total,
+                "advancement_points": adv,
+                "bonus_points": bonus,
+                "placement_points": placement,
+                "max_possible": total + upside.get(team, 0.0),
+                "wrestlers_alive": alive.get(team, 0),
+            })
+        df = pd.DataFrame(rows, columns=[c for c in TEAM_SCORES_SCHEMA.names if c != "rank"])
+        df = df.sort_values(["points", "max_possible", "team"], ascending=[False, False, True], kind="stable")
+        df.insert(0, "rank", df["points"].rank(method="min", ascending=False))
+        return conform(df.reset_index(drop=True), TEAM_SCORES_SCHEMA)
+
+
+def match_points(bracket: Bracket, k: int) -> list[tuple[int, int, float]]:
+    """``(wrestler, ADVANCEMENT | BONUS | PLACEMENT, points)`` earned in final match ``k``."""
+    winner = int(bracket.winner[k])
+    if winner < 0:
+        return []
+    top, bottom = bracket.slots[k]
+    loser = int(bottom if top == winner else top)
+    earned = []
+    if loser >= 0:  # a bye earns nothing
+        if not bracket.place[k]:
+            earned.append((winner, ADVANCEMENT, _advancement(bracket, k)))
+        earned.append((winner, BONUS, _BONUS.get(str(bracket.decisions[k] or "").upper(), 0.0)))
+    place = int(bracket.place[k])
+    if place:
+        earned.append((winner, PLACEMENT, TEAM_SCORING["placement"].get(place, 0.0)))
+        if loser >= 0:
+            earned.append((loser, PLACEMENT, TEAM_SCORING["placement"].get(place + 1, 0.0)))
+    return earned
+
+
+def refresh_team_scores(
+    writer: PinWriter,
+    brackets: list[Bracket],
+    scoreboard: TeamScoreboard | None = None,
+) -> TeamScoreboard:
+    """Apply the new finals of ``brackets`` to ``scoreboard`` and publish ``team_scores``.
+
+    Pass the returned scoreboard back in on the next poll; without one the
+    totals are built from every final in ``brackets``.
+    """
+    scoreboard = scoreboard or TeamScoreboard()
+    added = sum(scoreboard.apply(b) for b in brackets)
+    df = scoreboard.frame(brackets)
+    if writer.write_pin(TEAM_SCORES_PIN, df):
+        leader = f"{df['team'].iloc[0]} {df['points'].iloc[0]:g}" if not df.empty else "none"
+        logger.info("Team scores: %d new finals applied, leader %s", added, leader)
+    return scoreboard
+
+
+def _advancement(bracket: Bracket, k: int) -> float:
+    side = "consolation" if bracket.round_code[k] == CONS else "championship"
+    return TEAM_SCORING["advancement"][side]
+
+
+def _win_out_points(bracket: Bracket) -> np.ndarray:
+    """Most points a wrestler can still score from match ``k`` by winning every match with a fall."""
+    win_out = np.zeros(len(bracket))
+    for k in range(len(bracket) - 1, -1, -1):  # parents come later in bracket order
+        place = int(bracket.place[k])
+        points = _MAX_BONUS + (TEAM_SCORING["placement"].get(place, 0.0) if place else _advancement(bracket, k))
+        dest = bracket.winner_to[k]
+        win_out[k] = points + (win_out[dest // 2] if dest >= 0 else 0.0)
+    return win_out
@@ -0,0 +1,82 @@
+"""Transform NCAA API game-detail responses into bout-by-bout DataFrames."""
+
+from functools import partial
+
+import pandas as pd
+
+from etl.transformers.schemas import BOUTS_SCHEMA, conform
+
+
+def transform_boxscore(game_id: str, raw: dict | None, summary: dict | None = None) -> pd.DataFrame:
+    """Transform a game's boxscore into one row per bout.
+
+    Expected raw structure::
+
+        {
+            "gameID": "6154104",
+            "status": "final",
+            "teams": [{"side": "away", "nameShort": "Iowa", "score": 12}, ...],
+            "bouts": [
+                {"boutNumber": 1, "weightClass": "125", "winner": "home",
+                 "decision": "DEC", "result": "Dec 5-2", "teamPoints": 3,
+                 "away": {"id": "...", "name": "...", "team": "Iowa"},
+                 "home": {"id": "...", "name": "...", "team": "Penn St."},
+                 "awayTeamScore": 0, "homeTeamScore": 3},
+                ...
+            ]
+        }
+
+    When the boxscore has no bouts, the scoring summary (``summary``, from
+    ``/game/{id}/scoring-summary``) is used instead; it carries the winner and
+    decision of each bout but not the wrestlers.
+    """
+    source, status = None, None
+    for payload, key in ((raw, "bouts"), (summary, "summary")):
+        if payload and payload.get(key):
+            source, status = payload[key], payload.get("status")
+            break
+    if not source:
+        return _empty_bouts()
+
+    flat = pd.json_normalize(source)
+    col = partial(_column, flat)
+    points = pd.to_numeric(col("teamPoints"), errors="coerce").fillna(0)
+    winner_side = col("winner")
+
+    df = pd.DataFrame({
+        "game_id": str(game_id),
+        "detail_status": status or "",
+        "weight_class": col("weightClass"),
+        "bout_number": col("boutNumber"),
+        "winner_side": winner_side,
+        "decision": col("decision"),
+        "result": col("result"),
+        "team_points": points,
+        "away_wrestler": col("away.name"),
+        "away_wrestler_id": col("away.id"),
+        "away_team": col("away.team"),
+        "home_wrestler": col("home.name"),
+        "home_wrestler_id": col("home.id"),
+        "home_team": col("home.team"),
+        "away_team_score": col("awayTeamScore"),
+        "home_team_score": col("homeTeamScore"),
+    })
+    if df["bout_number"].isna().all():
+        df["bout_number"] = range(1, len(df) + 1)
+    # Running dual score, when the source doesn't carry it
+    for side in ("away", "home"):
+        running = points.where(winner_side == side, 0).cumsum()
+        df[f"{side}_team_score"] = df[f"{side}_team_score"].where(df[f"{side}_team_score"].notna(), running)
+
+    return conform(df, BOUTS_SCHEMA)
+
+
+def _column(flat: pd.DataFrame, name: str) -> pd.Series:
+    """Column ``name`` of a json_normalize'd frame, or all-null if absent."""
+    if name in flat.columns:
+        return flat[name]
+    return pd.Series([None] * len(flat), index=flat.index, dtype=object)
+
+
+def _empty_bouts() -> pd.DataFrame:
+    return conform(pd.DataFrame(), BOUTS_SCHEMA)
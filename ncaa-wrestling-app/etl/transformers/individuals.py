@@ -0,0 +1,68 @@
+"""Transform raw NCAA API individual stats into per-wrestler rankings."""
+
+import re
+
+import pandas as pd
+
+from etl.transformers.schemas import INDIVIDUAL_STATS_SCHEMA, conform
+
+_COLUMNS = {
+    "rank": "rank", "#": "rank",
+    "name": "name", "wrestler": "name",
+    "team": "team", "school": "team",
+    "cl": "class_year", "class": "class_year", "yr": "class_year",
+    "wt": "weight_class", "weight": "weight_class", "weight class": "weight_class",
+    "w": "wins", "wins": "wins",
+    "l": "losses", "losses": "losses",
+    "pct": "win_pct", "win pct": "win_pct", "winning percentage": "win_pct",
+    "falls": "falls",
+    "tech falls": "tech_falls", "tf": "tech_falls",
+    "maj. dec.": "major_decisions", "major decisions": "major_decisions", "md": "major_decisions",
+}
+
+
+def transform_individual_stats(raw_rows: list[dict]) -> pd.DataFrame:
+    """Transform raw individual stat rows into ``INDIVIDUAL_STATS_SCHEMA``, best first.
+
+    Wrestlers are ordered by the source's rank when it has one, else by wins,
+    then fewest losses, then falls. ``weight_rank`` is the same order within
+    each weight class; ``Wt`` values like ``"HWT"`` map to 285.
+    """
+    if not raw_rows:
+        return conform(pd.DataFrame(), INDIVIDUAL_STATS_SCHEMA)
+
+    df = pd.DataFrame(raw_rows)
+    df = df.rename(columns={
+        col: _COLUMNS.get(col.strip().lower(), col.strip().lower().replace(" ", "_").replace(".", ""))
+        for col in df.columns
+    })
+    df = df.loc[:, ~df.columns.duplicated()]
+
+    for col in ["rank", "wins", "losses", "falls", "tech_falls", "major_decisions"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    if "weight_class" in df.columns:
+        df["weight_class"] = df["weight_class"].map(_parse_weight)
+    if "win_pct" in df.columns:
+        text = df["win_pct"].astype(str)
+        pct = pd.to_numeric(text.str.replace("%", ""), errors="coerce")
+        df["win_pct"] = pct.where(~text.str.contains("%"), pct / 100)  # as a fraction, like ".833"
+    elif {"wins", "losses"} <= set(df.columns):
+        bouts = df["wins"] + df["losses"]
+        df["win_pct"] = (df["wins"] / bouts.where(bouts > 0)).round(3)
+
+    order = [c for c in ("rank", "wins", "losses", "falls", "name") if c in df.columns]
+    ascending = [c not in ("wins", "falls") for c in order]
+    df = df.sort_values(order, ascending=ascending, kind="stable", na_position="last").reset_index(drop=True)
+    if "rank" not in df.columns or df["rank"].isna().all():
+        df["rank"] = range(1, len(df) + 1)
+    df["weight_rank"] = df.groupby("weight_class", dropna=False).cumcount() + 1 if "weight_class" in df.columns else None
+    return conform(df, INDIVIDUAL_STATS_SCHEMA)
+
+
+def _parse_weight(value) -> int | None:
+    text = str(value).strip().lower()
+    if text in ("hwt", "hvy", "heavyweight"):
+        return 285
+    match = re.search(r"\d+", text)
+    return int(match.group()) if match else None
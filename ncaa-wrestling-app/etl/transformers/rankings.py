@@ -2,6 +2,8 @@
 
 import pandas as pd
 
+from etl.transformers.schemas import TEAM_RANKINGS_SCHEMA, conform
+
 
 def transform_team_rankings(raw: dict | None) -> pd.DataFrame:
     """Transform the rankings API response into a clean DataFrame.
@@ -22,75 +24,58 @@ def transform_team_rankings(raw: dict | None) -> pd.DataFrame:
     Returns a DataFrame with columns:
         rank, school, votes, points, previous_rank, record, wins, losses, movement
     """
-    if not raw or "data" not in raw:
+    if not raw or "data" not in raw or not raw["data"]:
         return _empty_team_rankings()
 
-    rows = []
-    for item in raw["data"]:
-        school_raw = item.get("SCHOOL", item.get("School", ""))
-        school, votes = _parse_school_votes(school_raw)
-        rank = _safe_int(item.get("RANK", item.get("Rank", "")))
-        previous = _safe_int(item.get("PREVIOUS", item.get("Previous", "")))
-        record = item.get("RECORD", item.get("Record", ""))
-        wins, losses = _parse_record(record)
-        points = _safe_int(item.get("POINTS", item.get("Points", "")))
-
-        movement = (previous - rank) if (previous and rank) else 0
-
-        rows.append({
-            "rank": rank,
-            "school": school,
-            "votes": votes,
-            "points": points,
-            "previous_rank": previous,
-            "record": record,
-            "wins": wins,
-            "losses": losses,
-            "movement": movement,
-        })
-
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = df.sort_values("rank").reset_index(drop=True)
+    flat = pd.DataFrame(raw["data"])
+
+    school, votes = _parse_school_votes(_pick(flat, "SCHOOL", "School").fillna(""))
+    record = _pick(flat, "RECORD", "Record").fillna("").astype(str)
+    wins, losses = _parse_record(record)
+    rank = pd.to_numeric(_pick(flat, "RANK", "Rank"), errors="coerce")
+    previous = pd.to_numeric(_pick(flat, "PREVIOUS", "Previous"), errors="coerce")
+    movement = (previous - rank).where((previous.fillna(0) != 0) & (rank.fillna(0) != 0), 0)
+
+    df = pd.DataFrame({
+        "rank": rank,
+        "school": school,
+        "votes": votes,
+        "points": _pick(flat, "POINTS", "Points"),
+        "previous_rank": previous,
+        "record": record,
+        "wins": wins,
+        "losses": losses,
+        "movement": movement,
+    })
+    df = conform(df, TEAM_RANKINGS_SCHEMA)
+    df = df.sort_values("rank", kind="stable").reset_index(drop=True)
     return df
 
 
-def _parse_school_votes(raw: str) -> tuple[str, int | None]:
-    """Parse 'Penn St. (16)' into ('Penn St.', 16)."""
-    raw = raw.strip()
-    if "(" in raw and raw.endswith(")"):
-        idx = raw.rfind("(")
-        school = raw[:idx].strip()
-        votes_str = raw[idx + 1:-1].strip()
-        try:
-            return school, int(votes_str)
-        except ValueError:
-            return school, None
-    return raw, None
-
-
-def _parse_record(record: str) -> tuple[int | None, int | None]:
-    """Parse '15-0' into (15, 0)."""
-    if "-" in record:
-        parts = record.split("-")
-        try:
-            return int(parts[0].strip()), int(parts[1].strip())
-        except (ValueError, IndexError):
-            pass
-    return None, None
-
-
-def _safe_int(val: str | int | None) -> int | None:
-    if val is None or val == "":
-        return None
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
+def _pick(flat: pd.DataFrame, *names: str) -> pd.Series:
+    """First of ``names`` present in ``flat``, with later ones filling its gaps."""
+    result = pd.Series([None] * len(flat), index=flat.index, dtype=object)
+    for name in reversed(names):
+        if name in flat.columns:
+            result = flat[name].where(flat[name].notna(), result)
+    return result
+
+
+def _parse_school_votes(raw: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Split 'Penn St. (16)' into ('Penn St.', 16) for a whole column."""
+    raw = raw.astype(str).str.strip()
+    parts = raw.str.extract(r"^(?P<school>.*)\((?P<votes>[^()]*)\)$")
+    has_votes = parts["school"].notna()
+    school = parts["school"].str.strip().where(has_votes, raw)
+    votes = pd.to_numeric(parts["votes"].str.strip(), errors="coerce")
+    return school, votes
+
+
+def _parse_record(record: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Split '15-0' into (15, 0) for a whole column."""
+    parts = record.str.extract(r"^\s*(\d+)\s*-\s*(\d+)")
+    return pd.to_numeric(parts[0], errors="coerce"), pd.to_numeric(parts[1], errors="coerce")
 
 
 def _empty_team_rankings() -> pd.DataFrame:
-    return pd.DataFrame(columns=[
-        "rank", "school", "votes", "points",
-        "previous_rank", "record", "wins", "losses", "movement",
-    ])
+    return conform(pd.DataFrame(), TEAM_RANKINGS_SCHEMA)
@@ -1,10 +1,12 @@
 """Build a schedule DataFrame from scoreboard data across a date range."""
 
 from datetime import date, timedelta
+from functools import partial
 
 import pandas as pd
 
-from etl.transformers.scores import classify_game_state
+from etl.transformers.schemas import SCHEDULE_SCHEMA, conform
+from etl.transformers.scores import classify_game_states
 
 
 def build_schedule(games: list[dict]) -> pd.DataFrame:
@@ -16,37 +18,94 @@ def build_schedule(games: list[dict]) -> pd.DataFrame:
     if not games:
         return _empty_schedule()
 
-    rows = []
-    for game in games:
-        away = game.get("away", {})
-        home = game.get("home", {})
-        away_names = away.get("names", {})
-        home_names = home.get("names", {})
+    flat = pd.json_normalize(games)
+    col = partial(_column, flat)
+
+    df = pd.DataFrame({
+        "game_id": col("gameID"),
+        "date": col("_fetch_date"),
+        "start_time": col("startTime"),
+        "start_time_epoch": col("startTimeEpoch"),
+        "away_team": col("away.names.short"),
+        "away_rank": col("away.rank"),
+        "home_team": col("home.names.short"),
+        "home_rank": col("home.rank"),
+        "network": col("network"),
+        "location": "",  # Not in scoreboard API; enriched later if available
+        "status": classify_game_states(col("gameState").fillna("pre")),
+        "away_score": col("away.score"),
+        "home_score": col("home.score"),
+        "title": col("title"),
+        "url": col("url"),
+    })
+    df = conform(df, SCHEDULE_SCHEMA)
+    df = df.sort_values("date", kind="stable").reset_index(drop=True)
+    return df
+
+
+def merge_schedule(
+    existing: pd.DataFrame | None,
+    fresh: pd.DataFrame,
+    refreshed_dates: list[date],
+    start: date,
+    end: date,
+) -> pd.DataFrame:
+    """Merge freshly fetched schedule rows into an existing schedule.
+
+    Existing rows on ``refreshed_dates`` are dropped first so games that were
+    cancelled or moved disappear; the fresh rows are then upserted by
+    ``game_id`` and anything outside ``[start, end]`` falls out of the window.
+    """
+    frames = []
+    if existing is not None and not existing.empty:
+        old = existing.copy()
+        old["date"] = pd.to_datetime(old["date"], errors="coerce")
+        old = old[~old["date"].isin(pd.to_datetime(refreshed_dates))]
+        frames.append(old)
+    if not fresh.empty:
+        frames.append(fresh)
+    if not frames:
+        return _empty_schedule()
+
+    df = conform(pd.concat(frames, ignore_index=True), SCHEDULE_SCHEMA)
+    df = df.drop_duplicates(subset="game_id", keep="last")
+    in_window = (df["date"] >= pd.Timestamp(start)) & (df["date"] <= pd.Timestamp(end))
+    return df[in_window].sort_values("date", kind="stable").reset_index(drop=True)
 
-        state = game.get("gameState", "pre")
 
+def build_schedule_manifest(games_by_date: dict[date, list[dict]], fetched_at: str) -> pd.DataFrame:
+    """Summarize one fetch per date: when it happened and which game states it saw.
+
+    Returns a DataFrame with columns:
+        date, fetched_at, games, final_games, game_states
+    """
+    rows = []
+    for d, games in games_by_date.items():
+        states = [(g.get("gameState") or "pre").lower().strip() for g in games]
         rows.append({
-            "game_id": game.get("gameID", ""),
-            "date": game.get("_fetch_date", ""),
-            "start_time": game.get("startTime", ""),
-            "start_time_epoch": game.get("startTimeEpoch", ""),
-            "away_team": away_names.get("short", ""),
-            "away_rank": _safe_int(away.get("rank")),
-            "home_team": home_names.get("short", ""),
-            "home_rank": _safe_int(home.get("rank")),
-            "network": game.get("network", ""),
-            "location": "",  # Not in scoreboard API; enriched later if available
-            "status": classify_game_state(state),
-            "away_score": _safe_int(away.get("score")),
-            "home_score": _safe_int(home.get("score")),
-            "title": game.get("title", ""),
-            "url": game.get("url", ""),
+            "date": d.isoformat(),
+            "fetched_at": fetched_at,
+            "games": len(games),
+            "final_games": states.count("final"),
+            "game_states": ",".join(sorted(set(states))),
         })
+    return pd.DataFrame(rows, columns=_MANIFEST_COLUMNS)
 
-    df = pd.DataFrame(rows)
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df = df.sort_values("date").reset_index(drop=True)
-    return df
+
+def merge_schedule_manifest(
+    existing: pd.DataFrame | None,
+    fresh: pd.DataFrame,
+    start: date,
+    end: date,
+) -> pd.DataFrame:
+    """Upsert fresh manifest rows by date and drop dates outside the window."""
+    frames = [f for f in (existing, fresh) if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=_MANIFEST_COLUMNS)
+    df = pd.concat(frames, ignore_index=True)
+    df = df.drop_duplicates(subset="date", keep="last")
+    in_window = (df["date"] >= start.isoformat()) & (df["date"] <= end.isoformat())
+    return df[in_window].sort_values("date").reset_index(drop=True)
 
 
 def get_upcoming_schedule(schedule_df: pd.DataFrame) -> pd.DataFrame:
@@ -67,18 +126,14 @@ def get_recent_results(schedule_df: pd.DataFrame, days_back: int = 7) -> pd.Data
     return schedule_df[mask].sort_values("date", ascending=False).reset_index(drop=True)
 
 
-def _safe_int(val) -> int | None:
-    if val is None or val == "":
-        return None
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
+def _column(flat: pd.DataFrame, name: str) -> pd.Series:
+    if name in flat.columns:
+        return flat[name]
+    return pd.Series([None] * len(flat), index=flat.index, dtype=object)
+
+
+_MANIFEST_COLUMNS = ["date", "fetched_at", "games", "final_games", "game_states"]
 
 
 def _empty_schedule() -> pd.DataFrame:
-    return pd.DataFrame(columns=[
-        "game_id", "date", "start_time", "away_team", "away_rank",
-        "home_team", "home_rank", "network", "location", "status",
-        "away_score", "home_score", "title", "url",
-    ])
+    return conform(pd.DataFrame(), SCHEDULE_SCHEMA)
@@ -0,0 +1,313 @@
+"""Explicit Arrow schemas for the pinned DataFrames.
+
+Transformers finish by calling ``conform(df, SCHEMA)``, which orders the
+columns, adds any that are missing and casts each one to the pandas dtype
+matching its Arrow type. Parquet pins then get:
+
+- nullable small ints (``Int16``/``Int32``/``Int64``) instead of float/object
+  columns for ranks, scores and records,
+- dictionary-encoded categoricals for low-cardinality text (game state,
+  status, network, conference),
+- real timestamps for dates,
+
+which keeps pins small and makes reads in the app cheap and type-stable.
+"""
+
+import pandas as pd
+import pyarrow as pa
+
+_CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+
+def _team_fields(side: str) -> list[tuple[str, pa.DataType]]:
+    return [
+        (f"{side}_team", pa.string()),
+        (f"{side}_team_full", pa.string()),
+        (f"{side}_team_seo", pa.string()),
+        (f"{side}_score", pa.int16()),
+        (f"{side}_rank", pa.int16()),
+        (f"{side}_record", pa.string()),
+        (f"{side}_winner", pa.bool_()),
+        (f"{side}_conference", _CATEGORY),
+    ]
+
+
+SCOREBOARD_SCHEMA = pa.schema([
+    ("game_id", pa.string()),
+    ("game_state", _CATEGORY),
+    ("start_date", pa.timestamp("ms")),
+    ("start_time", pa.string()),
+    ("start_time_epoch", pa.int64()),
+    ("network", _CATEGORY),
+    ("final_message", pa.string()),
+    ("current_period", pa.string()),
+    ("contest_clock", pa.string()),
+    ("title", pa.string()),
+    ("url", pa.string()),
+    *_team_fields("away"),
+    *_team_fields("home"),
+])
+
+SCHEDULE_SCHEMA = pa.schema([
+    ("game_id", pa.string()),
+    ("date", pa.timestamp("ms")),
+    ("start_time", pa.string()),
+    ("start_time_epoch", pa.int64()),
+    ("away_team", pa.string()),
+    ("away_rank", pa.int16()),
+    ("home_team", pa.string()),
+    ("home_rank", pa.int16()),
+    ("network", _CATEGORY),
+    ("location", pa.string()),
+    ("status", _CATEGORY),
+    ("away_score", pa.int16()),
+    ("home_score", pa.int16()),
+    ("title", pa.string()),
+    ("url", pa.string()),
+])
+
+TEAM_RANKINGS_SCHEMA = pa.schema([
+    ("rank", pa.int16()),
+    ("school", pa.string()),
+    ("votes", pa.int16()),
+    ("points", pa.int32()),
+    ("previous_rank", pa.int16()),
+    ("record", pa.string()),
+    ("wins", pa.int16()),
+    ("losses", pa.int16()),
+    ("movement", pa.int16()),
+])
+
+# One row per (team, poll week), sorted by team_id then week so each team's
+# series is a contiguous run of rows. ``team_id`` is stable across versions.
+RANKINGS_HISTORY_SCHEMA = pa.schema([
+    ("team_id", pa.int16()),
+    ("school", _CATEGORY),
+    ("season", pa.int16()),
+    ("week", pa.timestamp("ms")),
+    ("rank", pa.int16()),
+    ("points", pa.int32()),
+    ("wins", pa.int16()),
+    ("losses", pa.int16()),
+])
+
+# Individual stats (etl/individual_rankings.py): ``rank`` is the overall
+# order, ``weight_rank`` the order within the wrestler's weight class. The same
+# schema is used for the per-class ``individual_rankings_{weight}`` pins.
+INDIVIDUAL_STATS_SCHEMA = pa.schema([
+    ("rank", pa.int16()),
+    ("weight_rank", pa.int16()),
+    ("weight_class", pa.int16()),
+    ("name", pa.string()),
+    ("team", pa.string()),
+    ("class_year", _CATEGORY),
+    ("wins", pa.int16()),
+    ("losses", pa.int16()),
+    ("win_pct", pa.float32()),
+    ("falls", pa.int16()),
+])
+
+# Global search: one row per team/wrestler with row pointers into the pins
+# written in the same run, and a prefix -> entity_ids postings table.
+SEARCH_INDEX_SCHEMA = pa.schema([
+    ("entity_id", pa.int32()),
+    ("kind", _CATEGORY),
+    ("key", pa.string()),
+    ("name", pa.string()),
+    ("team", pa.string()),
+    ("team_entity_id", pa.int32()),
+    ("weight_class", pa.int16()),
+    ("aliases", pa.string()),
+    ("rankings_row", pa.int32()),
+    ("standings_row", pa.int32()),
+    ("team_stats_row", pa.int32()),
+    ("individual_stats_row", pa.int32()),
+    ("schedule_rows", pa.list_(pa.int32())),
+])
+
+SEARCH_TERMS_SCHEMA = pa.schema([
+    ("term", pa.string()),
+    ("entity_ids", pa.list_(pa.int32())),
+])
+
+# Elo state: current rating per team, and the finals already applied (kept
+# only while they are inside the schedule window).
+ELO_RATINGS_SCHEMA = pa.schema([
+    ("team", pa.string()),
+    ("rating", pa.float64()),
+    ("season", pa.int16()),
+    ("games", pa.int16()),
+    ("wins", pa.int16()),
+    ("losses", pa.int16()),
+    ("ties", pa.int16()),
+    ("last_game", pa.timestamp("ms")),
+])
+
+ELO_LEDGER_SCHEMA = pa.schema([
+    ("game_id", pa.string()),
+    ("date", pa.timestamp("ms")),
+])
+
+# NCAA Championships brackets, one row per match (etl/brackets.py). ``*_from``
+# are the feeding match's ``match_index``; ``winner_to`` / ``loser_to`` are the
+# destination ``match_index * 2 + slot`` (slot 0 = top); -1 for none.
+BRACKETS_SCHEMA = pa.schema([
+    ("weight_class", pa.int16()),
+    ("match_index", pa.int16()),
+    ("match_id", pa.string()),
+    ("bout", pa.int32()),
+    ("round_code", _CATEGORY),
+    ("round", _CATEGORY),
+    ("place", pa.int8()),
+    *[
+        (f"{side}_{field}", arrow_type)
+        for side in ("top", "bottom")
+        for field, arrow_type in (
+            ("id", pa.string()), ("name", pa.string()), ("team", pa.string()),
+            ("seed", pa.int16()), ("from", pa.int16()),
+        )
+    ],
+    ("winner_slot", pa.int8()),
+    ("status", _CATEGORY),
+    ("decision", _CATEGORY),
+    ("result", pa.string()),
+    ("winner_to", pa.int32()),
+    ("loser_to", pa.int32()),
+])
+
+# NCAA Championships Monte Carlo results (etl/bracket_sim.py)
+BRACKET_SIM_WRESTLERS_SCHEMA = pa.schema([
+    ("weight_class", pa.int16()),
+    ("wrestler_id", pa.string()),
+    ("name", pa.string()),
+    ("team", pa.string()),
+    ("seed", pa.int16()),
+    *[(f"p_place_{p}", pa.float64()) for p in range(1, 9)],
+    ("p_all_american", pa.float64()),
+    ("expected_points", pa.float64()),
+])
+
+BRACKET_SIM_TEAMS_SCHEMA = pa.schema([
+    ("team", pa.string()),
+    ("p_title", pa.float64()),
+    ("expected_points", pa.float64()),
+    ("points_p10", pa.float64()),
+    ("points_median", pa.float64()),
+    ("points_p90", pa.float64()),
+])
+
+# Head-to-head adjacency index (etl/head_to_head.py): entities with the row
+# range of their results, and every result from both sides sorted by
+# (entity_id, opponent_id, date)
+H2H_ENTITIES_SCHEMA = pa.schema([
+    ("entity_id", pa.int32()),
+    ("kind", _CATEGORY),
+    ("key", pa.string()),
+    ("name", pa.string()),
+    ("team", pa.string()),
+    ("weight_class", pa.int16()),
+    ("wins", pa.int16()),
+    ("losses", pa.int16()),
+    ("ties", pa.int16()),
+    ("first_row", pa.int32()),
+    ("row_count", pa.int32()),
+])
+
+H2H_RESULTS_SCHEMA = pa.schema([
+    ("entity_id", pa.int32()),
+    ("opponent_id", pa.int32()),
+    ("date", pa.timestamp("ms")),
+    ("game_id", pa.string()),
+    ("outcome", _CATEGORY),
+    ("score_for", pa.int16()),
+    ("score_against", pa.int16()),
+    ("result", pa.string()),
+    ("weight_class", pa.int16()),
+])
+
+# NCAA Championships dates, cached from OpenTW (one row per tournament; etl/brackets.py)
+TOURNAMENT_SCHEMA = pa.schema([
+    ("tournament_type", pa.string()),
+    ("tournament_id", pa.string()),
+    ("start_date", pa.timestamp("ms")),
+    ("end_date", pa.timestamp("ms")),
+])
+
+# Live NCAA Championships team race (etl/team_scores.py)
+TEAM_SCORES_SCHEMA = pa.schema([
+    ("rank", pa.int16()),
+    ("team", pa.string()),
+    ("points", pa.float64()),
+    ("advancement_points", pa.float64()),
+    ("bonus_points", pa.float64()),
+    ("placement_points", pa.float64()),
+    ("max_possible", pa.float64()),
+    ("wrestlers_alive", pa.int16()),
+])
+
+BOUTS_SCHEMA = pa.schema([
+    ("game_id", pa.string()),
+    ("detail_status", _CATEGORY),
+    ("weight_class", pa.int16()),
+    ("bout_number", pa.int16()),
+    ("winner_side", _CATEGORY),
+    ("decision", _CATEGORY),
+    ("result", pa.string()),
+    ("team_points", pa.int16()),
+    ("away_wrestler", pa.string()),
+    ("away_wrestler_id", pa.string()),
+    ("away_team", pa.string()),
+    ("home_wrestler", pa.string()),
+    ("home_wrestler_id", pa.string()),
+    ("home_team", pa.string()),
+    ("away_team_score", pa.int16()),
+    ("home_team_score", pa.int16()),
+])
+
+# Standings carry whatever extra columns the API returns; only the known
+# ones are typed and the rest are passed through after them.
+STANDINGS_SCHEMA = pa.schema([
+    ("conference", _CATEGORY),
+    ("team", pa.string()),
+    ("conf_wins", pa.int16()),
+    ("conf_losses", pa.int16()),
+    ("overall_wins", pa.int16()),
+    ("overall_losses", pa.int16()),
+])
+
+
+def conform(df: pd.DataFrame, schema: pa.Schema) -> pd.DataFrame:
+    """Return ``df`` with the schema's columns first, each cast to its type.
+
+    Missing columns are added as all-null; columns not in the schema are kept,
+    unchanged, after the schema's columns.
+    """
+    typed = {}
+    for field in schema:
+        if field.name in df.columns:
+            col = df[field.name]
+        else:
+            col = pd.Series([None] * len(df), index=df.index, dtype=object)
+        typed[field.name] = _cast(col, field.type)
+    extras = [c for c in df.columns if c not in schema.names]
+    out = pd.DataFrame(typed, index=df.index)
+    if extras:
+        out = pd.concat([out, df[extras]], axis=1)
+    return out
+
+
+def _cast(col: pd.Series, arrow_type: pa.DataType) -> pd.Series:
+    if pa.types.is_integer(arrow_type):
+        nums = pd.to_numeric(col, errors="coerce").astype("Float64").round()
+        return nums.astype(f"Int{arrow_type.bit_width}")
+    if pa.types.is_floating(arrow_type):
+        return pd.to_numeric(col, errors="coerce").astype(f"float{arrow_type.bit_width}")
+    if pa.types.is_dictionary(arrow_type):
+        return col.astype("string").astype("category")
+    if pa.types.is_timestamp(arrow_type):
+        return pd.to_datetime(col, errors="coerce").astype(f"datetime64[{arrow_type.unit}]")
+    if pa.types.is_boolean(arrow_type):
+        return col.astype("boolean")
+    if pa.types.is_list(arrow_type):
+        return col.map(lambda v: [] if v is None or (not hasattr(v, "__len__") and pd.isna(v)) else list(v))
+    return col.fillna("").astype("string")
@@ -1,9 +1,11 @@
 """Transform raw NCAA API scoreboard data into clean DataFrames."""
 
-from datetime import datetime
+from functools import partial
 
 import pandas as pd
 
+from etl.transformers.schemas import SCOREBOARD_SCHEMA, conform
+
 
 def transform_scoreboard(raw: dict | None) -> pd.DataFrame:
     """Transform scoreboard JSON into a clean events/scores DataFrame.
@@ -37,49 +39,37 @@ def transform_scoreboard(raw: dict | None) -> pd.DataFrame:
     if not raw or "games" not in raw:
         return _empty_scoreboard()
 
-    rows = []
-    for entry in raw["games"]:
-        game = entry.get("game", entry)
-        away = game.get("away", {})
-        home = game.get("home", {})
-        away_names = away.get("names", {})
-        home_names = home.get("names", {})
-
-        row = {
-            "game_id": game.get("gameID", ""),
-            "game_state": game.get("gameState", ""),
-            "start_date": _parse_date(game.get("startDate", "")),
-            "start_time": game.get("startTime", ""),
-            "start_time_epoch": game.get("startTimeEpoch", ""),
-            "network": game.get("network", ""),
-            "final_message": game.get("finalMessage", ""),
-            "current_period": game.get("currentPeriod", ""),
-            "contest_clock": game.get("contestClock", ""),
-            "title": game.get("title", ""),
-            "url": game.get("url", ""),
-            # Away team
-            "away_team": away_names.get("short", ""),
-            "away_team_full": away_names.get("full", ""),
-            "away_team_seo": away_names.get("seo", ""),
-            "away_score": _safe_int(away.get("score", "")),
-            "away_rank": _safe_int(away.get("rank", "")),
-            "away_record": away.get("description", ""),
-            "away_winner": away.get("winner", False),
-            "away_conference": _get_conference(away),
-            # Home team
-            "home_team": home_names.get("short", ""),
-            "home_team_full": home_names.get("full", ""),
-            "home_team_seo": home_names.get("seo", ""),
-            "home_score": _safe_int(home.get("score", "")),
-            "home_rank": _safe_int(home.get("rank", "")),
-            "home_record": home.get("description", ""),
-            "home_winner": home.get("winner", False),
-            "home_conference": _get_conference(home),
-        }
-        rows.append(row)
+    games = [entry.get("game", entry) for entry in raw["games"]]
+    if not games:
+        return _empty_scoreboard()
 
-    df = pd.DataFrame(rows)
-    return df
+    flat = pd.json_normalize(games)
+    col = partial(_column, flat)
+
+    df = pd.DataFrame({
+        "game_id": col("gameID"),
+        "game_state": col("gameState"),
+        "start_date": pd.to_datetime(col("startDate"), format="%m-%d-%Y", errors="coerce"),
+        "start_time": col("startTime"),
+        "start_time_epoch": col("startTimeEpoch"),
+        "network": col("network"),
+        "final_message": col("finalMessage"),
+        "current_period": col("currentPeriod"),
+        "contest_clock": col("contestClock"),
+        "title": col("title"),
+        "url": col("url"),
+    })
+    for side in ("away", "home"):
+        df[f"{side}_team"] = col(f"{side}.names.short")
+        df[f"{side}_team_full"] = col(f"{side}.names.full")
+        df[f"{side}_team_seo"] = col(f"{side}.names.seo")
+        df[f"{side}_score"] = col(f"{side}.score")
+        df[f"{side}_rank"] = col(f"{side}.rank")
+        df[f"{side}_record"] = col(f"{side}.description")
+        df[f"{side}_winner"] = col(f"{side}.winner").fillna(False).astype(bool)
+        df[f"{side}_conference"] = _first_conference(col(f"{side}.conferences"))
+
+    return conform(df, SCOREBOARD_SCHEMA)
 
 
 def classify_game_state(state: str) -> str:
@@ -94,36 +84,26 @@ def classify_game_state(state: str) -> str:
     return state.title()
 
 
-def _parse_date(raw: str) -> str:
-    """Parse 'MM-DD-YYYY' into 'YYYY-MM-DD' ISO format."""
-    if not raw:
-        return ""
-    try:
-        dt = datetime.strptime(raw, "%m-%d-%Y")
-        return dt.strftime("%Y-%m-%d")
-    except ValueError:
-        return raw
+def classify_game_states(states: pd.Series) -> pd.Series:
+    """Vectorized ``classify_game_state`` over a column of raw game states."""
+    clean = states.astype("string").fillna("").str.lower().str.strip()
+    mapped = clean.map({"final": "Final", "live": "Live", "pre": "Upcoming", "": "Upcoming"})
+    return mapped.fillna(clean.str.title())
 
 
-def _get_conference(team_data: dict) -> str:
-    conferences = team_data.get("conferences", [])
-    if conferences:
-        return conferences[0].get("conferenceName", "")
-    return ""
+def _column(flat: pd.DataFrame, name: str) -> pd.Series:
+    """Column ``name`` of a json_normalize'd frame, or all-null if absent."""
+    if name in flat.columns:
+        return flat[name]
+    return pd.Series([None] * len(flat), index=flat.index, dtype=object)
 
 
-def _safe_int(val) -> int | None:
-    if val is None or val == "":
-        return None
-    try:
-        return int(val)
-    except (ValueError, TypeError):
-        return None
+def _first_conference(conferences: pd.Series) -> pd.Series:
+    """``conferenceName`` of the first entry in each row's conferences list."""
+    if conferences.dtype != object or conferences.isna().all():
+        return conferences
+    return conferences.str[0].str.get("conferenceName")
 
 
 def _empty_scoreboard() -> pd.DataFrame:
-    return pd.DataFrame(columns=[
-        "game_id", "game_state", "start_date", "start_time", "network",
-        "away_team", "away_score", "away_rank",
-        "home_team", "home_score", "home_rank",
-    ])
+    return conform(pd.DataFrame(), SCOREBOARD_SCHEMA)
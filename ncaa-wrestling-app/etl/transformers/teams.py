@@ -2,6 +2,8 @@
 
 import pandas as pd
 
+from etl.transformers.schemas import STANDINGS_SCHEMA, conform
+
 
 def transform_team_stats(raw_rows: list[dict]) -> pd.DataFrame:
     """Transform raw team stat rows into a clean DataFrame.
@@ -14,12 +16,15 @@ def transform_team_stats(raw_rows: list[dict]) -> pd.DataFrame:
     df = pd.DataFrame(raw_rows)
 
     # Normalize column names — NCAA API returns uppercase from HTML headers
+    lowered = {col.strip().lower() for col in df.columns}
+    # Individual stats have both a wrestler "Name" and a "Team" column
+    team_aliases = ("team", "school") if lowered & {"team", "school"} else ("team", "school", "name")
     col_map = {}
     for col in df.columns:
         lower = col.strip().lower()
         if lower in ("rank", "#"):
             col_map[col] = "rank"
-        elif lower in ("team", "school", "name"):
+        elif lower in team_aliases:
             col_map[col] = "team"
         elif lower in ("w", "wins"):
             col_map[col] = "wins"
@@ -73,20 +78,18 @@ def transform_standings(raw: dict | None) -> pd.DataFrame:
     if not raw or "data" not in raw:
         return _empty_standings()
 
-    rows = []
-    for conf_block in raw["data"]:
-        conference = conf_block.get("conference", "Unknown")
-        for team in conf_block.get("standings", []):
-            row = {"conference": conference}
-            for key, val in team.items():
-                clean_key = key.strip().lower().replace(" ", "_")
-                row[clean_key] = val
-            rows.append(row)
-
-    df = pd.DataFrame(rows)
+    blocks = [
+        {**block, "conference": block.get("conference", "Unknown"), "standings": block.get("standings", [])}
+        for block in raw["data"]
+    ]
+    df = pd.json_normalize(blocks, record_path="standings", meta=["conference"], meta_prefix="_block_")
     if df.empty:
         return _empty_standings()
 
+    df.columns = [c if c == "_block_conference" else c.strip().lower().replace(" ", "_") for c in df.columns]
+    block_conf = df.pop("_block_conference")
+    df["conference"] = df["conference"].fillna(block_conf) if "conference" in df.columns else block_conf
+
     # Rename common columns
     rename_map = {
         "school": "team",
@@ -100,12 +103,7 @@ def transform_standings(raw: dict | None) -> pd.DataFrame:
     }
     df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
 
-    # Convert numerics
-    for col in ["conf_wins", "conf_losses", "overall_wins", "overall_losses"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    return df
+    return conform(df, STANDINGS_SCHEMA)
 
 
 def transform_schools(raw_list: list[dict]) -> pd.DataFrame:
@@ -126,7 +124,4 @@ def _empty_team_stats() -> pd.DataFrame:
 
 
 def _empty_standings() -> pd.DataFrame:
-    return pd.DataFrame(columns=[
-        "conference", "team", "conf_wins", "conf_losses",
-        "overall_wins", "overall_losses",
-    ])
+    return conform(pd.DataFrame(), STANDINGS_SCHEMA)
@@ -0,0 +1,11 @@
+import pytest
+
+from etl.pin_writer import PinWriter
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    """A ``PinWriter`` on an empty local folder board."""
+    monkeypatch.delenv("CONNECT_SERVER", raising=False)
+    monkeypatch.setenv("NCAA_PINS_DIR", str(tmp_path / "board"))
+    return PinWriter()
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+from etl.brackets import BRACKETS_PIN, FINAL, PRE, brackets_from_frame, parse_bracket, refresh_brackets
+
+WRESTLERS = [
+    {"id": "w1", "name": "Alpha", "team": "Iowa", "seed": 1},
+    {"id": "w2", "name": "Bravo", "team": "Penn St.", "seed": 4},
+    {"id": "w3", "name": "Charlie", "team": "Ohio St.", "seed": 2},
+    {"id": "w4", "name": "Delta", "team": "Michigan", "seed": 3},
+]
+
+
+def four_man_bracket(results: dict[str, tuple[str, str]] | None = None) -> dict:
+    """Two semifinals feeding the final (winners) and 3rd place (losers).
+
+    ``results`` maps match id -> (winner id, decision) for the final matches.
+    """
+    matches = [
+        {"id": "m1", "round": "Semifinal", "boutNumber": 1, "topWrestlerId": "w1", "bottomWrestlerId": "w2",
+         "winnerTo": "m3", "loserTo": "m4"},
+        {"id": "m2", "round": "Semifinal", "boutNumber": 2, "topWrestlerId": "w3", "bottomWrestlerId": "w4",
+         "winnerTo": "m3", "loserTo": "m4"},
+        {"id": "m3", "round": "1st Place Match", "boutNumber": 3},
+        {"id": "m4", "round": "3rd Place Match", "boutNumber": 4},
+    ]
+    for m in matches:
+        winner, decision = (results or {}).get(m["id"], (None, None))
+        m.update(status="final" if winner else "pre", winnerId=winner, decision=decision,
+                 result=f"{decision} 5-2" if decision else None)
+    return {"weightClass": 125, "wrestlers": WRESTLERS, "matches": matches}
+
+
+SEMIS = {"m1": ("w1", "FALL"), "m2": ("w4", "MD")}
+ALL = {**SEMIS, "m3": ("w1", "DEC"), "m4": ("w2", "DEC")}
+
+
+def test_parse_assigns_rounds_and_entrants():
+    bracket = parse_bracket(four_man_bracket())
+
+    assert bracket.weight_class == 125
+    assert list(bracket.matches_in("sf")) == [bracket.position["m1"], bracket.position["m2"]]
+    assert list(bracket.matches_in("finals")) == [bracket.position["m3"]]
+    assert list(bracket.matches_in("cons")) == [bracket.position["m4"]]
+    assert (bracket.status == PRE).all()
+    final = bracket.position["m3"]
+    assert list(bracket.slots[final]) == [-1, -1]
+
+
+def test_apply_results_advances_winners_and_losers_once():
+    bracket = parse_bracket(four_man_bracket())
+
+    newly_final = bracket.apply_results(four_man_bracket(SEMIS))
+
+    assert sorted(newly_final) == sorted([bracket.position["m1"], bracket.position["m2"]])
+    names = lambda match: [bracket.wrestler_ids[i] for i in bracket.slots[bracket.position[match]]]
+    assert names("m3") == ["w1", "w4"]
+    assert names("m4") == ["w2", "w3"]
+    # Already-final matches are skipped on the next fetch
+    assert bracket.apply_results(four_man_bracket(SEMIS)) == []
+
+
+def test_incremental_results_match_a_fresh_parse():
+    bracket = parse_bracket(four_man_bracket())
+    bracket.apply_results(four_man_bracket(SEMIS))
+    bracket.apply_results(four_man_bracket(ALL))
+
+    pd.testing.assert_frame_equal(bracket.to_frame(), parse_bracket(four_man_bracket(ALL)).to_frame())
+
+
+@pytest.mark.parametrize("results", [{}, SEMIS, ALL])
+def test_frame_round_trip(results):
+    bracket = parse_bracket(four_man_bracket(results))
+
+    rebuilt = brackets_from_frame(bracket.to_frame())[125]
+
+    pd.testing.assert_frame_equal(rebuilt.to_frame(), bracket.to_frame())
+
+
+def test_refresh_brackets_round_trips_through_the_pin(writer):
+    (semis,) = refresh_brackets(writer, [four_man_bracket(SEMIS)])
+
+    published = brackets_from_frame(writer.read_pin(BRACKETS_PIN))[125]
+    pd.testing.assert_frame_equal(published.to_frame(), semis.to_frame())
+
+    # No previous state passed: the brackets are rebuilt from the pin, then updated
+    (bracket,) = refresh_brackets(writer, [four_man_bracket(ALL)])
+    assert (bracket.status == FINAL).all()
+    pd.testing.assert_frame_equal(bracket.to_frame(), parse_bracket(four_man_bracket(ALL)).to_frame())
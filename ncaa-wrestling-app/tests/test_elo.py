@@ -0,0 +1,54 @@
+import pandas as pd
+
+from etl.config import ELO
+from etl.elo import apply_finals
+
+
+def schedule(*games) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"game_id": g, "date": pd.Timestamp(d), "away_team": a, "home_team": h,
+          "away_score": sa, "home_score": sh, "status": status}
+         for g, d, a, h, sa, sh, status in games],
+    )
+
+
+GAMES = [
+    ("1", "2026-01-09", "Iowa", "Penn St.", 10, 25, "Final"),
+    ("2", "2026-01-10", "Ohio St.", "Iowa", 20, 14, "Final"),
+    ("3", "2026-01-11", "Penn St.", "Ohio St.", None, None, "Upcoming"),
+]
+
+
+def test_reapplying_the_same_schedule_changes_nothing():
+    ratings, ledger, applied = apply_finals(None, None, schedule(*GAMES))
+    assert applied == 2
+    assert ledger["game_id"].tolist() == ["1", "2"]
+
+    again, again_ledger, applied = apply_finals(ratings, ledger, schedule(*GAMES))
+
+    assert applied == 0
+    pd.testing.assert_frame_equal(again, ratings)
+    pd.testing.assert_frame_equal(again_ledger, ledger)
+
+
+def test_only_new_finals_are_applied():
+    ratings, ledger, _ = apply_finals(None, None, schedule(*GAMES[:2]))
+    finished = ("3", "2026-01-11", "Penn St.", "Ohio St.", 18, 18, "Final")
+
+    updated, ledger, applied = apply_finals(ratings, ledger, schedule(*GAMES[:2], finished))
+
+    assert applied == 1
+    assert ledger["game_id"].tolist() == ["1", "2", "3"]
+    records = updated.set_index("team")
+    assert records.loc["Iowa", "games"] == 2
+    assert records.loc["Penn St.", "ties"] == 1
+    # Incremental equals one pass over all three finals
+    replay, _, _ = apply_finals(None, None, schedule(*GAMES[:2], finished))
+    pd.testing.assert_frame_equal(updated, replay)
+
+
+def test_ratings_are_zero_sum_from_the_initial_rating():
+    ratings, _, _ = apply_finals(None, None, schedule(*GAMES))
+
+    assert abs(ratings["rating"].mean() - ELO["initial_rating"]) < 1e-9
+    assert ratings.set_index("team").loc["Penn St.", "rating"] > ELO["initial_rating"]
@@ -0,0 +1,80 @@
+import pandas as pd
+import pytest
+
+from etl import live_events
+from etl.live_events import EventLog
+from etl.notifications import Notifier, SubscriptionStore
+
+
+def events(*game_ids: str) -> pd.DataFrame:
+    return pd.DataFrame({"game_id": list(game_ids), "event": "new"})
+
+
+def test_append_assigns_consecutive_seqs_across_reopen(tmp_path):
+    log = EventLog(tmp_path)
+    assert log.append(events("1", "2")) == 2
+    assert log.append(pd.DataFrame(columns=["game_id", "event"])) == 2
+
+    reopened = EventLog(tmp_path)
+    assert reopened.last_seq == 2
+    assert reopened.append(events("3")) == 3
+    assert reopened.read()["seq"].tolist() == [1, 2, 3]
+
+
+def test_read_after_and_limit_across_segments(tmp_path, monkeypatch):
+    monkeypatch.setitem(live_events.LIVE_EVENTS, "segment_events", 2)
+    log = EventLog(tmp_path)
+    for game_id in "12345":
+        log.append(events(game_id))
+
+    assert len(log.segments()) == 3
+    assert log.read(after=2)["game_id"].tolist() == ["3", "4", "5"]
+    assert log.read(after=1, limit=2)["seq"].tolist() == [2, 3]
+    assert log.read(after=5).empty
+
+    assert log.prune(keep_segments=1) == 2
+    assert log.read()["seq"].tolist() == [5]
+
+
+def test_torn_last_line_is_skipped_and_a_new_segment_started(tmp_path):
+    log = EventLog(tmp_path)
+    log.append(events("1", "2"))
+    (_, path), = log.segments()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"game_id": "3", "event": "new", "se')  # a write cut short
+
+    reopened = EventLog(tmp_path)
+    assert reopened.last_seq == 2
+    assert reopened.append(events("3")) == 3
+    assert len(reopened.segments()) == 2
+    assert reopened.read()["game_id"].tolist() == ["1", "2", "3"]
+
+
+@pytest.fixture
+def notifier(tmp_path):
+    store = SubscriptionStore(tmp_path / "notifications.sqlite")
+    store.subscribe("fan", "team", "Iowa")
+    yield Notifier(store)
+    store.close()
+
+
+def started(game_id: str) -> pd.DataFrame:
+    return pd.DataFrame([{
+        "game_id": game_id, "event": "state", "old_state": "pre", "game_state": "live",
+        "away_team": "Iowa", "home_team": "Penn St.", "away_score": 0, "home_score": 0,
+    }])
+
+
+def test_consumer_cursor_starts_at_the_end_and_never_repeats(tmp_path, notifier):
+    log = EventLog(tmp_path / "events")
+    log.append(started("1"))
+
+    # First run: history isn't announced
+    assert notifier.consume(log) == 0
+    assert notifier.store.cursor("notifications") == 1
+
+    log.append(started("2"))
+    assert notifier.consume(log) == 1
+    assert notifier.consume(log) == 0
+    assert notifier.store.cursor("notifications") == 2
+    assert notifier.store.pending()["game_id"].tolist() == ["2"]
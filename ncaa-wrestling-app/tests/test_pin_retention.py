@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from etl.pin_retention import compact_live_scores, select_versions_to_delete
+from etl.pin_writer import _pin_name
+
+NOW = datetime(2026, 1, 20, 12, tzinfo=timezone.utc)
+
+
+def versions(*hours_ago: int, size: int = 10) -> pd.DataFrame:
+    """Versions ``v0, v1, ...`` created the given number of hours before ``NOW``."""
+    return pd.DataFrame({
+        "version": [f"v{i}" for i in range(len(hours_ago))],
+        "created": [NOW - timedelta(hours=h) for h in hours_ago],
+        "file_size": size,
+    })
+
+
+def test_keep_last_deletes_the_oldest():
+    doomed = select_versions_to_delete(versions(4, 0, 3, 1, 2), keep_last=2, now=NOW)
+
+    assert sorted(doomed) == ["v0", "v2", "v4"]
+
+
+def test_keep_daily_days_keeps_the_newest_of_each_recent_day():
+    # NOW is noon: hours 1-2 are today, 13-14 yesterday, 49 three days ago
+    doomed = select_versions_to_delete(versions(1, 2, 13, 14, 49), keep_last=1, keep_daily_days=2, now=NOW)
+
+    assert sorted(doomed) == ["v1", "v3", "v4"]
+
+
+def test_max_bytes_trims_the_oldest_but_never_the_newest():
+    history = versions(0, 1, 2, 3)
+
+    assert sorted(select_versions_to_delete(history, keep_last=4, max_bytes=25, now=NOW)) == ["v2", "v3"]
+    assert sorted(select_versions_to_delete(history, keep_last=4, max_bytes=0, now=NOW)) == ["v1", "v2", "v3"]
+
+
+def test_the_newest_version_is_never_deleted():
+    assert select_versions_to_delete(versions(3, 0, 5), now=NOW) == ["v0", "v2"]
+    assert select_versions_to_delete(versions()) == []
+
+
+def snapshot(state: str, away: int, home: int) -> pd.DataFrame:
+    return pd.DataFrame([{
+        "game_id": "1", "start_date": "2026-01-10", "game_state": state, "away_score": away, "home_score": home,
+    }])
+
+
+def test_compaction_is_incremental_and_adds_no_duplicate_rows(writer, monkeypatch):
+    name = _pin_name("live_scores")
+    created = datetime(2026, 1, 10, 19, tzinfo=timezone.utc)
+
+    def publish(minute: int, df: pd.DataFrame):
+        writer.board.pin_write(
+            df, name, type="parquet", created=created + timedelta(minutes=minute), force_identical_write=True,
+        )
+
+    publish(0, snapshot("live", 0, 0))
+    publish(1, snapshot("live", 0, 0))  # nothing changed
+    publish(2, snapshot("live", 3, 0))
+
+    read = []
+    pin_read = writer.board.pin_read
+    monkeypatch.setattr(writer.board, "pin_read", lambda *a, **kw: read.append(kw["version"]) or pin_read(*a, **kw))
+    minutes_read = lambda: [int(v[11:13]) for v in read]  # versions look like 20260110T190200Z-be828
+
+    assert compact_live_scores(writer) == 2
+    assert minutes_read() == [0, 1, 2]
+
+    # Nothing new since the last run: no versions read and no history written
+    read.clear()
+    assert compact_live_scores(writer) == 0
+    assert read == []
+
+    # Only the version created after ``compacted_through`` is folded in
+    publish(3, snapshot("final", 3, 0))
+    read.clear()
+    assert compact_live_scores(writer) == 3
+    assert minutes_read() == [3]
@@ -0,0 +1,107 @@
+from datetime import date, timedelta
+
+import pandas as pd
+
+from etl.schedule_refresh import MANIFEST_PIN, dates_to_refresh, refresh_schedule, schedule_window
+from etl.transformers.schedules import build_schedule, merge_schedule
+
+TODAY = date(2026, 1, 14)
+
+
+def manifest(*rows) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"date": d.isoformat(), "games": games, "final_games": finals} for d, games, finals in rows],
+    )
+
+
+def test_dates_to_refresh_selection_rules():
+    start, end = TODAY - timedelta(days=3), TODAY + timedelta(days=9)
+    settled_past = TODAY - timedelta(days=3)   # all final
+    stale_past = TODAY - timedelta(days=2)     # a game still not final
+    tomorrow = TODAY + timedelta(days=1)       # always refreshed
+    due_future = TODAY + timedelta(days=7)     # same weekly rotation slot as today
+    fresh_future = TODAY + timedelta(days=8)   # not due this week
+    known = manifest(
+        (settled_past, 4, 4), (stale_past, 3, 2), (TODAY, 2, 0), (tomorrow, 1, 0),
+        (due_future, 5, 0), (fresh_future, 5, 0),
+        *[(TODAY + timedelta(days=n), 0, 0) for n in (2, 3, 4, 5, 6)],
+    )
+
+    selected = dates_to_refresh(known, start, end, TODAY, always_refresh_days_ahead=1, future_refresh_every_days=7)
+
+    new_past = TODAY - timedelta(days=1)       # missing from the manifest
+    new_future = TODAY + timedelta(days=9)
+    assert selected == [stale_past, new_past, TODAY, tomorrow, due_future, new_future]
+
+
+def test_dates_to_refresh_without_manifest_is_the_whole_window():
+    start, end = TODAY - timedelta(days=2), TODAY + timedelta(days=2)
+    assert len(dates_to_refresh(None, start, end, TODAY)) == 5
+
+
+def game(game_id: str, day: date, away: str = "Iowa", home: str = "Penn St.", state: str = "final") -> dict:
+    return {
+        "gameID": game_id, "gameState": state, "_fetch_date": day.isoformat(), "startTime": "7:00PM ET",
+        "away": {"names": {"short": away}, "score": "10"}, "home": {"names": {"short": home}, "score": "20"},
+    }
+
+
+def test_merge_schedule_upserts_by_game_id_and_trims_the_window():
+    start, end = TODAY - timedelta(days=7), TODAY + timedelta(days=30)
+    old_day, moved_from, moved_to = start - timedelta(days=1), TODAY, TODAY + timedelta(days=2)
+    existing = build_schedule([
+        game("1", old_day),                         # fell out of the window
+        game("2", moved_from, state="pre"),         # moved to another day
+        game("3", moved_from, away="Ohio St."),     # cancelled on a refreshed day
+        game("4", TODAY - timedelta(days=3)),       # untouched date
+    ])
+    fresh = build_schedule([game("2", moved_to, home="Michigan", state="pre")])
+
+    merged = merge_schedule(existing, fresh, [moved_from, moved_to], start, end)
+
+    assert merged["game_id"].tolist() == ["4", "2"]
+    replaced = merged.set_index("game_id").loc["2"]
+    assert replaced["home_team"] == "Michigan"
+    assert replaced["date"] == pd.Timestamp(moved_to)
+
+
+class MemoryWriter:
+    def __init__(self):
+        self.pins: dict[str, pd.DataFrame] = {}
+
+    def read_pin(self, name):
+        return self.pins.get(name)
+
+    def write_pin(self, name, df):
+        self.pins[name] = df
+        return True
+
+
+class Client:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.requested: list[date] = []
+
+    def get_scoreboards(self, dates):
+        self.requested.extend(dates)
+        return {d: [game(str(d.toordinal()), d)] for d in dates if d not in self.failing}
+
+
+def test_failed_dates_keep_their_rows_and_are_retried_next_run():
+    writer = MemoryWriter()
+    refresh_schedule(Client(), writer, today=TODAY, incremental=True)
+    settled = TODAY - timedelta(days=3)   # all final: not normally refetched
+    assert settled not in dates_to_refresh(writer.pins[MANIFEST_PIN], *schedule_window(TODAY), TODAY)
+
+    # Force a refetch of the settled day that fails
+    writer.pins[MANIFEST_PIN] = writer.pins[MANIFEST_PIN].query("date != @settled.isoformat()")
+    refresh_schedule(Client(failing=[settled]), writer, today=TODAY, incremental=True)
+
+    schedule = writer.pins["schedule"]
+    assert (schedule["date"] == pd.Timestamp(settled)).sum() == 1
+    assert settled.isoformat() not in set(writer.pins[MANIFEST_PIN]["date"])
+
+    client = Client()
+    refresh_schedule(client, writer, today=TODAY, incremental=True)
+    assert settled in client.requested
+    assert settled.isoformat() in set(writer.pins[MANIFEST_PIN]["date"])
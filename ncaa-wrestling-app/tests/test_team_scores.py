@@ -0,0 +1,67 @@
+import pandas as pd
+
+from etl.brackets import parse_bracket
+from etl.team_scores import TeamScoreboard
+from tests.test_brackets import ALL, SEMIS, four_man_bracket
+
+
+def standings(scoreboard: TeamScoreboard, bracket) -> dict[str, dict]:
+    return scoreboard.frame([bracket]).set_index("team").to_dict("index")
+
+
+def test_totals_follow_advancement_bonus_and_placement():
+    bracket = parse_bracket(four_man_bracket(ALL))
+    scoreboard = TeamScoreboard()
+
+    assert scoreboard.apply(bracket) == 4
+    teams = standings(scoreboard, bracket)
+
+    # Iowa: semifinal win by fall (1 + 2), then 1st place (16)
+    assert teams["Iowa"]["advancement_points"] == 1.0
+    assert teams["Iowa"]["bonus_points"] == 2.0
+    assert teams["Iowa"]["placement_points"] == 16.0
+    assert teams["Iowa"]["points"] == 19.0
+    # Michigan: semifinal major (1 + 1), then 2nd (12)
+    assert teams["Michigan"]["points"] == 14.0
+    assert teams["Penn St."]["points"] == 10.0
+    assert teams["Ohio St."]["points"] == 9.0
+    assert [teams[t]["rank"] for t in ("Iowa", "Michigan", "Penn St.", "Ohio St.")] == [1, 2, 3, 4]
+
+
+def test_max_possible_is_winning_out_with_falls():
+    bracket = parse_bracket(four_man_bracket())
+    teams = standings(TeamScoreboard(), bracket)
+    # Semifinal (1 + 2) and the final (16 + 2)
+    assert teams["Iowa"]["max_possible"] == 21.0
+    assert teams["Iowa"]["wrestlers_alive"] == 1
+
+    bracket.apply_results(four_man_bracket(SEMIS))
+    scoreboard = TeamScoreboard()
+    scoreboard.apply(bracket)
+    teams = standings(scoreboard, bracket)
+    assert teams["Iowa"]["max_possible"] == 21.0
+    assert teams["Michigan"]["max_possible"] == 2.0 + 18.0
+    # Semifinal losers can still win 3rd place (10 + 2)
+    assert teams["Penn St."]["max_possible"] == 12.0
+
+    bracket.apply_results(four_man_bracket(ALL))
+    scoreboard.apply(bracket)
+    teams = standings(scoreboard, bracket)
+    assert all(t["max_possible"] == t["points"] for t in teams.values())
+    assert all(t["wrestlers_alive"] == 0 for t in teams.values())
+
+
+def test_incremental_totals_equal_a_fresh_rebuild():
+    bracket = parse_bracket(four_man_bracket())
+    incremental = TeamScoreboard()
+    incremental.apply(bracket)
+    for results in (SEMIS, ALL):
+        bracket.apply_results(four_man_bracket(results))
+        incremental.apply(bracket)
+    # Re-applying a bracket adds nothing
+    assert incremental.apply(bracket) == 0
+
+    fresh = TeamScoreboard()
+    fresh.apply(parse_bracket(four_man_bracket(ALL)))
+
+    pd.testing.assert_frame_equal(incremental.frame([bracket]), fresh.frame([bracket]))